@@ -8,24 +8,61 @@ Date: 2026-01-08
 
 import csv
 import os
+from array import array
 from datetime import datetime
 
+import perf_monitor
+from sample_dataset import (
+    COLUMN_TYPES, SampleDataset, file_stamp, get_sample_dataset, iter_csv_chunks
+)
+from sample_stats import group_statistics, streaming_statistics
+from sample_percentile import METRICS, find_group, get_sketches, percentile_rank
 
+
+@perf_monitor.instrument
 class DataManager:
     """
     건강 데이터를 CSV 파일로 관리하는 클래스
     
+    MEDICAL_PERF=1로 실행하면 공개 메서드마다 호출 시간과 입출력 양을 기록 (perf_monitor)
+    
     Attributes:
         user_file (str): 사용자 기록 파일 경로
         sample_file (str): 샘플 데이터 파일 경로
+        tombstone_file (str): 삭제 표시 파일 경로 (삭제된 기록 번호를 한 줄씩 기록)
+        streaming (bool): True이면 샘플 통계를 파일 전체를 올리지 않고 일정 행씩 읽으며 계산
+        workers (int): 샘플 CSV 파싱 작업 프로세스 수 (None이면 CPU 수, 작은 파일은 한 프로세스)
     """
     
-    def __init__(self, user_file="data/user_records.csv", sample_file="data/sample_data.csv"):
+    # 사용자 기록 CSV 컬럼 순서
+    CSV_HEADERS = [
+        "date", "name", "age", "gender", "height", "weight",
+        "ap_hi", "ap_lo", "cholesterol", "gluc",
+        "smoke", "alco", "active", "bmi", "risk_score"
+    ]
+    
+    def __init__(self, user_file="data/user_records.csv", sample_file="data/sample_data.csv",
+                 streaming=False, workers=None):
         """생성자: 파일 경로 설정"""
         # 실행 위치 기준 경로 설정
         self.base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.user_file = os.path.join(self.base_path, user_file)
         self.sample_file = os.path.join(self.base_path, sample_file)
+        self.tombstone_file = os.path.splitext(self.user_file)[0] + ".deleted"
+        self.streaming = streaming
+        self.workers = workers
+        
+        # 스트리밍 통계 캐시: 그룹 기준 → (파일 상태, 결과)
+        self._streaming_cache = {}
+        
+        # 백분위 분위수 표 캐시: (파일 상태, 분위수 표)
+        self._percentile_cache = (None, None)
+        
+        # 기록 수 캐시: (파일 크기, 수정 시각), 기록 수 (저장/정리할 때 직접 갱신)
+        self._row_count_cache = (None, 0)
+        
+        # 삭제 표시 캐시: (삭제 표시 파일 상태, 기록 번호 집합) (삭제할 때 직접 갱신)
+        self._tombstone_cache = (None, None)
         
         # 파일이 없으면 생성
         self._ensure_file_exists()
@@ -39,11 +76,7 @@ class DataManager:
             # 헤더 작성
             with open(self.user_file, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    "date", "name", "age", "gender", "height", "weight",
-                    "ap_hi", "ap_lo", "cholesterol", "gluc",
-                    "smoke", "alco", "active", "bmi", "risk_score"
-                ])
+                writer.writerow(self.CSV_HEADERS)
     
     def save_record(self, name, data_dict):
         """
@@ -59,6 +92,8 @@ class DataManager:
         try:
             # 현재 날짜 추가
             current_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+            size_before = perf_monitor.file_size(self.user_file)
+            stamp_before = self._stamp(self.user_file)
             
             with open(self.user_file, "a", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
@@ -79,6 +114,12 @@ class DataManager:
                     data_dict["bmi"],
                     data_dict["risk_score"]
                 ])
+            perf_monitor.wrote_file(self.user_file, 1, size_before)
+            
+            # 기록 수 캐시가 저장 직전 파일 기준이었으면 1 더함 (파일을 다시 세지 않음)
+            stamp, count = self._row_count_cache
+            if stamp is not None and stamp == stamp_before:
+                self._row_count_cache = (self._stamp(self.user_file), count + 1)
             return True
         except Exception as e:
             print(f"저장 오류: {e}")
@@ -86,17 +127,32 @@ class DataManager:
     
     def load_records(self):
         """
-        모든 사용자 기록 불러오기
+        모든 사용자 기록 불러오기 (삭제 표시된 기록 제외)
         
         Returns:
             list: 기록 딕셔너리 리스트
         """
+        return [record for _, record in self.iter_records()]
+    
+    def iter_records(self):
+        """
+        삭제되지 않은 기록을 기록 번호와 함께 반환
+        
+        기록 번호는 파일 내 행 순서(0부터)이며, 다른 기록이 삭제되어도 바뀌지 않음
+        (vacuum() 실행 시에만 다시 매겨짐)
+        
+        Returns:
+            list: [(기록 번호, 기록 딕셔너리)] 리스트
+        """
+        deleted = self._load_tombstones()
         records = []
         try:
             with open(self.user_file, "r", encoding="utf-8") as f:
                 reader = csv.DictReader(f)
-                for row in reader:
-                    records.append(row)
+                for index, row in enumerate(reader):
+                    if index not in deleted:
+                        records.append((index, row))
+            perf_monitor.read_file(self.user_file, len(records))
         except FileNotFoundError:
             pass
         except Exception as e:
@@ -104,147 +160,300 @@ class DataManager:
         
         return records
     
+    @staticmethod
+    def _stamp(path):
+        """파일 상태 (크기, 수정 시각), 파일이 없으면 None"""
+        try:
+            return file_stamp(path)
+        except OSError:
+            return None
+    
+    def _load_tombstones(self):
+        """
+        삭제 표시된 기록 번호 집합
+        
+        파일이 바뀌지 않았으면 메모리에 둔 집합을 그대로 반환 (호출한 쪽에서 수정하지 않음).
+        vacuum() 도중 종료되어 남은 파일이 있으면 먼저 복구
+        """
+        self._recover_vacuum()
+        stamp = self._stamp(self.tombstone_file)
+        cached_stamp, deleted = self._tombstone_cache
+        if deleted is not None and cached_stamp == stamp:
+            return deleted
+        
+        deleted = set()
+        try:
+            with open(self.tombstone_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line.isdigit():
+                        deleted.add(int(line))
+        except FileNotFoundError:
+            pass
+        self._tombstone_cache = (stamp, deleted)
+        return deleted
+    
+    def _recover_vacuum(self):
+        """
+        vacuum() 도중 종료된 경우 복구 (치워 둔 삭제 표시 파일(.old)이 남아 있을 때)
+        
+        임시 CSV가 남아 있으면 CSV를 교체하기 전에 종료된 것이므로 기록 번호가 그대로이고
+        삭제 표시를 되살림. 임시 CSV가 없으면 교체가 끝난 것이므로 치워 둔 파일만 삭제
+        """
+        old_path = self.tombstone_file + ".old"
+        if not os.path.exists(old_path):
+            return
+        tmp_path = self.user_file + ".tmp"
+        if os.path.exists(tmp_path):
+            with open(old_path, "r", encoding="utf-8") as src, \
+                    open(self.tombstone_file, "a", encoding="utf-8") as dst:
+                dst.write(src.read())
+            os.remove(tmp_path)
+        os.remove(old_path)
+    
+    def _row_count(self):
+        """파일의 전체 기록 수 (삭제 표시 포함, 파일이 다른 곳에서 바뀐 경우에만 다시 셈)"""
+        stamp = self._stamp(self.user_file)
+        if stamp is None:
+            return 0
+        if self._row_count_cache[0] != stamp:
+            with open(self.user_file, "r", encoding="utf-8") as f:
+                count = sum(1 for _ in csv.reader(f)) - 1
+            self._row_count_cache = (stamp, max(count, 0))
+        return self._row_count_cache[1]
+    
     def delete_record(self, index):
         """
         특정 기록 삭제
         
+        파일을 다시 쓰지 않고 삭제 표시 파일에 기록 번호만 추가.
+        기록 수와 삭제 표시는 메모리에 두고 갱신하므로 파일을 다시 읽지 않음.
+        실제 공간은 vacuum()으로 정리
+        
         Args:
-            index (int): 삭제할 레코드 인덱스 (0부터 시작)
+            index (int): 삭제할 기록 번호 (iter_records()의 번호, 0부터 시작)
         
         Returns:
             bool: 삭제 성공 여부
         """
         try:
-            records = self.load_records()
+            if not 0 <= index < self._row_count():
+                return False
+            deleted = self._load_tombstones()
+            if index in deleted:
+                return False
             
-            if 0 <= index < len(records):
-                del records[index]
-                
-                # 파일 다시 쓰기
-                with open(self.user_file, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    # 헤더 작성
-                    writer.writerow([
-                        "date", "name", "age", "gender", "height", "weight",
-                        "ap_hi", "ap_lo", "cholesterol", "gluc",
-                        "smoke", "alco", "active", "bmi", "risk_score"
-                    ])
-                    # 데이터 작성
-                    for record in records:
-                        writer.writerow(list(record.values()))
-                
-                return True
-            return False
+            size_before = perf_monitor.file_size(self.tombstone_file)
+            with open(self.tombstone_file, "a", encoding="utf-8") as f:
+                f.write(f"{index}\n")
+            perf_monitor.wrote_file(self.tombstone_file, 1, size_before)
+            deleted.add(index)
+            self._tombstone_cache = (self._stamp(self.tombstone_file), deleted)
+            return True
         except Exception as e:
             print(f"삭제 오류: {e}")
             return False
     
+    def pending_deletes(self):
+        """vacuum()으로 정리되지 않은 삭제 기록 수"""
+        return len(self._load_tombstones())
+    
+    def vacuum(self):
+        """
+        삭제 표시된 기록을 파일에서 제거 (기록 번호가 다시 매겨짐)
+        
+        Returns:
+            int: 제거한 기록 수 (실패 시 -1)
+        """
+        deleted = self._load_tombstones()
+        if not deleted:
+            return 0
+        
+        try:
+            records = self.iter_records()
+            tmp_path = self.user_file + ".tmp"
+            with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=self.CSV_HEADERS, extrasaction="ignore")
+                writer.writeheader()
+                for _, record in records:
+                    writer.writerow(record)
+            
+            # 삭제 표시를 먼저 치운 뒤 교체: 도중에 종료되어도 엉뚱한 행이 삭제되지 않고,
+            # 교체 전에 종료되었으면 다음 로드 때 _recover_vacuum()이 삭제 표시를 되살림
+            os.replace(self.tombstone_file, self.tombstone_file + ".old")
+            os.replace(tmp_path, self.user_file)
+            os.remove(self.tombstone_file + ".old")
+            perf_monitor.wrote_file(self.user_file, len(records))
+            
+            self._row_count_cache = (self._stamp(self.user_file), len(records))
+            self._tombstone_cache = (None, set())
+            return len(deleted)
+        except Exception as e:
+            print(f"정리 오류: {e}")
+            return -1
+    
+    def _get_sample_dataset(self):
+        """
+        컬럼 단위로 캐시된 샘플 데이터셋 반환
+        
+        파일 크기나 수정시각이 바뀐 경우에만 다시 읽음
+        
+        Returns:
+            SampleDataset or None: 로드 실패 시 None
+        """
+        try:
+            return get_sample_dataset(self.sample_file, self.workers)
+        except FileNotFoundError:
+            print("샘플 데이터 파일을 찾을 수 없습니다.")
+        except Exception as e:
+            print(f"샘플 데이터 로드 오류: {e}")
+        return None
+    
     def load_sample_data(self):
         """
         Kaggle 샘플 데이터 불러오기
         
+        형식이 잘못된 행이 있으면 (컬럼 캐시를 만들 수 없으므로) 그 행 앞까지 읽은 데이터를 반환
+        
         Returns:
             list: 샘플 데이터 딕셔너리 리스트
         """
-        samples = []
+        dataset = self._get_sample_dataset()
+        if dataset is None:
+            return self._load_sample_prefix()
+        return dataset.to_records()
+    
+    def _load_sample_prefix(self):
+        """
+        샘플 파일을 처음으로 형식 오류가 난 행 바로 앞까지 읽기 (오류 메시지는 이미 출력됨)
+        
+        Returns:
+            list: 읽은 행까지의 샘플 데이터 딕셔너리 리스트 (파일이 없으면 빈 리스트)
+        """
+        columns = {name: array(code) for name, code in COLUMN_TYPES.items()}
         try:
-            with open(self.sample_file, "r", encoding="utf-8") as f:
-                # 세미콜론 구분자 사용 (Kaggle 원본 형식)
-                reader = csv.DictReader(f, delimiter=";")
-                for row in reader:
-                    # 나이를 일(days)에서 년(years)으로 변환
-                    age_days = int(row.get("age", 0))
-                    age_years = age_days // 365
-                    
-                    # 성별 변환 (1: 여성, 2: 남성)
-                    gender = "여성" if row.get("gender") == "1" else "남성"
-                    
-                    samples.append({
-                        "id": row.get("id"),
-                        "age": age_years,
-                        "gender": gender,
-                        "height": int(row.get("height", 0)),
-                        "weight": float(row.get("weight", 0)),
-                        "ap_hi": int(row.get("ap_hi", 0)),
-                        "ap_lo": int(row.get("ap_lo", 0)),
-                        "cholesterol": int(row.get("cholesterol", 1)),
-                        "gluc": int(row.get("gluc", 1)),
-                        "smoke": int(row.get("smoke", 0)),
-                        "alco": int(row.get("alco", 0)),
-                        "active": int(row.get("active", 0)),
-                        "cardio": int(row.get("cardio", 0))
-                    })
+            # 한 행씩 변환해 오류가 난 행 직전까지의 행을 모두 남김
+            for chunk in iter_csv_chunks(self.sample_file, chunk_rows=1):
+                for name, values in chunk.items():
+                    columns[name].extend(values)
+        except (OSError, ValueError, TypeError, IndexError, csv.Error):
+            pass
+        return SampleDataset(columns).to_records()
+    
+    def get_grouped_statistics(self, by="gender"):
+        """
+        샘플 데이터 그룹별 통계 (한 번의 순회로 모든 그룹/지표 계산)
+        
+        계산 결과는 데이터셋에 캐시되어 파일이 바뀔 때까지 재사용됨
+        (스트리밍 모드에서는 파일을 일정 행씩 읽으며 누적값만 유지)
+        
+        Args:
+            by (str): 그룹 기준 컬럼명 (gender, cholesterol, cardio 등)
+        
+        Returns:
+            dict: {"groups": {그룹 라벨: 통계}, "total": 전체 통계} 또는 None
+        """
+        if self.streaming:
+            return self._get_streaming_statistics(by)
+        
+        dataset = self._get_sample_dataset()
+        
+        if dataset is None or not len(dataset):
+            return None
+        
+        key = ("group_statistics", by)
+        if key not in dataset.derived:
+            dataset.derived[key] = group_statistics(dataset.columns, by)
+        return dataset.derived[key]
+    
+    def _get_streaming_statistics(self, by):
+        """스트리밍 방식 그룹별 통계 (파일이 바뀔 때까지 결과 캐시)"""
+        try:
+            stamp = file_stamp(self.sample_file)
+            cached = self._streaming_cache.get(by)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, streaming_statistics(self.sample_file, by))
+                self._streaming_cache[by] = cached
         except FileNotFoundError:
             print("샘플 데이터 파일을 찾을 수 없습니다.")
+            return None
         except Exception as e:
             print(f"샘플 데이터 로드 오류: {e}")
+            return None
         
-        return samples
+        result = cached[1]
+        return result if result["total"] else None
     
-    def get_statistics(self, gender=None):
+    def get_percentile_sketches(self):
         """
-        샘플 데이터 기반 통계 계산 (성별 필터 지원)
+        성별 × 연령대별 분위수 표 (샘플 파일 옆 .percentiles.json)
         
-        Args:
-            gender (str, optional): "남성" 또는 "여성". None이면 전체 통계
+        샘플 파일이 바뀐 경우에만 다시 만들고, 만든 표는 파일로 저장하여
+        다음 실행 때도 재사용 (스트리밍 모드에서는 CSV를 일정 행씩 읽으며 생성)
         
         Returns:
-            dict: 통계 데이터
+            dict or None: 분위수 표 (로드 실패 시 None)
         """
-        samples = self.load_sample_data()
-        
-        if not samples:
+        try:
+            stamp = file_stamp(self.sample_file)
+            if self._percentile_cache[0] != stamp:
+                dataset = None if self.streaming else self._get_sample_dataset()
+                self._percentile_cache = (stamp, get_sketches(self.sample_file, stamp, dataset))
+        except FileNotFoundError:
+            print("샘플 데이터 파일을 찾을 수 없습니다.")
             return None
+        except Exception as e:
+            print(f"백분위 표 로드 오류: {e}")
+            return None
+        return self._percentile_cache[1]
+    
+    def get_percentile_ranks(self, user_data, gender):
+        """
+        사용자 지표의 같은 성별·연령대 샘플 내 백분위
         
-        # 성별 필터링
-        if gender:
-            samples = [s for s in samples if s["gender"] == gender]
+        Args:
+            user_data (dict): 사용자 건강 데이터 (age, bmi, height, weight, ap_hi, ap_lo)
+            gender (str): "남성" 또는 "여성"
         
-        if not samples:
+        Returns:
+            dict: {"group": 비교 그룹 라벨, "count": 샘플 수, 지표: 백분위(0~100), ...} 또는 None
+        """
+        sketches = self.get_percentile_sketches()
+        if not sketches:
             return None
         
-        total = len(samples)
+        label, group = find_group(sketches, gender, user_data.get("age"))
+        if group is None:
+            return None
         
-        # 평균 계산
-        avg_age = sum(s["age"] for s in samples) / total
-        avg_height = sum(s["height"] for s in samples) / total
-        avg_weight = sum(s["weight"] for s in samples) / total
-        avg_ap_hi = sum(s["ap_hi"] for s in samples) / total
-        avg_ap_lo = sum(s["ap_lo"] for s in samples) / total
+        ranks = {"group": label, "count": group["count"]}
+        for metric in METRICS:
+            value = user_data.get(metric)
+            if value is not None:
+                ranks[metric] = percentile_rank(group["quantiles"][metric], value)
+        return ranks
+    
+    def get_statistics(self, gender=None):
+        """
+        샘플 데이터 기반 통계 계산 (성별 필터 지원)
         
-        # BMI 계산
-        bmi_list = []
-        for s in samples:
-            if s["height"] > 0:
-                bmi = s["weight"] / ((s["height"] / 100) ** 2)
-                bmi_list.append(bmi)
-        avg_bmi = sum(bmi_list) / len(bmi_list) if bmi_list else 0
+        Args:
+            gender (str, optional): "남성" 또는 "여성". None이면 전체 통계
         
-        # 심혈관 질환 비율
-        cardio_count = sum(1 for s in samples if s["cardio"] == 1)
-        cardio_rate = (cardio_count / total) * 100
+        Returns:
+            dict: 통계 데이터
+        """
+        grouped = self.get_grouped_statistics("gender")
         
-        # 흡연자 비율
-        smoke_count = sum(1 for s in samples if s["smoke"] == 1)
-        smoke_rate = (smoke_count / total) * 100
+        if not grouped:
+            return None
         
-        # 고콜레스테롤 비율
-        high_chol_count = sum(1 for s in samples if s["cholesterol"] >= 2)
-        high_chol_rate = (high_chol_count / total) * 100
+        if gender:
+            stats = grouped["groups"].get(gender)
+        else:
+            stats = grouped["total"]
         
-        return {
-            "gender": gender if gender else "전체",
-            "total_samples": total,
-            "avg_age": round(avg_age, 1),
-            "avg_height": round(avg_height, 1),
-            "avg_weight": round(avg_weight, 1),
-            "avg_bmi": round(avg_bmi, 1),
-            "avg_ap_hi": round(avg_ap_hi, 1),
-            "avg_ap_lo": round(avg_ap_lo, 1),
-            "cardio_rate": round(cardio_rate, 1),
-            "smoke_rate": round(smoke_rate, 1),
-            "high_chol_rate": round(high_chol_rate, 1)
-        }
+        return dict(stats) if stats else None
     
     def get_gender_statistics(self):
         """
@@ -376,6 +585,15 @@ class DataManager:
         # 심혈관 질환 비율 정보
         comparison["cardio_rate"] = stats["cardio_rate"]
         
+        # 같은 성별·연령대 샘플 내 백분위
+        ranks = self.get_percentile_ranks(user_data, gender)
+        if ranks:
+            comparison["percentile_group"] = ranks["group"]
+            comparison["percentile_count"] = ranks["count"]
+            for metric in METRICS:
+                if metric in comparison and ranks.get(metric) is not None:
+                    comparison[metric]["percentile"] = ranks[metric]
+        
         return comparison
 
 
@@ -422,7 +640,7 @@ if __name__ == "__main__":
         print("   저장 성공!")
     
     # 기록 불러오기
-    records = dm.load_records()
+    records = dm.iter_records()
     print(f"\n📋 저장된 기록: {len(records)}건")
-    for i, record in enumerate(records):
+    for i, record in records:
         print(f"   [{i}] {record.get('date')} - {record.get('name')}")
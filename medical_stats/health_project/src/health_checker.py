@@ -6,6 +6,9 @@ Author: KDT12 Python Project
 Date: 2026-01-08
 """
 
+from array import array
+from bisect import bisect_left, bisect_right
+
 
 class HealthChecker:
     """
@@ -25,6 +28,49 @@ class HealthChecker:
         active (int): 신체활동 여부 (0: 비활동, 1: 활동)
     """
     
+    # BMI 판정 구간 (WHO 아시아-태평양 기준, 상한 미만이면 해당 단계)
+    BMI_LIMITS = (18.5, 23, 25, 30)
+    BMI_LEVELS = (
+        ("저체중", "#3498db"),
+        ("정상", "#2ecc71"),
+        ("과체중", "#f39c12"),
+        ("비만", "#e74c3c"),
+        ("고도비만", "#8e44ad")
+    )
+    BMI_UNMEASURABLE = (0, "측정 불가", "#95a5a6")
+    
+    # 혈압 분류 (_blood_pressure의 판정 순서)
+    BP_LEVELS = (
+        ("저혈압", "혈압이 낮습니다. 어지러움에 주의하세요.", "#3498db"),
+        ("정상", "정상 혈압입니다. 현재 상태를 유지하세요.", "#2ecc71"),
+        ("주의", "혈압이 약간 높습니다. 생활습관 개선이 필요합니다.", "#f1c40f"),
+        ("고혈압 전단계", "고혈압 위험이 있습니다. 관리가 필요합니다.", "#f39c12"),
+        ("1기 고혈압", "고혈압입니다. 전문가 상담을 권장합니다.", "#e74c3c"),
+        ("2기 고혈압", "심한 고혈압입니다. 즉시 치료가 필요합니다.", "#8e44ad")
+    )
+    
+    # 위험도 배점 (나이/BMI는 구간 하한 이상이면 해당 점수, BMI는 반올림한 값 기준)
+    AGE_LIMITS = (40, 50, 60)
+    AGE_POINTS = (0, 10, 15, 20)
+    BMI_POINTS = (0, 0, 5, 15, 20)          # BMI_LIMITS 구간별
+    BP_POINTS = {"주의": 5, "고혈압 전단계": 10, "1기 고혈압": 15, "2기 고혈압": 25}
+    CHOLESTEROL_POINTS = {2: 10, 3: 20}
+    GLUC_POINTS = {2: 10, 3: 15}
+    SMOKE_POINTS = 15
+    ALCO_POINTS = 5
+    INACTIVE_POINTS = 10
+    
+    # 위험도 등급 구간 (점수 상한 이하이면 해당 등급)
+    RISK_GRADE_LIMITS = (20, 40, 60, 80)
+    RISK_LEVELS = (
+        ("낮음", "건강한 상태입니다. 현재 생활습관을 유지하세요.", "#2ecc71"),
+        ("보통", "주의가 필요합니다. 정기적인 건강검진을 권장합니다.", "#f1c40f"),
+        ("높음", "관리가 필요합니다. 생활습관 개선이 필요합니다.", "#f39c12"),
+        ("매우 높음", "전문가 상담을 권장합니다. 적극적인 관리가 필요합니다.", "#e74c3c"),
+        ("위험", "즉각적인 조치가 필요합니다. 의사와 상담하세요.", "#8e44ad")
+    )
+    RISK_GRADES = tuple(level[0] for level in RISK_LEVELS)
+    
     def __init__(self, age=30, gender="남성", height=170, weight=65,
                  ap_hi=120, ap_lo=80, cholesterol=1, gluc=1,
                  smoke=0, alco=0, active=1):
@@ -48,23 +94,7 @@ class HealthChecker:
         Returns:
             tuple: (BMI 값, 판정 결과, 색상 코드)
         """
-        if self.height <= 0 or self.weight <= 0:
-            return (0, "측정 불가", "#95a5a6")
-        
-        height_m = self.height / 100
-        bmi = self.weight / (height_m ** 2)
-        
-        # WHO 아시아-태평양 기준
-        if bmi < 18.5:
-            return (round(bmi, 1), "저체중", "#3498db")
-        elif bmi < 23:
-            return (round(bmi, 1), "정상", "#2ecc71")
-        elif bmi < 25:
-            return (round(bmi, 1), "과체중", "#f39c12")
-        elif bmi < 30:
-            return (round(bmi, 1), "비만", "#e74c3c")
-        else:
-            return (round(bmi, 1), "고도비만", "#8e44ad")
+        return self._bmi(self.height, self.weight)
     
     def analyze_blood_pressure(self):
         """
@@ -73,21 +103,7 @@ class HealthChecker:
         Returns:
             tuple: (분류, 설명, 색상 코드)
         """
-        systolic = self.ap_hi
-        diastolic = self.ap_lo
-        
-        if systolic < 90 or diastolic < 60:
-            return ("저혈압", "혈압이 낮습니다. 어지러움에 주의하세요.", "#3498db")
-        elif systolic < 120 and diastolic < 80:
-            return ("정상", "정상 혈압입니다. 현재 상태를 유지하세요.", "#2ecc71")
-        elif systolic < 130 and diastolic < 80:
-            return ("주의", "혈압이 약간 높습니다. 생활습관 개선이 필요합니다.", "#f1c40f")
-        elif systolic < 140 or diastolic < 90:
-            return ("고혈압 전단계", "고혈압 위험이 있습니다. 관리가 필요합니다.", "#f39c12")
-        elif systolic < 160 or diastolic < 100:
-            return ("1기 고혈압", "고혈압입니다. 전문가 상담을 권장합니다.", "#e74c3c")
-        else:
-            return ("2기 고혈압", "심한 고혈압입니다. 즉시 치료가 필요합니다.", "#8e44ad")
+        return self._blood_pressure(self.ap_hi, self.ap_lo)
     
     def calculate_risk_score(self):
         """
@@ -96,67 +112,60 @@ class HealthChecker:
         Returns:
             tuple: (점수, 등급, 설명, 색상 코드)
         """
-        score = 0
-        
-        # 나이에 따른 점수
-        if self.age >= 60:
-            score += 20
-        elif self.age >= 50:
-            score += 15
-        elif self.age >= 40:
-            score += 10
-        
-        # BMI에 따른 점수
         bmi_value, _, _ = self.calculate_bmi()
-        if bmi_value >= 30:
-            score += 20
-        elif bmi_value >= 25:
-            score += 15
-        elif bmi_value >= 23:
-            score += 5
-        
-        # 혈압에 따른 점수
         bp_status, _, _ = self.analyze_blood_pressure()
-        if bp_status == "2기 고혈압":
-            score += 25
-        elif bp_status == "1기 고혈압":
-            score += 15
-        elif bp_status == "고혈압 전단계":
-            score += 10
-        elif bp_status == "주의":
-            score += 5
-        
-        # 콜레스테롤에 따른 점수
-        if self.cholesterol == 3:
-            score += 20
-        elif self.cholesterol == 2:
-            score += 10
-        
-        # 혈당에 따른 점수
-        if self.gluc == 3:
-            score += 15
-        elif self.gluc == 2:
-            score += 10
-        
-        # 생활습관에 따른 점수
-        if self.smoke == 1:
-            score += 15
-        if self.alco == 1:
-            score += 5
-        if self.active == 0:
-            score += 10
-        
-        # 등급 판정
-        if score <= 20:
-            return (score, "낮음", "건강한 상태입니다. 현재 생활습관을 유지하세요.", "#2ecc71")
-        elif score <= 40:
-            return (score, "보통", "주의가 필요합니다. 정기적인 건강검진을 권장합니다.", "#f1c40f")
-        elif score <= 60:
-            return (score, "높음", "관리가 필요합니다. 생활습관 개선이 필요합니다.", "#f39c12")
-        elif score <= 80:
-            return (score, "매우 높음", "전문가 상담을 권장합니다. 적극적인 관리가 필요합니다.", "#e74c3c")
+        score = self._risk_score(self.age, bmi_value, bp_status, self.cholesterol,
+                                 self.gluc, self.smoke, self.alco, self.active)
+        return (score,) + self._risk_level(score)
+    
+    # ==================== 판정 기준 (개별 메서드와 score_batch 공용) ====================
+    
+    @classmethod
+    def _bmi(cls, height, weight):
+        """키/몸무게 → (BMI 값, 판정 결과, 색상 코드)"""
+        if height <= 0 or weight <= 0:
+            return cls.BMI_UNMEASURABLE
+        bmi = weight / ((height / 100) ** 2)
+        status, color = cls.BMI_LEVELS[bisect_right(cls.BMI_LIMITS, bmi)]
+        return (round(bmi, 1), status, color)
+    
+    @classmethod
+    def _blood_pressure(cls, ap_hi, ap_lo):
+        """수축기/이완기 혈압 → (분류, 설명, 색상 코드)"""
+        if ap_hi < 90 or ap_lo < 60:
+            level = 0
+        elif ap_hi < 120 and ap_lo < 80:
+            level = 1
+        elif ap_hi < 130 and ap_lo < 80:
+            level = 2
+        elif ap_hi < 140 or ap_lo < 90:
+            level = 3
+        elif ap_hi < 160 or ap_lo < 100:
+            level = 4
         else:
-            return (score, "위험", "즉각적인 조치가 필요합니다. 의사와 상담하세요.", "#8e44ad")
+            level = 5
+        return cls.BP_LEVELS[level]
+    
+    @classmethod
+    def _risk_score(cls, age, bmi, bp_status, cholesterol, gluc, smoke, alco, active):
+        """위험 요인 → 심혈관 위험도 점수 (bmi는 반올림한 BMI 값)"""
+        score = cls.AGE_POINTS[bisect_right(cls.AGE_LIMITS, age)]
+        score += cls.BMI_POINTS[bisect_right(cls.BMI_LIMITS, bmi)]
+        score += cls.BP_POINTS.get(bp_status, 0)
+        score += cls.CHOLESTEROL_POINTS.get(cholesterol, 0)
+        score += cls.GLUC_POINTS.get(gluc, 0)
+        if smoke == 1:
+            score += cls.SMOKE_POINTS
+        if alco == 1:
+            score += cls.ALCO_POINTS
+        if active == 0:
+            score += cls.INACTIVE_POINTS
+        return score
+    
+    @classmethod
+    def _risk_level(cls, score):
+        """위험도 점수 → (등급, 설명, 색상 코드)"""
+        return cls.RISK_LEVELS[bisect_left(cls.RISK_GRADE_LIMITS, score)]
     
     def get_health_advice(self):
         """
@@ -203,6 +212,61 @@ class HealthChecker:
         
         return advice_list
     
+    @classmethod
+    def score_batch(cls, columns):
+        """
+        여러 명의 BMI/혈압/위험도를 한 번에 계산 (컬럼 단위 일괄 처리)
+        
+        HealthChecker 객체를 만들지 않고 컬럼 배열을 그대로 순회하며,
+        calculate_bmi / analyze_blood_pressure / calculate_risk_score와 같은 판정 함수(_bmi 등)를 사용
+        
+        Args:
+            columns (dict or SampleDataset): 컬럼명 → 시퀀스
+                (age, height, weight, ap_hi, ap_lo, cholesterol, gluc, smoke, alco, active)
+        
+        Returns:
+            dict: {"bmi": array, "bmi_status": list, "bp_status": list,
+                   "risk_score": array, "risk_grade": list}
+        """
+        if hasattr(columns, "columns"):
+            columns = columns.columns
+        
+        bmi_out = array("d")
+        bmi_status_out = []
+        bp_out = []
+        score_out = array("h")
+        grade_out = []
+        
+        rows = zip(
+            columns["age"], columns["height"], columns["weight"],
+            columns["ap_hi"], columns["ap_lo"],
+            columns["cholesterol"], columns["gluc"],
+            columns["smoke"], columns["alco"], columns["active"]
+        )
+        bmi_of = cls._bmi
+        bp_of = cls._blood_pressure
+        risk_score = cls._risk_score
+        grade_limits = cls.RISK_GRADE_LIMITS
+        grades = cls.RISK_GRADES
+        for age, height, weight, ap_hi, ap_lo, chol, gluc, smoke, alco, active in rows:
+            bmi, bmi_status, _ = bmi_of(height, weight)
+            bp_status = bp_of(ap_hi, ap_lo)[0]
+            score = risk_score(age, bmi, bp_status, chol, gluc, smoke, alco, active)
+            
+            bmi_out.append(bmi)
+            bmi_status_out.append(bmi_status)
+            bp_out.append(bp_status)
+            score_out.append(score)
+            grade_out.append(grades[bisect_left(grade_limits, score)])
+        
+        return {
+            "bmi": bmi_out,
+            "bmi_status": bmi_status_out,
+            "bp_status": bp_out,
+            "risk_score": score_out,
+            "risk_grade": grade_out
+        }
+    
     def to_dict(self):
         """
         객체를 딕셔너리로 변환
@@ -0,0 +1,98 @@
+"""
+load_benchmark.py
+샘플 CSV 병렬 로드(read_csv_columns) 결과 일치 검사 및 속도 비교
+
+CSV 경로를 주지 않으면 sample_data.csv 행을 반복해 --rows행짜리 임시 파일을 만들어 측정
+
+사용법:
+    python load_benchmark.py [CSV 경로] [--rows 1000000] [--workers 2 4] [--repeat 3]
+
+Author: KDT12 Python Project
+Date: 2026-01-08
+데이터 출처: Kaggle - Cardiovascular Disease Dataset
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from sample_dataset import COLUMN_TYPES, read_csv_columns
+
+
+def write_repeated(src_path, out_path, rows):
+    """src_path의 데이터 행을 id만 바꿔 반복해 rows행짜리 CSV 작성"""
+    with open(src_path, "r", encoding="utf-8") as f:
+        header = f.readline()
+        lines = [line.rstrip("\n").split(";", 1)[1] for line in f if line.strip()]
+
+    with open(out_path, "w", encoding="utf-8", newline="") as f:
+        f.write(header)
+        for i in range(rows):
+            f.write(f"{i};{lines[i % len(lines)]}\n")
+
+
+def best_time(csv_path, workers, repeat):
+    """
+    repeat번 읽기 중 가장 짧은 시간
+
+    Returns:
+        tuple: (시간(초), 컬럼 데이터)
+    """
+    best, columns = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        columns = read_csv_columns(csv_path, workers, min_bytes=0)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, columns
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="샘플 CSV 병렬 로드 속도 비교")
+    parser.add_argument("csv", nargs="?", default=None, help="측정할 CSV (없으면 임시 파일 생성)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="임시 파일 행 수")
+    parser.add_argument("--workers", type=int, nargs="+", default=None, help="비교할 작업 프로세스 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args(argv)
+
+    cpus = os.cpu_count() or 1
+    workers_list = args.workers or sorted({2, 4, cpus} - {1})
+
+    work_dir = None
+    csv_path = args.csv
+    if csv_path is None:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        work_dir = tempfile.mkdtemp(prefix="load_benchmark_")
+        csv_path = os.path.join(work_dir, "sample_large.csv")
+        write_repeated(os.path.join(base_path, "data", "sample_data.csv"), csv_path, args.rows)
+
+    try:
+        size_mb = os.path.getsize(csv_path) / 1024 / 1024
+        serial, expected = best_time(csv_path, 1, args.repeat)
+        rows = len(expected["id"])
+
+        print("=" * 50)
+        print(f"샘플 CSV 로드 비교: {rows:,}행 ({size_mb:.1f}MB, CPU {cpus}개, 최소 {args.repeat}회 기준)")
+        print("=" * 50)
+        print(f"   한 프로세스:      {serial * 1000:>8.1f}ms")
+
+        for workers in workers_list:
+            elapsed, columns = best_time(csv_path, workers, args.repeat)
+            for name in COLUMN_TYPES:
+                if columns[name] != expected[name]:
+                    print(f"❌ 작업 프로세스 {workers}개: '{name}' 컬럼 값이 다릅니다.")
+                    return 1
+            print(f"   작업 프로세스 {workers}개: {elapsed * 1000:>8.1f}ms  ({serial / elapsed:.1f}배)")
+        print("✅ 모든 결과가 한 프로세스로 읽은 값과 일치")
+    finally:
+        if work_dir is not None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
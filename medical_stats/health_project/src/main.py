@@ -17,6 +17,7 @@ from tkinter import *
 from tkinter import ttk, messagebox
 from health_checker import HealthChecker
 from data_manager import DataManager
+import perf_monitor
 
 
 class HealthCheckApp:
@@ -341,6 +342,7 @@ class HealthCheckApp:
             ("💾 기록 저장", self.save_record, self.colors["success"]),
             ("📋 기록 조회", self.show_history, self.colors["primary"]),
             ("📊 통계 보기", self.show_statistics, self.colors["warning"]),
+            ("📈 성능 통계", self.show_perf_stats, self.colors["dark"]),
             ("🔄 초기화", self.reset, "#95a5a6")
         ]
         
@@ -394,6 +396,11 @@ class HealthCheckApp:
             messagebox.showerror("입력 오류", f"올바른 값을 입력하세요.\n{e}")
             return False
     
+    def percentile_text(self, comp):
+        """비교 항목의 백분위 표시 문자열 (백분위가 없으면 빈 문자열)"""
+        percentile = comp.get("percentile")
+        return f" · 백분위 {percentile}" if percentile is not None else ""
+    
     def analyze(self):
         """건강 분석 실행"""
         if not self.validate_inputs():
@@ -438,26 +445,29 @@ class HealthCheckApp:
         comparison = self.data_manager.compare_with_gender_average(user_data, gender)
         
         if comparison:
-            comparison_text = f"📊 {gender} 평균 대비 (샘플 {comparison['sample_count']}명)\n\n"
+            comparison_text = f"📊 {gender} 평균 대비 (샘플 {comparison['sample_count']}명)\n"
+            if comparison.get("percentile_group"):
+                comparison_text += f"   백분위 기준: {comparison['percentile_group']} (샘플 {comparison['percentile_count']}명)\n"
+            comparison_text += "\n"
             
             # BMI 비교
             bmi_comp = comparison["bmi"]
             bmi_icon = "🔴" if bmi_comp["status"] == "higher" and bmi_comp["diff"] > 2 else "🟢" if bmi_comp["status"] == "lower" else "🟡"
-            comparison_text += f"{bmi_icon} BMI: {bmi_comp['user']} (평균 {bmi_comp['avg']}) → {bmi_comp['text']}\n"
+            comparison_text += f"{bmi_icon} BMI: {bmi_comp['user']} (평균 {bmi_comp['avg']}) → {bmi_comp['text']}{self.percentile_text(bmi_comp)}\n"
             
             # 키 비교
             height_comp = comparison["height"]
-            comparison_text += f"📏 키: {height_comp['user']}cm (평균 {height_comp['avg']}cm) → {height_comp['text']}\n"
+            comparison_text += f"📏 키: {height_comp['user']}cm (평균 {height_comp['avg']}cm) → {height_comp['text']}{self.percentile_text(height_comp)}\n"
             
             # 몸무게 비교
             weight_comp = comparison["weight"]
             weight_icon = "🔴" if weight_comp["status"] == "higher" and weight_comp["diff"] > 5 else "🟢" if weight_comp["status"] == "lower" else "🟡"
-            comparison_text += f"{weight_icon} 몸무게: {weight_comp['user']}kg (평균 {weight_comp['avg']}kg) → {weight_comp['text']}\n"
+            comparison_text += f"{weight_icon} 몸무게: {weight_comp['user']}kg (평균 {weight_comp['avg']}kg) → {weight_comp['text']}{self.percentile_text(weight_comp)}\n"
             
             # 혈압 비교
             bp_comp = comparison["ap_hi"]
             bp_icon = "🔴" if bp_comp["status"] == "higher" and bp_comp["diff"] > 10 else "🟢" if bp_comp["status"] == "lower" else "🟡"
-            comparison_text += f"{bp_icon} 수축기 혈압: {bp_comp['user']}mmHg (평균 {bp_comp['avg']}mmHg) → {bp_comp['text']}\n"
+            comparison_text += f"{bp_icon} 수축기 혈압: {bp_comp['user']}mmHg (평균 {bp_comp['avg']}mmHg) → {bp_comp['text']}{self.percentile_text(bp_comp)}\n"
             
             # 심혈관 질환 비율 정보
             comparison_text += f"\n⚠️ {gender} 심혈관 질환 비율: {comparison['cardio_rate']}%"
@@ -655,6 +665,10 @@ class HealthCheckApp:
             fg="#7f8c8d"
         ).pack(pady=10)
     
+    def show_perf_stats(self):
+        """성능 통계 팝업 (MEDICAL_PERF=1로 실행했을 때 메서드별 측정값)"""
+        perf_monitor.show_window(self.window)
+    
     def reset(self):
         """입력 폼 초기화"""
         self.name_entry.delete(0, END)
@@ -0,0 +1,308 @@
+"""
+perf_monitor.py
+매니저 공개 메서드 성능 측정 (선택 기능)
+
+환경 변수 MEDICAL_PERF=1로 실행하면 @instrument를 붙인 클래스의 공개 메서드마다
+호출 수, 누적 시간, p50/p95/p99 지연, 읽고 쓴 행 수와 파일 바이트를 기록하고
+프로그램 종료 시 보고서(JSON, CSV)를 저장 (경로: MEDICAL_PERF_REPORT, 기본 ./perf_report)
+
+꺼져 있으면 instrument()가 클래스를 그대로 돌려주므로 메서드 호출에 추가 비용이 없고,
+입출력 기록 함수는 바로 반환
+
+Author: KDT12 Python Project
+Date: 2026-01-08
+"""
+
+import atexit
+import csv
+import json
+import os
+import threading
+import time
+from array import array
+from functools import wraps
+from types import FunctionType
+
+
+ENV_VAR = "MEDICAL_PERF"
+REPORT_ENV_VAR = "MEDICAL_PERF_REPORT"
+DEFAULT_REPORT = "perf_report"
+
+ENABLED = os.environ.get(ENV_VAR, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+# 보고서 컬럼 (시간은 ms)
+REPORT_FIELDS = [
+    "method", "calls", "total_ms", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms",
+    "rows_read", "rows_written", "bytes_read", "bytes_written"
+]
+
+
+class MethodStats:
+    """메서드 하나의 누적 측정값"""
+
+    __slots__ = ("calls", "total", "durations", "rows_read", "rows_written",
+                 "bytes_read", "bytes_written")
+
+    def __init__(self):
+        """생성자: 측정값 초기화"""
+        self.calls = 0
+        self.total = 0.0
+        self.durations = array("d")
+        self.rows_read = 0
+        self.rows_written = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+
+# "클래스.메서드" → MethodStats
+_stats = {}
+_lock = threading.Lock()
+
+# 스레드별로 실행 중인 측정 메서드 목록 (입출력을 호출한 메서드들에 모두 반영)
+_local = threading.local()
+
+
+def _wrap(name, func):
+    """func 호출 시간을 name 항목에 기록하는 함수로 감싸기"""
+    stats = _stats.setdefault(name, MethodStats())
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(stats)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            with _lock:
+                stats.calls += 1
+                stats.total += elapsed
+                stats.durations.append(elapsed)
+
+    return wrapper
+
+
+def instrument(cls):
+    """
+    클래스 데코레이터: 공개 메서드(밑줄로 시작하지 않는 메서드) 측정
+
+    측정이 꺼져 있으면 클래스를 바꾸지 않고 그대로 반환
+    """
+    if not ENABLED:
+        return cls
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        label = f"{cls.__name__}.{name}"
+        if isinstance(value, FunctionType):
+            setattr(cls, name, _wrap(label, value))
+        elif isinstance(value, (staticmethod, classmethod)):
+            setattr(cls, name, type(value)(_wrap(label, value.__func__)))
+    return cls
+
+
+# ==================== 입출력 기록 ====================
+
+def record_io(rows_read=0, rows_written=0, bytes_read=0, bytes_written=0):
+    """실행 중인 측정 메서드들에 읽고 쓴 행 수/바이트 더하기 (꺼져 있거나 측정 메서드 밖이면 무시)"""
+    if not ENABLED:
+        return
+    stack = getattr(_local, "stack", None)
+    if not stack:
+        return
+    with _lock:
+        # 같은 메서드가 중첩 호출되어도 한 번만 반영
+        for stats in dict.fromkeys(stack):
+            stats.rows_read += rows_read
+            stats.rows_written += rows_written
+            stats.bytes_read += bytes_read
+            stats.bytes_written += bytes_written
+
+
+def file_size(path):
+    """파일 크기 (꺼져 있거나 파일이 없으면 0)"""
+    if not ENABLED:
+        return 0
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def read_file(path, rows):
+    """파일 전체를 rows행 읽었음을 기록"""
+    if ENABLED:
+        record_io(rows_read=rows, bytes_read=file_size(path))
+
+
+def wrote_file(path, rows, size_before=0):
+    """파일에 rows행 썼음을 기록 (추가 쓰기는 쓰기 전 크기 size_before와의 차이)"""
+    if ENABLED:
+        record_io(rows_written=rows, bytes_written=max(file_size(path) - size_before, 0))
+
+
+# ==================== 보고서 ====================
+
+def _percentile(ordered, q):
+    """정렬된 값의 q 백분위 (선형 보간)"""
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def snapshot():
+    """
+    메서드별 측정 결과 (누적 시간이 긴 순서, 호출되지 않은 메서드 제외)
+
+    Returns:
+        list: REPORT_FIELDS 키의 딕셔너리 리스트
+    """
+    with _lock:
+        items = [(name, stats, sorted(stats.durations)) for name, stats in _stats.items() if stats.calls]
+        rows = []
+        for name, stats, ordered in items:
+            rows.append({
+                "method": name,
+                "calls": stats.calls,
+                "total_ms": round(stats.total * 1000, 3),
+                "mean_ms": round(stats.total / stats.calls * 1000, 3),
+                "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+                "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+                "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+                "rows_read": stats.rows_read,
+                "rows_written": stats.rows_written,
+                "bytes_read": stats.bytes_read,
+                "bytes_written": stats.bytes_written
+            })
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+
+def reset():
+    """측정값 초기화"""
+    with _lock:
+        for name in _stats:
+            _stats[name] = MethodStats()
+
+
+def report_path():
+    """보고서 경로 (확장자 제외)"""
+    path = os.environ.get(REPORT_ENV_VAR) or os.path.join(os.getcwd(), DEFAULT_REPORT)
+    return os.path.splitext(path)[0]
+
+
+def write_report(path=None):
+    """
+    측정 결과를 JSON, CSV 파일로 저장
+
+    Args:
+        path (str, optional): 보고서 경로 (확장자 제외, 기본 report_path())
+
+    Returns:
+        tuple: (JSON 경로, CSV 경로)
+    """
+    base = os.path.splitext(path)[0] if path else report_path()
+    rows = snapshot()
+    json_path, csv_path = base + ".json", base + ".csv"
+
+    report = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "pid": os.getpid(),
+        "methods": rows
+    }
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return json_path, csv_path
+
+
+def _write_report_at_exit():
+    """프로그램 종료 시 보고서 저장"""
+    if not any(stats.calls for stats in _stats.values()):
+        return
+    try:
+        json_path, _ = write_report()
+        print(f"[perf] 성능 보고서 저장: {json_path}")
+    except OSError as e:
+        print(f"성능 보고서 저장 오류: {e}")
+
+
+if ENABLED:
+    atexit.register(_write_report_at_exit)
+
+
+# ==================== 화면 ====================
+
+def show_window(parent):
+    """
+    "성능 통계" 팝업 (메서드별 측정 결과 표, 새로고침/보고서 저장)
+
+    Args:
+        parent: 부모 Tk 창
+    """
+    from tkinter import BOTH, LEFT, RIGHT, X, Button, Frame, Toplevel, messagebox, ttk
+
+    if not ENABLED:
+        messagebox.showinfo(
+            "성능 통계",
+            f"성능 측정이 꺼져 있습니다.\n\n환경 변수 {ENV_VAR}=1로 프로그램을 실행하면\n"
+            "매니저 메서드별 호출 수, 지연 시간, 입출력 양을 기록합니다.",
+            parent=parent
+        )
+        return
+
+    window = Toplevel(parent)
+    window.title("📈 성능 통계")
+    window.geometry("1100x450")
+
+    columns = ("method", "calls", "total_ms", "p50_ms", "p95_ms", "p99_ms",
+               "rows_read", "rows_written", "bytes_read", "bytes_written")
+    headings = ("메서드", "호출", "누적(ms)", "p50(ms)", "p95(ms)", "p99(ms)",
+                "읽은 행", "쓴 행", "읽은 바이트", "쓴 바이트")
+
+    table_frame = Frame(window)
+    table_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+    tree = ttk.Treeview(table_frame, columns=columns, show="headings")
+    for column, heading in zip(columns, headings):
+        tree.heading(column, text=heading)
+        tree.column(column, width=260 if column == "method" else 90,
+                    anchor="w" if column == "method" else "e")
+    scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    tree.pack(side=LEFT, fill=BOTH, expand=True)
+    scrollbar.pack(side=RIGHT, fill="y")
+
+    def refresh():
+        tree.delete(*tree.get_children())
+        for row in snapshot():
+            tree.insert("", "end", values=[
+                f"{row[column]:,}" if isinstance(row[column], int) else row[column]
+                for column in columns
+            ])
+
+    def save():
+        try:
+            json_path, csv_path = write_report()
+        except OSError as e:
+            messagebox.showerror("오류", f"보고서 저장 오류: {e}", parent=window)
+            return
+        messagebox.showinfo("저장 완료", f"{json_path}\n{csv_path}", parent=window)
+
+    btn_frame = Frame(window)
+    btn_frame.pack(fill=X, padx=10, pady=(0, 10))
+    Button(btn_frame, text="🔄 새로고침", command=refresh).pack(side=LEFT, padx=5)
+    Button(btn_frame, text="💾 보고서 저장", command=save).pack(side=LEFT, padx=5)
+    Button(btn_frame, text="닫기", command=window.destroy).pack(side=RIGHT, padx=5)
+
+    refresh()
@@ -0,0 +1,143 @@
+"""
+sample_binary.py
+Kaggle 샘플 데이터 바이너리 컬럼 파일 변환/검증 도구
+
+CSV를 고정폭 컬럼 배열로 저장한 바이너리 파일로 변환하고,
+mmap으로 열어 복사 없이 컬럼을 읽을 수 있게 함
+
+사용법:
+    python sample_binary.py build  [CSV 경로] [-o 출력 경로]
+    python sample_binary.py verify [CSV 경로]
+
+Author: KDT12 Python Project
+Date: 2026-01-08
+데이터 출처: Kaggle - Cardiovascular Disease Dataset
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+
+from sample_dataset import (
+    COLUMN_TYPES, HEADER_LEN, MAGIC, SampleDataset, binary_path_for, file_stamp
+)
+
+
+ALIGN = 8
+
+
+def _align(offset):
+    """다음 8바이트 경계로 올림"""
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def write_binary(dataset, out_path, source_stamp):
+    """
+    데이터셋을 바이너리 컬럼 파일로 저장
+
+    Args:
+        dataset (SampleDataset): 저장할 데이터셋
+        out_path (str): 출력 파일 경로
+        source_stamp (tuple): 원본 CSV의 (크기, 수정시각)
+    """
+    rows = len(dataset)
+    names = list(COLUMN_TYPES)
+
+    # 헤더 길이가 오프셋에 영향을 주므로 오프셋 자리를 채운 뒤 두 번 계산
+    columns = [{"name": n, "type": COLUMN_TYPES[n], "offset": 0} for n in names]
+    header = {
+        "rows": rows,
+        "byteorder": sys.byteorder,
+        "source": {"size": source_stamp[0], "mtime_ns": source_stamp[1]},
+        "columns": columns
+    }
+    for _ in range(2):
+        header_bytes = json.dumps(header).encode("utf-8")
+        offset = _align(len(MAGIC) + HEADER_LEN.size + len(header_bytes))
+        for col in columns:
+            col["offset"] = offset
+            offset = _align(offset + rows * struct.calcsize(col["type"]))
+    header_bytes = json.dumps(header).encode("utf-8")
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(HEADER_LEN.pack(len(header_bytes)))
+        f.write(header_bytes)
+        for col in columns:
+            f.write(b"\0" * (col["offset"] - f.tell()))
+            f.write(dataset.columns[col["name"]].tobytes())
+    os.replace(tmp_path, out_path)
+
+
+def build(csv_path, out_path=None):
+    """
+    CSV 파일을 바이너리 컬럼 파일로 변환
+
+    Returns:
+        str: 생성된 바이너리 파일 경로
+    """
+    out_path = out_path or binary_path_for(csv_path)
+    stamp = file_stamp(csv_path)
+    dataset = SampleDataset.from_csv(csv_path)
+    write_binary(dataset, out_path, stamp)
+    return out_path
+
+
+def verify(csv_path, bin_path=None):
+    """
+    바이너리 파일이 원본 CSV와 일치하는지 검사
+
+    Returns:
+        tuple: (일치 여부, 메시지)
+    """
+    bin_path = bin_path or binary_path_for(csv_path)
+    binary = SampleDataset.from_binary(bin_path)
+    if binary is None:
+        return (False, f"바이너리 파일을 열 수 없습니다: {bin_path}")
+
+    source = SampleDataset.from_csv(csv_path)
+    if len(source) != len(binary):
+        return (False, f"행 수가 다릅니다 (CSV {len(source)}, 바이너리 {len(binary)})")
+
+    for name in COLUMN_TYPES:
+        if list(source.columns[name]) != binary.columns[name].tolist():
+            return (False, f"'{name}' 컬럼 값이 다릅니다.")
+
+    if binary.stamp != file_stamp(csv_path):
+        return (True, "값은 일치하지만 CSV가 변환 이후 수정되어 바이너리가 사용되지 않습니다. 다시 build 하세요.")
+    return (True, f"일치합니다 ({len(source)}행)")
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    default_csv = os.path.join(base_path, "data", "sample_data.csv")
+
+    parser = argparse.ArgumentParser(description="Kaggle 샘플 데이터 바이너리 컬럼 파일 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="CSV → 바이너리 변환")
+    p_build.add_argument("csv", nargs="?", default=default_csv)
+    p_build.add_argument("-o", "--output", default=None)
+
+    p_verify = sub.add_parser("verify", help="바이너리 파일과 CSV 일치 여부 검사")
+    p_verify.add_argument("csv", nargs="?", default=default_csv)
+    p_verify.add_argument("-b", "--binary", default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        out_path = build(args.csv, args.output)
+        print(f"✅ 생성 완료: {out_path}")
+        return 0
+
+    ok, message = verify(args.csv, args.binary)
+    print(("✅ " if ok else "❌ ") + message)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
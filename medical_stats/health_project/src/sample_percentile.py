@@ -0,0 +1,239 @@
+"""
+sample_percentile.py
+샘플 데이터 기준 백분위(percentile) 계산
+
+성별 × 연령대 그룹마다 지표별 분위수 표(quantile sketch)를 한 번 만들어
+샘플 파일 옆에 저장해 두고, 사용자 값의 백분위는 표에서 이진 탐색으로 찾음
+
+Author: KDT12 Python Project
+Date: 2026-01-08
+데이터 출처: Kaggle - Cardiovascular Disease Dataset
+"""
+
+import json
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+
+from sample_dataset import GENDER_LABELS, iter_csv_chunks
+
+
+# 분위수 표의 점 개수 (0%, 0.5%, ..., 100%)
+QUANTILE_POINTS = 201
+
+# 백분위를 계산하는 지표
+METRICS = ("bmi", "height", "weight", "ap_hi", "ap_lo")
+
+# 저장 파일 형식 버전 (형식이 바뀌면 올려서 기존 파일을 다시 만들게 함)
+SKETCH_VERSION = 1
+
+# 연령대 없이 성별 전체를 뜻하는 그룹 라벨
+ALL_AGES = "전체"
+
+# 연령대 그룹의 샘플이 이보다 적으면 성별 전체 그룹과 비교
+MIN_GROUP_SIZE = 100
+
+
+def age_band(age):
+    """나이(년) → 연령대 라벨 (예: 47 → "40대")"""
+    return f"{int(age) // 10 * 10}대"
+
+
+def group_key(gender, band):
+    """그룹 키 (예: "남성|40대")"""
+    return f"{gender}|{band}"
+
+
+def sketch_path_for(csv_path):
+    """샘플 CSV 파일에 대응하는 분위수 표 파일 경로"""
+    return os.path.splitext(csv_path)[0] + ".percentiles.json"
+
+
+def collect_values(chunks):
+    """
+    컬럼 청크들에서 성별 × 연령대 그룹별 지표 값 모으기
+
+    값은 4바이트 실수 array로 모아 행 수가 많아도 메모리를 적게 사용
+
+    Args:
+        chunks (iterable): 컬럼명 → 시퀀스 딕셔너리들
+            (SampleDataset.columns 하나 또는 iter_csv_chunks() 결과)
+
+    Returns:
+        dict: (성별, 연령대) → {지표: array("f")}
+    """
+    groups = {}
+    for columns in chunks:
+        rows = zip(columns["gender"], columns["age"], columns["height"], columns["weight"],
+                   columns["ap_hi"], columns["ap_lo"])
+        for gender_code, age, height, weight, ap_hi, ap_lo in rows:
+            gender = GENDER_LABELS.get(gender_code)
+            if gender is None:
+                continue
+            key = (gender, age_band(age))
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {metric: array("f") for metric in METRICS}
+            group["height"].append(height)
+            group["weight"].append(weight)
+            group["ap_hi"].append(ap_hi)
+            group["ap_lo"].append(ap_lo)
+            if height > 0:
+                group["bmi"].append(weight / ((height / 100) ** 2))
+    return groups
+
+
+def quantiles(values, points=QUANTILE_POINTS):
+    """
+    값 목록의 분위수 표 (0% ~ 100%를 points개 점으로, 점 사이는 선형 보간)
+
+    Returns:
+        list: 오름차순 분위수 값 (값이 없으면 빈 리스트)
+    """
+    ordered = sorted(values)
+    n = len(ordered)
+    if not n:
+        return []
+
+    result = []
+    for i in range(points):
+        position = i * (n - 1) / (points - 1)
+        low = int(position)
+        high = min(low + 1, n - 1)
+        fraction = position - low
+        result.append(round(ordered[low] + (ordered[high] - ordered[low]) * fraction, 3))
+    return result
+
+
+def build_sketches(chunks, source_stamp):
+    """
+    그룹별 분위수 표 생성
+
+    Args:
+        chunks (iterable): collect_values()와 같은 컬럼 청크들
+        source_stamp (tuple): 원본 CSV의 (크기, 수정시각)
+
+    Returns:
+        dict: 저장 형식 그대로의 분위수 표
+    """
+    collected = collect_values(chunks)
+    groups = {}
+    for (gender, band), values in sorted(collected.items()):
+        groups[group_key(gender, band)] = {
+            "count": len(values["height"]),
+            "quantiles": {metric: quantiles(values[metric]) for metric in METRICS}
+        }
+
+    # 성별 전체 그룹: 연령대별 값을 지표 하나씩 이어 붙여 계산
+    for gender in sorted({gender for gender, _ in collected}):
+        bands = [values for (g, _), values in collected.items() if g == gender]
+        table = {}
+        for metric in METRICS:
+            merged = array("f")
+            for values in bands:
+                merged.extend(values[metric])
+            table[metric] = quantiles(merged)
+        groups[group_key(gender, ALL_AGES)] = {
+            "count": sum(len(values["height"]) for values in bands),
+            "quantiles": table
+        }
+    return {
+        "version": SKETCH_VERSION,
+        "points": QUANTILE_POINTS,
+        "source": {"size": source_stamp[0], "mtime_ns": source_stamp[1]},
+        "groups": groups
+    }
+
+
+def save_sketches(path, sketches):
+    """분위수 표 저장 (임시 파일에 쓴 뒤 교체)"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(sketches, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def load_sketches(path, source_stamp):
+    """
+    저장된 분위수 표 읽기
+
+    Returns:
+        dict or None: 파일이 없거나 형식/원본이 맞지 않으면 None
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            sketches = json.load(f)
+        source = (sketches["source"]["size"], sketches["source"]["mtime_ns"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if sketches.get("version") != SKETCH_VERSION or source != tuple(source_stamp):
+        return None
+    return sketches
+
+
+def get_sketches(csv_path, source_stamp, dataset=None):
+    """
+    원본과 일치하는 분위수 표 반환 (없거나 원본이 바뀌었으면 새로 만들어 저장)
+
+    Args:
+        csv_path (str): 샘플 CSV 파일 경로
+        source_stamp (tuple): 원본 CSV의 (크기, 수정시각)
+        dataset (SampleDataset, optional): 이미 읽어 둔 데이터셋 (없으면 CSV를 청크로 읽음)
+
+    Returns:
+        dict: 분위수 표
+    """
+    path = sketch_path_for(csv_path)
+    sketches = load_sketches(path, source_stamp)
+    if sketches is None:
+        chunks = [dataset.columns] if dataset is not None else iter_csv_chunks(csv_path)
+        sketches = build_sketches(chunks, source_stamp)
+        try:
+            save_sketches(path, sketches)
+        except OSError as e:
+            print(f"백분위 표 저장 오류: {e}")
+    return sketches
+
+
+def percentile_rank(table, value):
+    """
+    분위수 표에서 값의 백분위 (0 ~ 100)
+
+    표의 점 사이는 선형 보간하고, 같은 값이 여러 점에 걸쳐 있으면 그 가운데를 사용
+    (이진 탐색이므로 표 크기에 대해 O(log n))
+    """
+    if not table:
+        return None
+    last = len(table) - 1
+    if value < table[0]:
+        return 0.0
+    if value > table[-1]:
+        return 100.0
+
+    low = bisect_left(table, value)
+    high = bisect_right(table, value)
+    if low != high:
+        position = (low + high - 1) / 2
+    else:
+        below, above = table[low - 1], table[low]
+        position = low - 1 + (value - below) / (above - below)
+    return round(position / last * 100, 1)
+
+
+def find_group(sketches, gender, age=None):
+    """
+    사용자에게 맞는 비교 그룹 (같은 연령대가 없거나 샘플이 적으면 성별 전체)
+
+    Returns:
+        tuple: (그룹 라벨, 그룹 데이터) 또는 (None, None)
+    """
+    groups = sketches["groups"]
+    if age:
+        band = age_band(age)
+        group = groups.get(group_key(gender, band))
+        if group is not None and group["count"] >= MIN_GROUP_SIZE:
+            return f"{gender} {band}", group
+    group = groups.get(group_key(gender, ALL_AGES))
+    if group is not None:
+        return f"{gender} {ALL_AGES}", group
+    return None, None
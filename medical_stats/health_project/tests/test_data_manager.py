@@ -0,0 +1,132 @@
+"""
+test_data_manager.py
+DataManager 삭제 표시/정리(vacuum), 샘플 데이터 로드 테스트
+
+실행: (health_project 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-08
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from data_manager import DataManager
+
+
+RECORD = {
+    "age": 45, "gender": "남성", "height": 172, "weight": 71.5, "ap_hi": 128, "ap_lo": 82,
+    "cholesterol": 1, "gluc": 1, "smoke": 0, "alco": 0, "active": 1, "bmi": 24.2, "risk_score": 30
+}
+
+SAMPLE_LINES = [
+    "id;age;gender;height;weight;ap_hi;ap_lo;cholesterol;gluc;smoke;alco;active;cardio",
+    "0;18393;2;168;62.0;110;80;1;1;0;0;1;0",
+    "1;20228;1;156;85.0;140;90;3;1;0;0;1;1",
+    "2;18857;1;165;64.0;130;70;3;1;0;0;0;1"
+]
+
+
+class TombstoneTest(unittest.TestCase):
+    """삭제 표시와 vacuum() 도중 종료 복구"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="health_test_")
+        self.user_file = os.path.join(self.work_dir, "user_records.csv")
+        self.manager = DataManager(self.user_file)
+        for i in range(5):
+            self.assertTrue(self.manager.save_record(f"사용자{i}", RECORD))
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def names(self, manager=None):
+        return [record["name"] for record in (manager or self.manager).load_records()]
+
+    def test_delete_and_vacuum(self):
+        self.assertTrue(self.manager.delete_record(1))
+        self.assertFalse(self.manager.delete_record(1))
+        self.assertFalse(self.manager.delete_record(5))
+        self.assertTrue(self.manager.save_record("사용자5", RECORD))
+        self.assertTrue(self.manager.delete_record(5))
+        self.assertEqual(self.manager.pending_deletes(), 2)
+
+        self.assertEqual(self.manager.vacuum(), 2)
+        self.assertEqual(self.names(), ["사용자0", "사용자2", "사용자3", "사용자4"])
+        self.assertEqual(self.manager.pending_deletes(), 0)
+        self.assertTrue(self.manager.delete_record(3))
+        self.assertFalse(self.manager.delete_record(4))
+
+    def test_crash_before_csv_replace(self):
+        self.manager.delete_record(2)
+        # vacuum()이 임시 CSV를 쓰고 삭제 표시를 치운 뒤 CSV를 교체하기 전에 종료된 상태
+        with open(self.user_file, "r", encoding="utf-8") as src, \
+                open(self.user_file + ".tmp", "w", encoding="utf-8") as dst:
+            dst.write(src.read())
+        os.replace(self.manager.tombstone_file, self.manager.tombstone_file + ".old")
+
+        restarted = DataManager(self.user_file)
+        self.assertEqual(self.names(restarted), ["사용자0", "사용자1", "사용자3", "사용자4"])
+        self.assertFalse(os.path.exists(restarted.tombstone_file + ".old"))
+        self.assertFalse(os.path.exists(self.user_file + ".tmp"))
+
+    def test_crash_after_csv_replace(self):
+        self.manager.delete_record(2)
+        self.manager.vacuum()
+        # CSV 교체 후 치워 둔 삭제 표시를 지우기 전에 종료된 상태
+        with open(self.manager.tombstone_file + ".old", "w", encoding="utf-8") as f:
+            f.write("2\n")
+
+        restarted = DataManager(self.user_file)
+        self.assertEqual(self.names(restarted), ["사용자0", "사용자1", "사용자3", "사용자4"])
+        self.assertFalse(os.path.exists(restarted.tombstone_file + ".old"))
+
+
+class SampleLoadTest(unittest.TestCase):
+    """load_sample_data(): 형식 오류 행이 있으면 그 앞까지 읽은 행 반환 (기존 동작)"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="health_test_")
+        self.sample_file = os.path.join(self.work_dir, "sample_data.csv")
+        self.manager = DataManager(os.path.join(self.work_dir, "user_records.csv"), self.sample_file,
+                                   workers=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def write_sample(self, lines):
+        with open(self.sample_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def test_valid_file(self):
+        self.write_sample(SAMPLE_LINES)
+        samples = self.manager.load_sample_data()
+        self.assertEqual([s["id"] for s in samples], ["0", "1", "2"])
+        self.assertEqual(samples[1], {
+            "id": "1", "age": 55, "gender": "여성", "height": 156, "weight": 85.0, "ap_hi": 140,
+            "ap_lo": 90, "cholesterol": 3, "gluc": 1, "smoke": 0, "alco": 0, "active": 1, "cardio": 1
+        })
+
+    def test_bad_row_returns_rows_before_it(self):
+        self.write_sample(SAMPLE_LINES[:3] + ["9;19000;2;abc;70.0;120;80;1;1;0;0;1;0"] + SAMPLE_LINES[3:])
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            samples = self.manager.load_sample_data()
+        self.assertIn("샘플 데이터 로드 오류", out.getvalue())
+        self.assertEqual([s["id"] for s in samples], ["0", "1"])
+        self.assertEqual(samples[0]["gender"], "남성")
+
+    def test_missing_file(self):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(self.manager.load_sample_data(), [])
+        self.assertIn("샘플 데이터 파일을 찾을 수 없습니다.", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+"""
+test_sample_dataset.py
+샘플 데이터 컬럼 캐시(SampleDataset)와 바이너리 컬럼 파일 테스트
+
+실행: (health_project 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-08
+"""
+
+import csv
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import sample_dataset
+from sample_binary import build, verify
+from sample_dataset import COLUMN_TYPES, SampleDataset, get_sample_dataset, read_csv_columns, split_ranges
+
+
+SAMPLE_HEADER = "id;age;gender;height;weight;ap_hi;ap_lo;cholesterol;gluc;smoke;alco;active;cardio"
+
+
+def write_sample_csv(path, rows, seed=0):
+    """Kaggle 형식(세미콜론 구분, 나이는 일 단위) 가상 샘플 CSV 작성"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(SAMPLE_HEADER + "\n")
+        for i in range(rows):
+            f.write(";".join(str(v) for v in (
+                i, rng.randint(10000, 24000), rng.randint(1, 2), rng.randint(140, 200),
+                round(rng.uniform(40, 130), 1), rng.randint(90, 180), rng.randint(60, 110),
+                rng.randint(1, 3), rng.randint(1, 3), rng.randint(0, 1), rng.randint(0, 1),
+                rng.randint(0, 1), rng.randint(0, 1)
+            )) + "\n")
+
+
+def dict_reader_records(path):
+    """컬럼 캐시 도입 전 load_sample_data(): csv.DictReader로 행마다 딕셔너리 변환"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [
+            {
+                "id": row.get("id"),
+                "age": int(row.get("age", 0)) // 365,
+                "gender": "여성" if row.get("gender") == "1" else "남성",
+                "height": int(row.get("height", 0)),
+                "weight": float(row.get("weight", 0)),
+                "ap_hi": int(row.get("ap_hi", 0)),
+                "ap_lo": int(row.get("ap_lo", 0)),
+                "cholesterol": int(row.get("cholesterol", 1)),
+                "gluc": int(row.get("gluc", 1)),
+                "smoke": int(row.get("smoke", 0)),
+                "alco": int(row.get("alco", 0)),
+                "active": int(row.get("active", 0)),
+                "cardio": int(row.get("cardio", 0))
+            }
+            for row in csv.DictReader(f, delimiter=";")
+        ]
+
+
+class SampleTestCase(unittest.TestCase):
+    """임시 폴더에 샘플 CSV 준비"""
+
+    rows = 500
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="sample_test_")
+        self.csv_path = os.path.join(self.work_dir, "sample_data.csv")
+        write_sample_csv(self.csv_path, self.rows)
+        sample_dataset.clear_cache()
+
+    def tearDown(self):
+        sample_dataset.clear_cache()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def assert_same_columns(self, actual, expected):
+        self.assertEqual(set(actual), set(COLUMN_TYPES))
+        for name in COLUMN_TYPES:
+            self.assertEqual(list(actual[name]), list(expected[name]), name)
+
+
+class ColumnCacheTest(SampleTestCase):
+    """컬럼 변환 결과가 기존 행 단위 파싱과 같고, 파일이 바뀔 때만 다시 읽는지"""
+
+    def test_records_match_dict_reader(self):
+        dataset = SampleDataset.from_csv(self.csv_path, workers=1)
+        self.assertEqual(len(dataset), self.rows)
+        self.assertEqual(dataset.to_records(), dict_reader_records(self.csv_path))
+
+    def test_parallel_parse_matches_single_process(self):
+        expected = read_csv_columns(self.csv_path, workers=1)
+        for workers in (2, 3, 7):
+            self.assert_same_columns(read_csv_columns(self.csv_path, workers, min_bytes=0), expected)
+
+    def test_split_ranges_cover_every_line(self):
+        with open(self.csv_path, "rb") as f:
+            lines = f.readlines()[1:]
+        for parts in (1, 2, 5, self.rows * 2):
+            header, ranges = split_ranges(self.csv_path, parts)
+            self.assertEqual(";".join(header), SAMPLE_HEADER)
+            self.assertLessEqual(len(ranges), parts)
+            chunks = []
+            with open(self.csv_path, "rb") as f:
+                for start, end in ranges:
+                    f.seek(start)
+                    chunk = f.read(end - start)
+                    self.assertTrue(chunk.endswith(b"\n"), (parts, start, end))
+                    chunks.append(chunk)
+            self.assertEqual(b"".join(chunks), b"".join(lines))
+
+    def test_cache_reloads_only_on_change(self):
+        dataset = get_sample_dataset(self.csv_path, workers=1)
+        dataset.derived["marker"] = True
+        self.assertIs(get_sample_dataset(self.csv_path, workers=1), dataset)
+
+        write_sample_csv(self.csv_path, self.rows + 10, seed=1)
+        reloaded = get_sample_dataset(self.csv_path, workers=1)
+        self.assertIsNot(reloaded, dataset)
+        self.assertEqual(reloaded.derived, {})
+        self.assertEqual(reloaded.to_records(), dict_reader_records(self.csv_path))
+
+
+class BinaryFormatTest(SampleTestCase):
+    """바이너리 컬럼 파일이 CSV와 같은 값을 주고, 원본이 바뀌면 쓰이지 않는지"""
+
+    def test_round_trip(self):
+        bin_path = build(self.csv_path)
+        dataset = SampleDataset.from_binary(bin_path)
+        self.assert_same_columns(dataset.columns, SampleDataset.from_csv(self.csv_path, workers=1).columns)
+        for name, typecode in COLUMN_TYPES.items():
+            self.assertIsInstance(dataset.columns[name], memoryview)
+            self.assertEqual(dataset.columns[name].format, typecode)
+        self.assertEqual(dataset.to_records(), dict_reader_records(self.csv_path))
+        self.assertEqual(verify(self.csv_path), (True, f"일치합니다 ({self.rows}행)"))
+
+    def test_empty_sample(self):
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write(SAMPLE_HEADER + "\n")
+        dataset = SampleDataset.from_binary(build(self.csv_path))
+        self.assertEqual(len(dataset), 0)
+        self.assertEqual(dataset.to_records(), [])
+
+    def test_cache_opens_fresh_binary(self):
+        build(self.csv_path)
+        dataset = get_sample_dataset(self.csv_path, workers=1)
+        self.assertIsInstance(dataset.columns["age"], memoryview)
+        self.assertEqual(dataset.to_records(), dict_reader_records(self.csv_path))
+
+    def test_stale_binary_is_ignored(self):
+        bin_path = build(self.csv_path)
+        write_sample_csv(self.csv_path, self.rows + 1, seed=5)
+        stamp = sample_dataset.file_stamp(self.csv_path)
+        self.assertIsNone(SampleDataset.from_binary(bin_path, stamp))
+
+        dataset = get_sample_dataset(self.csv_path, workers=1)
+        self.assertNotIsInstance(dataset.columns["age"], memoryview)
+        self.assertEqual(dataset.to_records(), dict_reader_records(self.csv_path))
+        self.assertFalse(verify(self.csv_path)[0])
+
+    def test_foreign_file_returns_none(self):
+        bin_path = build(self.csv_path)
+        with open(bin_path, "rb") as f:
+            data = f.read()
+
+        # 다른 바이트 순서로 만든 파일 (헤더 길이는 그대로)
+        other = data.replace(f'"byteorder": "{sys.byteorder}"'.encode(),
+                             f'"byteorder": "{sys.byteorder.upper()}"'.encode(), 1)
+        self.assertNotEqual(other, data)
+        with open(bin_path, "wb") as f:
+            f.write(other)
+        self.assertIsNone(SampleDataset.from_binary(bin_path))
+
+        with open(bin_path, "wb") as f:
+            f.write(b"NOTCVD00" + data[8:])
+        self.assertIsNone(SampleDataset.from_binary(bin_path))
+        self.assertIsNone(SampleDataset.from_binary(os.path.join(self.work_dir, "없는파일.bin")))
+
+
+class TruncatedBinaryTest(SampleTestCase):
+    """잘린 바이너리 컬럼 파일은 열지 않고 CSV로 읽음"""
+
+    def truncate(self, bin_path, size):
+        with open(bin_path, "r+b") as f:
+            f.truncate(size)
+
+    def test_truncated_file_returns_none(self):
+        bin_path = build(self.csv_path)
+        full = os.path.getsize(bin_path)
+        dataset = SampleDataset.from_binary(bin_path)
+        self.assertEqual(len(dataset), self.rows)
+        del dataset
+
+        # 마지막 컬럼 1바이트, 마지막 컬럼 전체, 중간 컬럼 도중에서 잘린 경우
+        for size in (full - 1, full - self.rows, full // 2):
+            build(self.csv_path, bin_path)
+            self.truncate(bin_path, size)
+            self.assertIsNone(SampleDataset.from_binary(bin_path), size)
+
+    def test_cache_falls_back_to_csv(self):
+        bin_path = build(self.csv_path)
+        self.truncate(bin_path, os.path.getsize(bin_path) - 1)
+        dataset = get_sample_dataset(self.csv_path, workers=1)
+        self.assertEqual(len(dataset), self.rows)
+        self.assert_same_columns(dataset.columns, SampleDataset.from_csv(self.csv_path, workers=1).columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+test_sample_stats.py
+샘플 데이터 그룹별/스트리밍 통계(sample_stats)가 기존 성별 통계 계산과 같은지 테스트
+
+실행: (health_project 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-08
+"""
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import sample_dataset
+from data_manager import DataManager
+from sample_dataset import SampleDataset, iter_csv_chunks
+from sample_stats import group_statistics, streaming_statistics
+
+
+SAMPLE_HEADER = "id;age;gender;height;weight;ap_hi;ap_lo;cholesterol;gluc;smoke;alco;active;cardio"
+
+
+def write_sample_csv(path, rows, seed=0, genders=(1, 2)):
+    """Kaggle 형식 가상 샘플 CSV 작성 (키 0인 행 포함)"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(SAMPLE_HEADER + "\n")
+        for i in range(rows):
+            f.write(";".join(str(v) for v in (
+                i, rng.randint(10000, 24000), rng.choice(genders),
+                0 if rng.random() < 0.05 else rng.randint(140, 200),
+                round(rng.uniform(40, 130), 1), rng.randint(90, 180), rng.randint(60, 110),
+                rng.randint(1, 3), rng.randint(1, 3), rng.randint(0, 1), rng.randint(0, 1),
+                rng.randint(0, 1), rng.randint(0, 1)
+            )) + "\n")
+
+
+def baseline_statistics(samples, label):
+    """그룹 집계 도입 전 get_statistics(): 필터한 행마다 지표별로 따로 순회"""
+    if not samples:
+        return None
+    total = len(samples)
+    bmi_list = [s["weight"] / ((s["height"] / 100) ** 2) for s in samples if s["height"] > 0]
+    stats = dict(label)
+    stats.update({
+        "total_samples": total,
+        "avg_age": round(sum(s["age"] for s in samples) / total, 1),
+        "avg_height": round(sum(s["height"] for s in samples) / total, 1),
+        "avg_weight": round(sum(s["weight"] for s in samples) / total, 1),
+        "avg_bmi": round(sum(bmi_list) / len(bmi_list) if bmi_list else 0, 1),
+        "avg_ap_hi": round(sum(s["ap_hi"] for s in samples) / total, 1),
+        "avg_ap_lo": round(sum(s["ap_lo"] for s in samples) / total, 1),
+        "cardio_rate": round(sum(1 for s in samples if s["cardio"] == 1) / total * 100, 1),
+        "smoke_rate": round(sum(1 for s in samples if s["smoke"] == 1) / total * 100, 1),
+        "high_chol_rate": round(sum(1 for s in samples if s["cholesterol"] >= 2) / total * 100, 1)
+    })
+    return stats
+
+
+class SampleStatsTestCase(unittest.TestCase):
+    """임시 폴더에 샘플 CSV 준비"""
+
+    rows = 2000
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="sample_stats_test_")
+        self.sample_file = os.path.join(self.work_dir, "sample_data.csv")
+        write_sample_csv(self.sample_file, self.rows)
+        sample_dataset.clear_cache()
+
+    def tearDown(self):
+        sample_dataset.clear_cache()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def manager(self, **options):
+        return DataManager(os.path.join(self.work_dir, "user_records.csv"), self.sample_file,
+                           workers=1, **options)
+
+
+class GroupStatisticsTest(SampleStatsTestCase):
+    """한 번의 순회로 계산한 그룹별 통계가 그룹마다 따로 계산한 결과와 같은지"""
+
+    def test_gender_statistics_match_baseline(self):
+        samples = SampleDataset.from_csv(self.sample_file, workers=1).to_records()
+        stats = self.manager().get_gender_statistics()
+        self.assertEqual(stats, {
+            "male": baseline_statistics([s for s in samples if s["gender"] == "남성"], {"gender": "남성"}),
+            "female": baseline_statistics([s for s in samples if s["gender"] == "여성"], {"gender": "여성"}),
+            "total": baseline_statistics(samples, {"gender": "전체"})
+        })
+
+    def test_other_group_columns(self):
+        samples = SampleDataset.from_csv(self.sample_file, workers=1).to_records()
+        manager = self.manager()
+        for by in ("cholesterol", "cardio", "smoke"):
+            grouped = manager.get_grouped_statistics(by)
+            values = sorted({s[by] for s in samples})
+            self.assertEqual(list(grouped["groups"]), values)
+            for value in values:
+                self.assertEqual(grouped["groups"][value],
+                                 baseline_statistics([s for s in samples if s[by] == value], {by: value}))
+            self.assertEqual(grouped["total"], baseline_statistics(samples, {by: "전체"}))
+
+    def test_missing_group_is_none(self):
+        write_sample_csv(self.sample_file, 50, seed=2, genders=(1,))
+        stats = self.manager().get_gender_statistics()
+        self.assertIsNone(stats["male"])
+        self.assertEqual(stats["female"]["total_samples"], 50)
+        self.assertEqual(stats["total"]["total_samples"], 50)
+
+    def test_result_is_cached_per_dataset(self):
+        manager = self.manager()
+        first = manager.get_grouped_statistics("gender")
+        self.assertIs(manager.get_grouped_statistics("gender"), first)
+        # get_statistics()는 복사본을 돌려주므로 바꿔도 캐시에 영향 없음
+        manager.get_statistics("남성")["avg_age"] = -1
+        self.assertEqual(manager.get_statistics("남성"), first["groups"]["남성"])
+
+        dataset = SampleDataset.from_csv(self.sample_file, workers=1)
+        self.assertEqual(group_statistics(dataset.columns, "gender"), first)
+
+
+class StreamingStatisticsTest(SampleStatsTestCase):
+    """일정 행씩 읽는 스트리밍 통계가 전체를 읽어 계산한 결과와 같은지"""
+
+    def test_chunks_are_bounded(self):
+        sizes = [len(chunk["id"]) for chunk in iter_csv_chunks(self.sample_file, chunk_rows=300)]
+        self.assertEqual(sizes, [300] * 6 + [200])
+
+    def test_matches_in_memory(self):
+        columns = SampleDataset.from_csv(self.sample_file, workers=1).columns
+        for by in ("gender", "cholesterol", "cardio"):
+            expected = group_statistics(columns, by)
+            for chunk_rows in (1, 7, 1000, 50_000):
+                self.assertEqual(streaming_statistics(self.sample_file, by, chunk_rows), expected,
+                                 (by, chunk_rows))
+
+    def test_manager_streaming_mode(self):
+        expected = self.manager().get_gender_statistics()
+        sample_dataset.clear_cache()
+        manager = self.manager(streaming=True)
+        self.assertEqual(manager.get_gender_statistics(), expected)
+        self.assertEqual(manager.get_grouped_statistics("cardio"), self.manager().get_grouped_statistics("cardio"))
+        # 스트리밍 모드는 컬럼 데이터셋을 메모리에 남기지 않음
+        sample_dataset.clear_cache()
+        manager.get_grouped_statistics("smoke")
+        self.assertEqual(sample_dataset._cache, {})
+
+        # 파일이 바뀌면 다시 계산
+        first = manager.get_grouped_statistics("gender")
+        self.assertIs(manager.get_grouped_statistics("gender"), first)
+        write_sample_csv(self.sample_file, 300, seed=4)
+        self.assertEqual(manager.get_statistics()["total_samples"], 300)
+        self.assertEqual(manager.get_gender_statistics(), self.manager().get_gender_statistics())
+
+    def test_missing_or_empty_file(self):
+        manager = self.manager(streaming=True)
+        with open(self.sample_file, "w", encoding="utf-8") as f:
+            f.write(SAMPLE_HEADER + "\n")
+        self.assertIsNone(manager.get_statistics())
+        os.remove(self.sample_file)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertIsNone(manager.get_statistics("남성"))
+        self.assertIn("샘플 데이터 파일을 찾을 수 없습니다.", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
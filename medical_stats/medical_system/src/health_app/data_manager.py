@@ -8,14 +8,46 @@ Date: 2026-01-09
 
 import csv
 import os
+from array import array
 from datetime import datetime
 
+import perf_monitor
+from .sample_dataset import (
+    COLUMN_TYPES, SampleDataset, file_stamp, get_sample_dataset, iter_csv_chunks
+)
+from .record_summary import RecordSummary
+from .record_store import HealthRecordStore, date_bounds, migrate_csv
+from .sample_stats import group_statistics, streaming_statistics
+from .sample_percentile import METRICS, find_group, get_sketches, percentile_rank
 
+
+@perf_monitor.instrument
 class HealthDataManager:
-    """건강 데이터를 CSV 파일로 관리하는 클래스"""
+    """
+    건강 데이터를 CSV 파일(또는 SQLite DB)로 관리하는 클래스
+    
+    backend="sqlite"이면 data/health_records.db에 저장하고
+    환자 ID/이름/기간별 조회를 인덱스로 처리.
+    streaming=True이면 샘플 통계를 파일 전체를 올리지 않고 일정 행씩 읽으며 계산
+    workers는 샘플 CSV 파싱 작업 프로세스 수 (None이면 CPU 수, 작은 파일은 한 프로세스)
+    MEDICAL_PERF=1이면 공개 메서드 성능 측정 (perf_monitor)
+    """
+    
+    CSV_HEADERS = [
+        "date", "patient_id", "name", "age", "gender", "height", "weight",
+        "ap_hi", "ap_lo", "cholesterol", "gluc",
+        "smoke", "alco", "active", "bmi", "risk_score",
+        "doctor", "hospital", "room_number", "admission_type", "test_results", "billing_amount"
+    ]
     
-    def __init__(self, base_path=None):
-        """생성자: 파일 경로 설정"""
+    # 사용 가능한 저장 방식
+    BACKENDS = ("csv", "sqlite")
+    
+    def __init__(self, base_path=None, backend="csv", streaming=False, workers=None):
+        """생성자: 파일 경로 설정 (sqlite는 DB 파일이 없으면 처음 열 때 CSV 기록을 옮겨 옴)"""
+        if backend not in self.BACKENDS:
+            raise ValueError(f"지원하지 않는 저장 방식입니다: {backend}")
+        
         if base_path is None:
             self.base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         else:
@@ -23,8 +55,20 @@ class HealthDataManager:
         
         self.user_file = os.path.join(self.base_path, "data", "health_records.csv")
         self.sample_file = os.path.join(self.base_path, "data", "cardiovascular_sample.csv")
+        self.summary_file = os.path.join(self.base_path, "data", "health_records.stats.json")
+        self.db_path = os.path.join(self.base_path, "data", "health_records.db")
+        self.backend = backend
+        self.store = None
+        self.streaming = streaming
+        self.workers = workers
+        self._streaming_cache = {}
+        self._percentile_cache = (None, None)
         
         self._ensure_file_exists()
+        if backend == "sqlite":
+            if not os.path.exists(self.db_path):
+                migrate_csv(self.user_file, self.db_path, self.CSV_HEADERS)
+            self.store = HealthRecordStore(self.db_path, self.CSV_HEADERS)
     
     def _ensure_file_exists(self):
         """파일이 없으면 헤더와 함께 생성"""
@@ -32,12 +76,7 @@ class HealthDataManager:
             os.makedirs(os.path.dirname(self.user_file), exist_ok=True)
             with open(self.user_file, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    "date", "patient_id", "name", "age", "gender", "height", "weight",
-                    "ap_hi", "ap_lo", "cholesterol", "gluc",
-                    "smoke", "alco", "active", "bmi", "risk_score",
-                    "doctor", "hospital", "room_number", "admission_type", "test_results", "billing_amount"
-                ])
+                writer.writerow(self.CSV_HEADERS)
     
     def save_record(self, name, data_dict):
         """새로운 건강 기록 저장 (기존 호환)"""
@@ -45,127 +84,300 @@ class HealthDataManager:
     
     def save_record_with_patient_id(self, patient_id, name, data_dict):
         """환자 ID와 함께 새로운 건강 기록 저장"""
+        return self.append_record(patient_id, name, data_dict) is not None
+    
+    def append_record(self, patient_id, name, data_dict):
+        """
+        건강 기록 저장 후 저장된 기록 반환
+        
+        Returns:
+            dict or None: 저장된 기록 (load_records()와 같은 키), 실패 시 None
+        """
         try:
             current_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-            with open(self.user_file, "a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    current_date, patient_id, name,
-                    data_dict["age"], data_dict["gender"],
-                    data_dict["height"], data_dict["weight"],
-                    data_dict["ap_hi"], data_dict["ap_lo"],
-                    data_dict["cholesterol"], data_dict["gluc"],
-                    data_dict["smoke"], data_dict["alco"],
-                    data_dict["active"], data_dict["bmi"],
-                    data_dict["risk_score"],
-                    data_dict.get("doctor", ""),
-                    data_dict.get("hospital", ""),
-                    data_dict.get("room_number", "0"),
-                    data_dict.get("admission_type", "Elective"),
-                    data_dict.get("test_results", "Normal"),
-                    data_dict.get("billing_amount", "0")
-                ])
-            return True
+            row = [
+                current_date, patient_id, name,
+                data_dict["age"], data_dict["gender"],
+                data_dict["height"], data_dict["weight"],
+                data_dict["ap_hi"], data_dict["ap_lo"],
+                data_dict["cholesterol"], data_dict["gluc"],
+                data_dict["smoke"], data_dict["alco"],
+                data_dict["active"], data_dict["bmi"],
+                data_dict["risk_score"],
+                data_dict.get("doctor", ""),
+                data_dict.get("hospital", ""),
+                data_dict.get("room_number", "0"),
+                data_dict.get("admission_type", "Elective"),
+                data_dict.get("test_results", "Normal"),
+                data_dict.get("billing_amount", "0")
+            ]
+            record = dict(zip(self.CSV_HEADERS, row))
+            stamp_before = self.records_stamp()
+            if self.store is not None:
+                self.store.add(record)
+                perf_monitor.record_io(rows_written=1)
+            else:
+                size_before = perf_monitor.file_size(self.user_file)
+                with open(self.user_file, "a", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(row)
+                perf_monitor.wrote_file(self.user_file, 1, size_before)
+            self._update_summary(stamp_before, record)
+            return {key: "" if value is None else str(value) for key, value in record.items()}
         except Exception as e:
             print(f"저장 오류: {e}")
-            return False
+            return None
+    
+    def _update_summary(self, stamp_before, record):
+        """
+        누적 통계 사이드카에 방금 추가한 기록 반영 (O(1))
+        
+        사이드카가 추가 직전 파일 상태와 맞지 않으면 갱신하지 않고
+        다음 조회 시 전체 재계산되도록 둠
+        """
+        summary = RecordSummary.load(self.summary_file)
+        if summary is None or summary.stamp != stamp_before:
+            return
+        summary.add(record)
+        summary.stamp = self.records_stamp()
+        try:
+            summary.save(self.summary_file)
+        except OSError as e:
+            print(f"통계 저장 오류: {e}")
+    
+    def records_stamp(self):
+        """
+        기록 변경 감지용 값 (기록이 없으면 None)
+        
+        CSV는 (파일 크기, 수정 시각), SQLite는 (변경 횟수, 마지막 rowid)
+        """
+        if self.store is not None:
+            return self.store.stamp()
+        if not os.path.exists(self.user_file):
+            return None
+        return file_stamp(self.user_file)
+    
+    def _rebuild_summary(self):
+        """기록 전체를 읽어 누적 통계 사이드카 재생성"""
+        stamp = self.records_stamp()
+        summary = RecordSummary(stamp)
+        for record in self.load_records():
+            summary.add(record)
+        try:
+            summary.save(self.summary_file)
+        except OSError as e:
+            print(f"통계 저장 오류: {e}")
+        return summary
+    
+    def get_record_summary(self):
+        """
+        건강 기록 누적 통계 조회 (기록 파일을 다시 읽지 않음)
+        
+        사이드카가 없거나 기록 파일과 맞지 않으면 자동으로 재생성
+        
+        Returns:
+            dict: {"count", "linked", "fields": {필드: {mean, std, min, max, ...}}}
+        """
+        stamp = self.records_stamp()
+        if stamp is None:
+            return RecordSummary().to_dict()
+        
+        summary = RecordSummary.load(self.summary_file)
+        if summary is None or summary.stamp != stamp:
+            summary = self._rebuild_summary()
+        return summary.to_dict()
     
     def load_records(self):
         """모든 사용자 기록 불러오기"""
+        if self.store is not None:
+            try:
+                records = self.store.load_all()
+                perf_monitor.record_io(rows_read=len(records))
+                return records
+            except Exception as e:
+                print(f"불러오기 오류: {e}")
+                return []
+        
         records = []
         try:
             with open(self.user_file, "r", encoding="utf-8") as f:
                 reader = csv.DictReader(f)
                 for row in reader:
                     records.append(row)
+            perf_monitor.read_file(self.user_file, len(records))
         except FileNotFoundError:
             pass
         except Exception as e:
             print(f"불러오기 오류: {e}")
         return records
     
-    def load_sample_data(self):
-        """Kaggle 샘플 데이터 불러오기"""
-        samples = []
+    def load_records_by_patient(self, patient_id, start_date=None, end_date=None):
+        """
+        환자 ID의 건강 기록 (날짜순)
+        
+        Args:
+            patient_id (str): 환자 ID
+            start_date (str): 시작일 "YYYY-MM-DD" (없으면 처음부터)
+            end_date (str): 종료일 "YYYY-MM-DD", 그날 기록까지 포함 (없으면 끝까지)
+        
+        Returns:
+            list: 기록 딕셔너리 리스트
+        """
+        if self.store is not None:
+            try:
+                records = self.store.by_patient(patient_id, start_date, end_date)
+                perf_monitor.record_io(rows_read=len(records))
+                return records
+            except Exception as e:
+                print(f"불러오기 오류: {e}")
+                return []
+        
+        low, high = date_bounds(start_date, end_date)
+        records = [
+            r for r in self.load_records()
+            if r.get("patient_id") == patient_id and low <= r.get("date", "") <= high
+        ]
+        return sorted(records, key=lambda r: r.get("date", ""))
+    
+    def load_records_by_name(self, name):
+        """이름이 같은 건강 기록 (저장 순서)"""
+        if self.store is not None:
+            try:
+                records = self.store.by_name(name)
+                perf_monitor.record_io(rows_read=len(records))
+                return records
+            except Exception as e:
+                print(f"불러오기 오류: {e}")
+                return []
+        return [r for r in self.load_records() if r.get("name") == name]
+    
+    def load_records_between(self, start_date=None, end_date=None):
+        """기간 내 전체 건강 기록 (날짜순, 종료일 당일 포함)"""
+        if self.store is not None:
+            try:
+                records = self.store.between(start_date, end_date)
+                perf_monitor.record_io(rows_read=len(records))
+                return records
+            except Exception as e:
+                print(f"불러오기 오류: {e}")
+                return []
+        
+        low, high = date_bounds(start_date, end_date)
+        records = [r for r in self.load_records() if low <= r.get("date", "") <= high]
+        return sorted(records, key=lambda r: r.get("date", ""))
+    
+    def close(self):
+        """DB 연결 종료 (SQLite 모드)"""
+        if self.store is not None:
+            self.store.close()
+    
+    def _get_sample_dataset(self):
+        """컬럼 단위로 캐시된 샘플 데이터셋 반환 (파일 변경 시에만 다시 읽음)"""
         try:
-            with open(self.sample_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f, delimiter=";")
-                for row in reader:
-                    age_days = int(row.get("age", 0))
-                    age_years = age_days // 365
-                    gender = "여성" if row.get("gender") == "1" else "남성"
-                    
-                    samples.append({
-                        "id": row.get("id"),
-                        "age": age_years,
-                        "gender": gender,
-                        "height": int(row.get("height", 0)),
-                        "weight": float(row.get("weight", 0)),
-                        "ap_hi": int(row.get("ap_hi", 0)),
-                        "ap_lo": int(row.get("ap_lo", 0)),
-                        "cholesterol": int(row.get("cholesterol", 1)),
-                        "gluc": int(row.get("gluc", 1)),
-                        "smoke": int(row.get("smoke", 0)),
-                        "alco": int(row.get("alco", 0)),
-                        "active": int(row.get("active", 0)),
-                        "cardio": int(row.get("cardio", 0))
-                    })
+            return get_sample_dataset(self.sample_file, self.workers)
         except FileNotFoundError:
             print("샘플 데이터 파일을 찾을 수 없습니다.")
         except Exception as e:
             print(f"샘플 데이터 로드 오류: {e}")
-        return samples
+        return None
     
-    def get_statistics(self, gender=None):
-        """샘플 데이터 기반 통계 계산 (성별 필터 지원)"""
-        samples = self.load_sample_data()
-        
-        if not samples:
-            return None
+    def load_sample_data(self):
+        """Kaggle 샘플 데이터 불러오기 (형식이 잘못된 행이 있으면 그 행 앞까지 읽은 데이터)"""
+        dataset = self._get_sample_dataset()
+        if dataset is None:
+            return self._load_sample_prefix()
+        return dataset.to_records()
+    
+    def _load_sample_prefix(self):
+        """샘플 파일을 처음으로 형식 오류가 난 행 바로 앞까지 읽기 (파일이 없으면 빈 리스트)"""
+        columns = {name: array(code) for name, code in COLUMN_TYPES.items()}
+        try:
+            # 한 행씩 변환해 오류가 난 행 직전까지의 행을 모두 남김
+            for chunk in iter_csv_chunks(self.sample_file, chunk_rows=1):
+                for name, values in chunk.items():
+                    columns[name].extend(values)
+        except (OSError, ValueError, TypeError, IndexError, csv.Error):
+            pass
+        return SampleDataset(columns).to_records()
+    
+    def get_grouped_statistics(self, by="gender"):
+        """샘플 데이터 그룹별 통계 (한 번의 순회로 계산, 파일이 바뀔 때까지 캐시)"""
+        if self.streaming:
+            return self._get_streaming_statistics(by)
         
-        if gender:
-            samples = [s for s in samples if s["gender"] == gender]
+        dataset = self._get_sample_dataset()
         
-        if not samples:
+        if dataset is None or not len(dataset):
             return None
         
-        total = len(samples)
+        key = ("group_statistics", by)
+        if key not in dataset.derived:
+            dataset.derived[key] = group_statistics(dataset.columns, by)
+        return dataset.derived[key]
+    
+    def _get_streaming_statistics(self, by):
+        """스트리밍 방식 그룹별 통계 (일정 행씩 읽으며 누적, 파일이 바뀔 때까지 결과 캐시)"""
+        try:
+            stamp = file_stamp(self.sample_file)
+            cached = self._streaming_cache.get(by)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, streaming_statistics(self.sample_file, by))
+                self._streaming_cache[by] = cached
+        except FileNotFoundError:
+            print("샘플 데이터 파일을 찾을 수 없습니다.")
+            return None
+        except Exception as e:
+            print(f"샘플 데이터 로드 오류: {e}")
+            return None
         
-        avg_age = sum(s["age"] for s in samples) / total
-        avg_height = sum(s["height"] for s in samples) / total
-        avg_weight = sum(s["weight"] for s in samples) / total
-        avg_ap_hi = sum(s["ap_hi"] for s in samples) / total
-        avg_ap_lo = sum(s["ap_lo"] for s in samples) / total
+        result = cached[1]
+        return result if result["total"] else None
+    
+    def get_percentile_sketches(self):
+        """성별 × 연령대별 분위수 표 (샘플 파일이 바뀔 때만 다시 만들고 .percentiles.json으로 저장)"""
+        try:
+            stamp = file_stamp(self.sample_file)
+            if self._percentile_cache[0] != stamp:
+                dataset = None if self.streaming else self._get_sample_dataset()
+                self._percentile_cache = (stamp, get_sketches(self.sample_file, stamp, dataset))
+        except FileNotFoundError:
+            print("샘플 데이터 파일을 찾을 수 없습니다.")
+            return None
+        except Exception as e:
+            print(f"백분위 표 로드 오류: {e}")
+            return None
+        return self._percentile_cache[1]
+    
+    def get_percentile_ranks(self, user_data, gender):
+        """사용자 지표의 같은 성별·연령대 샘플 내 백분위 ({"group", "count", 지표: 백분위})"""
+        sketches = self.get_percentile_sketches()
+        if not sketches:
+            return None
         
-        bmi_list = []
-        for s in samples:
-            if s["height"] > 0:
-                bmi = s["weight"] / ((s["height"] / 100) ** 2)
-                bmi_list.append(bmi)
-        avg_bmi = sum(bmi_list) / len(bmi_list) if bmi_list else 0
+        label, group = find_group(sketches, gender, user_data.get("age"))
+        if group is None:
+            return None
         
-        cardio_count = sum(1 for s in samples if s["cardio"] == 1)
-        cardio_rate = (cardio_count / total) * 100
+        ranks = {"group": label, "count": group["count"]}
+        for metric in METRICS:
+            value = user_data.get(metric)
+            if value is not None:
+                ranks[metric] = percentile_rank(group["quantiles"][metric], value)
+        return ranks
+    
+    def get_statistics(self, gender=None):
+        """샘플 데이터 기반 통계 계산 (성별 필터 지원)"""
+        grouped = self.get_grouped_statistics("gender")
         
-        smoke_count = sum(1 for s in samples if s["smoke"] == 1)
-        smoke_rate = (smoke_count / total) * 100
+        if not grouped:
+            return None
         
-        high_chol_count = sum(1 for s in samples if s["cholesterol"] >= 2)
-        high_chol_rate = (high_chol_count / total) * 100
+        if gender:
+            stats = grouped["groups"].get(gender)
+        else:
+            stats = grouped["total"]
         
-        return {
-            "gender": gender if gender else "전체",
-            "total_samples": total,
-            "avg_age": round(avg_age, 1),
-            "avg_height": round(avg_height, 1),
-            "avg_weight": round(avg_weight, 1),
-            "avg_bmi": round(avg_bmi, 1),
-            "avg_ap_hi": round(avg_ap_hi, 1),
-            "avg_ap_lo": round(avg_ap_lo, 1),
-            "cardio_rate": round(cardio_rate, 1),
-            "smoke_rate": round(smoke_rate, 1),
-            "high_chol_rate": round(high_chol_rate, 1)
-        }
+        return dict(stats) if stats else None
     
     def get_gender_statistics(self):
         """남성/여성 각각의 통계 반환"""
@@ -237,4 +449,13 @@ class HealthDataManager:
         
         comparison["cardio_rate"] = stats["cardio_rate"]
         
+        # 같은 성별·연령대 샘플 내 백분위
+        ranks = self.get_percentile_ranks(user_data, gender)
+        if ranks:
+            comparison["percentile_group"] = ranks["group"]
+            comparison["percentile_count"] = ranks["count"]
+            for metric in METRICS:
+                if metric in comparison and ranks.get(metric) is not None:
+                    comparison[metric]["percentile"] = ranks[metric]
+        
         return comparison
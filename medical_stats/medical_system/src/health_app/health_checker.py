@@ -6,6 +6,9 @@ Author: KDT12 Python Project
 Date: 2026-01-09
 """
 
+from array import array
+from bisect import bisect_left, bisect_right
+
 
 class HealthChecker:
     """
@@ -14,6 +17,48 @@ class HealthChecker:
     BMI, 혈압, 심혈관 위험도를 계산하고 건강 조언을 제공
     """
     
+    # BMI 판정 구간 (아시아-태평양 기준, 상한 미만이면 해당 단계)
+    BMI_LIMITS = (18.5, 23, 25, 30)
+    BMI_LEVELS = (
+        ("저체중", "#3498db"),
+        ("정상", "#27ae60"),
+        ("과체중", "#f39c12"),
+        ("비만", "#e74c3c"),
+        ("고도비만", "#8e44ad")
+    )
+    BMI_UNMEASURABLE = (0, "측정 불가", "#95a5a6")
+    
+    # 혈압 분류 (_blood_pressure의 판정 순서)
+    BP_LEVELS = (
+        ("저혈압", "혈압이 낮습니다", "#3498db"),
+        ("정상", "정상 혈압입니다", "#27ae60"),
+        ("주의", "혈압 상승 경향", "#2ecc71"),
+        ("고혈압 전단계", "관리가 필요합니다", "#f39c12"),
+        ("고혈압 1기", "의료 상담 권장", "#e67e22"),
+        ("고혈압 2기", "즉시 의료 상담 필요", "#e74c3c")
+    )
+    
+    # 위험도 배점 (나이/BMI는 구간 하한 이상이면 해당 점수, BMI는 반올림한 값 기준)
+    AGE_LIMITS = (40, 50, 60, 70)
+    AGE_POINTS = (0, 5, 10, 15, 20)
+    BMI_POINTS = (5, 0, 10, 15, 20)         # BMI_LIMITS 구간별
+    CHOLESTEROL_POINTS = {2: 10, 3: 15}
+    GLUC_POINTS = {2: 5, 3: 10}
+    SMOKE_POINTS = 15
+    ALCO_POINTS = 5
+    INACTIVE_POINTS = 10
+    
+    # 위험도 등급 구간 (점수 상한 이하이면 해당 등급)
+    RISK_GRADE_LIMITS = (20, 40, 60, 80)
+    RISK_LEVELS = (
+        ("낮음", "심혈관 건강이 양호합니다", "#27ae60"),
+        ("보통", "생활 습관 개선을 권장합니다", "#2ecc71"),
+        ("높음", "적극적인 건강 관리가 필요합니다", "#f39c12"),
+        ("매우 높음", "의료 상담을 권장합니다", "#e67e22"),
+        ("위험", "즉시 의료 상담이 필요합니다", "#e74c3c")
+    )
+    RISK_GRADES = tuple(level[0] for level in RISK_LEVELS)
+    
     def __init__(self, age, gender, height, weight, ap_hi, ap_lo,
                  cholesterol=1, gluc=1, smoke=0, alco=0, active=1):
         """생성자: 건강 데이터 초기화"""
@@ -31,131 +76,80 @@ class HealthChecker:
     
     def calculate_bmi(self):
         """BMI 계산 및 판정"""
-        if self.height <= 0:
-            return (0, "측정 불가", "#95a5a6")
-        
-        height_m = self.height / 100
-        bmi = self.weight / (height_m ** 2)
-        
-        # 아시아-태평양 기준
-        if bmi < 18.5:
-            status = "저체중"
-            color = "#3498db"
-        elif bmi < 23:
-            status = "정상"
-            color = "#27ae60"
-        elif bmi < 25:
-            status = "과체중"
-            color = "#f39c12"
-        elif bmi < 30:
-            status = "비만"
-            color = "#e74c3c"
-        else:
-            status = "고도비만"
-            color = "#8e44ad"
-        
-        return (round(bmi, 1), status, color)
+        return self._bmi(self.height, self.weight)
     
     def analyze_blood_pressure(self):
         """혈압 분석"""
-        ap_hi = self.ap_hi
-        ap_lo = self.ap_lo
-        
+        return self._blood_pressure(self.ap_hi, self.ap_lo)
+    
+    def calculate_risk_score(self):
+        """심혈관 위험도 점수 계산 (100점 만점)"""
+        bmi, _, _ = self.calculate_bmi()
+        score = self._risk_score(self.age, bmi, self.ap_hi, self.ap_lo, self.cholesterol,
+                                 self.gluc, self.smoke, self.alco, self.active)
+        return (score,) + self._risk_level(score)
+    
+    # ==================== 판정 기준 (개별 메서드와 score_batch 공용) ====================
+    
+    @classmethod
+    def _bmi(cls, height, weight):
+        """키/몸무게 → (BMI 값, 판정 결과, 색상 코드)"""
+        if height <= 0:
+            return cls.BMI_UNMEASURABLE
+        bmi = weight / ((height / 100) ** 2)
+        status, color = cls.BMI_LEVELS[bisect_right(cls.BMI_LIMITS, bmi)]
+        return (round(bmi, 1), status, color)
+    
+    @classmethod
+    def _blood_pressure(cls, ap_hi, ap_lo):
+        """수축기/이완기 혈압 → (분류, 설명, 색상 코드)"""
         if ap_hi < 90 or ap_lo < 60:
-            return ("저혈압", "혈압이 낮습니다", "#3498db")
+            level = 0
         elif ap_hi < 120 and ap_lo < 80:
-            return ("정상", "정상 혈압입니다", "#27ae60")
+            level = 1
         elif ap_hi < 130 and ap_lo < 80:
-            return ("주의", "혈압 상승 경향", "#2ecc71")
+            level = 2
         elif ap_hi < 140 or ap_lo < 90:
-            return ("고혈압 전단계", "관리가 필요합니다", "#f39c12")
+            level = 3
         elif ap_hi < 160 or ap_lo < 100:
-            return ("고혈압 1기", "의료 상담 권장", "#e67e22")
+            level = 4
         else:
-            return ("고혈압 2기", "즉시 의료 상담 필요", "#e74c3c")
+            level = 5
+        return cls.BP_LEVELS[level]
     
-    def calculate_risk_score(self):
-        """심혈관 위험도 점수 계산 (100점 만점)"""
-        score = 0
-        
-        # 나이 (최대 20점)
-        if self.age >= 70:
-            score += 20
-        elif self.age >= 60:
-            score += 15
-        elif self.age >= 50:
-            score += 10
-        elif self.age >= 40:
-            score += 5
-        
-        # BMI (최대 20점)
-        bmi, _, _ = self.calculate_bmi()
-        if bmi >= 30:
-            score += 20
-        elif bmi >= 25:
-            score += 15
-        elif bmi >= 23:
-            score += 10
-        elif bmi < 18.5:
-            score += 5
-        
-        # 혈압 (최대 25점)
-        if self.ap_hi >= 160 or self.ap_lo >= 100:
-            score += 25
-        elif self.ap_hi >= 140 or self.ap_lo >= 90:
-            score += 20
-        elif self.ap_hi >= 130:
-            score += 15
-        elif self.ap_hi >= 120:
-            score += 10
-        
-        # 콜레스테롤 (최대 15점)
-        if self.cholesterol == 3:
-            score += 15
-        elif self.cholesterol == 2:
-            score += 10
-        
-        # 혈당 (최대 10점)
-        if self.gluc == 3:
-            score += 10
-        elif self.gluc == 2:
-            score += 5
-        
-        # 흡연 (15점)
-        if self.smoke:
-            score += 15
-        
-        # 음주 (5점)
-        if self.alco:
-            score += 5
-        
-        # 운동 부족 (10점)
-        if not self.active:
-            score += 10
-        
-        # 등급 판정
-        if score <= 20:
-            grade = "낮음"
-            desc = "심혈관 건강이 양호합니다"
-            color = "#27ae60"
-        elif score <= 40:
-            grade = "보통"
-            desc = "생활 습관 개선을 권장합니다"
-            color = "#2ecc71"
-        elif score <= 60:
-            grade = "높음"
-            desc = "적극적인 건강 관리가 필요합니다"
-            color = "#f39c12"
-        elif score <= 80:
-            grade = "매우 높음"
-            desc = "의료 상담을 권장합니다"
-            color = "#e67e22"
-        else:
-            grade = "위험"
-            desc = "즉시 의료 상담이 필요합니다"
-            color = "#e74c3c"
-        
-        return (score, grade, desc, color)
+    @staticmethod
+    def _bp_points(ap_hi, ap_lo):
+        """혈압 위험도 점수 (최대 25점, 혈압 분류와 별도 기준)"""
+        if ap_hi >= 160 or ap_lo >= 100:
+            return 25
+        elif ap_hi >= 140 or ap_lo >= 90:
+            return 20
+        elif ap_hi >= 130:
+            return 15
+        elif ap_hi >= 120:
+            return 10
+        return 0
+    
+    @classmethod
+    def _risk_score(cls, age, bmi, ap_hi, ap_lo, cholesterol, gluc, smoke, alco, active):
+        """위험 요인 → 심혈관 위험도 점수 (bmi는 반올림한 BMI 값)"""
+        score = cls.AGE_POINTS[bisect_right(cls.AGE_LIMITS, age)]
+        score += cls.BMI_POINTS[bisect_right(cls.BMI_LIMITS, bmi)]
+        score += cls._bp_points(ap_hi, ap_lo)
+        score += cls.CHOLESTEROL_POINTS.get(cholesterol, 0)
+        score += cls.GLUC_POINTS.get(gluc, 0)
+        if smoke:
+            score += cls.SMOKE_POINTS
+        if alco:
+            score += cls.ALCO_POINTS
+        if not active:
+            score += cls.INACTIVE_POINTS
+        return score
+    
+    @classmethod
+    def _risk_level(cls, score):
+        """위험도 점수 → (등급, 설명, 색상 코드)"""
+        return cls.RISK_LEVELS[bisect_left(cls.RISK_GRADE_LIMITS, score)]
     
     def get_health_advice(self):
         """건강 조언 생성"""
@@ -200,6 +194,58 @@ class HealthChecker:
         
         return advice
     
+    @classmethod
+    def score_batch(cls, columns):
+        """
+        여러 명의 BMI/혈압/위험도를 한 번에 계산 (컬럼 단위 일괄 처리)
+        
+        객체를 만들지 않고 컬럼을 순회하며 개별 메서드와 같은 판정 함수(_bmi 등)를 사용
+        
+        Args:
+            columns: 컬럼명 → 시퀀스 딕셔너리 또는 SampleDataset
+        
+        Returns:
+            dict: {"bmi", "bmi_status", "bp_status", "risk_score", "risk_grade"}
+        """
+        if hasattr(columns, "columns"):
+            columns = columns.columns
+        
+        bmi_out = array("d")
+        bmi_status_out = []
+        bp_out = []
+        score_out = array("h")
+        grade_out = []
+        
+        rows = zip(
+            columns["age"], columns["height"], columns["weight"],
+            columns["ap_hi"], columns["ap_lo"],
+            columns["cholesterol"], columns["gluc"],
+            columns["smoke"], columns["alco"], columns["active"]
+        )
+        bmi_of = cls._bmi
+        bp_of = cls._blood_pressure
+        risk_score = cls._risk_score
+        grade_limits = cls.RISK_GRADE_LIMITS
+        grades = cls.RISK_GRADES
+        for age, height, weight, ap_hi, ap_lo, chol, gluc, smoke, alco, active in rows:
+            bmi, bmi_status, _ = bmi_of(height, weight)
+            bp_status = bp_of(ap_hi, ap_lo)[0]
+            score = risk_score(age, bmi, ap_hi, ap_lo, chol, gluc, smoke, alco, active)
+            
+            bmi_out.append(bmi)
+            bmi_status_out.append(bmi_status)
+            bp_out.append(bp_status)
+            score_out.append(score)
+            grade_out.append(grades[bisect_left(grade_limits, score)])
+        
+        return {
+            "bmi": bmi_out,
+            "bmi_status": bmi_status_out,
+            "bp_status": bp_out,
+            "risk_score": score_out,
+            "risk_grade": grade_out
+        }
+    
     def to_dict(self):
         """딕셔너리로 변환"""
         bmi, _, _ = self.calculate_bmi()
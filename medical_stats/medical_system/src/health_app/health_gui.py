@@ -488,6 +488,11 @@ class HealthCheckApp(Toplevel):
             messagebox.showerror("입력 오류", f"올바른 값을 입력하세요.\n{str(e)}")
             return False
     
+    def percentile_text(self, comp):
+        """비교 항목의 백분위 표시 문자열 (백분위가 없으면 빈 문자열)"""
+        percentile = comp.get("percentile")
+        return f" · 백분위 {percentile}" if percentile is not None else ""
+    
     def analyze(self):
         """건강 분석"""
         if not self.validate_inputs():
@@ -538,22 +543,25 @@ class HealthCheckApp(Toplevel):
         comparison = self.data_manager.compare_with_gender_average(user_data, gender)
         
         if comparison:
-            comparison_text = f"📊 {gender} 평균 대비 (샘플 {comparison['sample_count']}명)\n\n"
+            comparison_text = f"📊 {gender} 평균 대비 (샘플 {comparison['sample_count']}명)\n"
+            if comparison.get("percentile_group"):
+                comparison_text += f"   백분위 기준: {comparison['percentile_group']} (샘플 {comparison['percentile_count']}명)\n"
+            comparison_text += "\n"
             
             bmi_comp = comparison["bmi"]
             bmi_icon = "🔴" if bmi_comp["status"] == "higher" and bmi_comp["diff"] > 2 else "🟢" if bmi_comp["status"] == "lower" else "🟡"
-            comparison_text += f"{bmi_icon} BMI: {bmi_comp['user']} (평균 {bmi_comp['avg']}) → {bmi_comp['text']}\n"
+            comparison_text += f"{bmi_icon} BMI: {bmi_comp['user']} (평균 {bmi_comp['avg']}) → {bmi_comp['text']}{self.percentile_text(bmi_comp)}\n"
             
             height_comp = comparison["height"]
-            comparison_text += f"📏 키: {height_comp['user']}cm (평균 {height_comp['avg']}cm) → {height_comp['text']}\n"
+            comparison_text += f"📏 키: {height_comp['user']}cm (평균 {height_comp['avg']}cm) → {height_comp['text']}{self.percentile_text(height_comp)}\n"
             
             weight_comp = comparison["weight"]
             weight_icon = "🔴" if weight_comp["status"] == "higher" and weight_comp["diff"] > 5 else "🟢" if weight_comp["status"] == "lower" else "🟡"
-            comparison_text += f"{weight_icon} 몸무게: {weight_comp['user']}kg (평균 {weight_comp['avg']}kg) → {weight_comp['text']}\n"
+            comparison_text += f"{weight_icon} 몸무게: {weight_comp['user']}kg (평균 {weight_comp['avg']}kg) → {weight_comp['text']}{self.percentile_text(weight_comp)}\n"
             
             bp_comp = comparison["ap_hi"]
             bp_icon = "🔴" if bp_comp["status"] == "higher" and bp_comp["diff"] > 10 else "🟢" if bp_comp["status"] == "lower" else "🟡"
-            comparison_text += f"{bp_icon} 수축기 혈압: {bp_comp['user']}mmHg (평균 {bp_comp['avg']}mmHg) → {bp_comp['text']}\n"
+            comparison_text += f"{bp_icon} 수축기 혈압: {bp_comp['user']}mmHg (평균 {bp_comp['avg']}mmHg) → {bp_comp['text']}{self.percentile_text(bp_comp)}\n"
             
             comparison_text += f"\n⚠️ {gender} 심혈관 질환 비율: {comparison['cardio_rate']}%"
             
@@ -0,0 +1,182 @@
+"""
+record_store.py
+건강 기록 SQLite 저장소
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import csv
+import os
+import sqlite3
+
+
+# 한 번에 넣는 기록 수 (일괄 등록/이전 시)
+BATCH_SIZE = 1000
+
+
+def date_bounds(start_date=None, end_date=None):
+    """
+    날짜 범위 → 비교용 (하한, 상한) 문자열
+
+    기록 날짜는 "YYYY-MM-DD HH:MM" 형식이므로 end_date가 "YYYY-MM-DD"이면
+    그날 기록 전체가 포함되도록 상한 뒤에 가장 큰 문자를 붙임
+    """
+    return (start_date or "", (end_date or "") + "\uffff")
+
+
+class HealthRecordStore:
+    """
+    건강 기록을 SQLite 파일에 저장하는 클래스
+
+    (patient_id, date), name 인덱스로 환자별/이름별/기간별 조회 시
+    전체 기록을 읽지 않음. 값은 CSV와 같이 문자열로 저장하여
+    load_records() 결과가 CSV 방식과 동일함
+
+    쓰기마다 record_meta 테이블의 변경 횟수를 같은 트랜잭션에서 올려 두므로
+    stamp()는 전체 기록을 세지 않고 (변경 횟수, 마지막 rowid)로 변경을 감지
+
+    Attributes:
+        db_path (str): DB 파일 경로
+        fieldnames (list): 컬럼 순서 (CSV 헤더와 동일)
+    """
+
+    def __init__(self, db_path, fieldnames):
+        """생성자: DB 연결 및 테이블/인덱스 생성"""
+        self.db_path = db_path
+        self.fieldnames = list(fieldnames)
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        columns = ", ".join(f"{name} TEXT NOT NULL DEFAULT ''" for name in self.fieldnames)
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS health_records ({columns})")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_records_patient_date "
+                "ON health_records(patient_id, date)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_records_name ON health_records(name)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_records_date ON health_records(date)")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS record_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            self.conn.execute("INSERT OR IGNORE INTO record_meta VALUES ('changes', 0)")
+
+        placeholders = ", ".join("?" for _ in self.fieldnames)
+        self._insert_sql = (
+            f"INSERT INTO health_records ({', '.join(self.fieldnames)}) VALUES ({placeholders})"
+        )
+        self._select_sql = f"SELECT {', '.join(self.fieldnames)} FROM health_records"
+
+    def _values(self, record):
+        """딕셔너리 → 컬럼 순서 문자열 튜플"""
+        values = (record.get(name) for name in self.fieldnames)
+        return tuple("" if value is None else str(value) for value in values)
+
+    def _query(self, where="", params=(), order="rowid"):
+        """조건에 맞는 기록 딕셔너리 리스트"""
+        sql = self._select_sql
+        if where:
+            sql += f" WHERE {where}"
+        cursor = self.conn.execute(f"{sql} ORDER BY {order}", params)
+        return [dict(row) for row in cursor]
+
+    # ==================== 쓰기 ====================
+
+    def _count_changes(self, count):
+        """변경 횟수 증가 (쓰기와 같은 트랜잭션 안에서 호출)"""
+        self.conn.execute("UPDATE record_meta SET value = value + ? WHERE key = 'changes'", (count,))
+
+    def add(self, record):
+        """기록 하나 추가"""
+        with self.conn:
+            self.conn.execute(self._insert_sql, self._values(record))
+            self._count_changes(1)
+
+    def add_many(self, records):
+        """
+        여러 기록을 BATCH_SIZE개씩 묶어 추가 (묶음마다 트랜잭션 1회)
+
+        Returns:
+            int: 추가한 기록 수
+        """
+        added = 0
+        batch = []
+        for record in records:
+            batch.append(self._values(record))
+            if len(batch) >= BATCH_SIZE:
+                with self.conn:
+                    self.conn.executemany(self._insert_sql, batch)
+                    self._count_changes(len(batch))
+                added += len(batch)
+                batch = []
+        if batch:
+            with self.conn:
+                self.conn.executemany(self._insert_sql, batch)
+                self._count_changes(len(batch))
+            added += len(batch)
+        return added
+
+    def close(self):
+        """DB 연결 종료"""
+        self.conn.close()
+
+    # ==================== 조회 ====================
+
+    def stamp(self):
+        """
+        변경 감지용 값 (변경 횟수, 마지막 rowid)
+
+        COUNT(*)는 테이블 전체를 훑으므로 쓰지 않음 (MAX(rowid)는 B-트리 끝만 읽음)
+        """
+        return tuple(self.conn.execute(
+            "SELECT (SELECT value FROM record_meta WHERE key = 'changes'), "
+            "(SELECT MAX(rowid) FROM health_records)"
+        ).fetchone())
+
+    def is_empty(self):
+        """기록이 하나도 없는지 여부"""
+        return self.conn.execute("SELECT 1 FROM health_records LIMIT 1").fetchone() is None
+
+    def load_all(self):
+        """전체 기록 (저장 순서)"""
+        return self._query()
+
+    def by_patient(self, patient_id, start_date=None, end_date=None):
+        """환자 ID의 기록 (날짜순, 기간 지정 가능)"""
+        low, high = date_bounds(start_date, end_date)
+        return self._query(
+            "patient_id = ? AND date >= ? AND date <= ?",
+            (patient_id, low, high),
+            order="date, rowid"
+        )
+
+    def by_name(self, name):
+        """이름이 같은 기록 (저장 순서)"""
+        return self._query("name = ?", (name,))
+
+    def between(self, start_date=None, end_date=None):
+        """기간 내 전체 기록 (날짜순)"""
+        low, high = date_bounds(start_date, end_date)
+        return self._query("date >= ? AND date <= ?", (low, high), order="date, rowid")
+
+
+def migrate_csv(csv_path, db_path, fieldnames):
+    """
+    건강 기록 CSV 파일을 SQLite DB로 이전 (DB가 비어 있을 때만)
+
+    Returns:
+        int: 이전한 기록 수
+    """
+    store = HealthRecordStore(db_path, fieldnames)
+    try:
+        if not store.is_empty():
+            return 0
+        with open(csv_path, "r", encoding="utf-8") as f:
+            return store.add_many(csv.DictReader(f))
+    finally:
+        store.close()
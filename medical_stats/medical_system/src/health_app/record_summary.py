@@ -0,0 +1,122 @@
+"""
+record_summary.py
+건강 기록 누적 통계 (사이드카 파일)
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import json
+import math
+import os
+
+
+class RecordSummary:
+    """
+    건강 기록 파일의 누적 통계를 보관하는 클래스
+
+    기록이 추가될 때마다 개수/합계/제곱합/최소/최대를 O(1)로 갱신하여
+    전체 파일을 다시 읽지 않고 평균과 분산을 계산
+    """
+
+    # 누적 대상 숫자 필드
+    FIELDS = ("age", "height", "weight", "ap_hi", "ap_lo", "bmi", "risk_score")
+
+    def __init__(self, stamp=None):
+        """생성자: 누적값 초기화"""
+        self.stamp = stamp
+        self.count = 0
+        self.linked = 0
+        self.fields = {
+            name: {"n": 0, "sum": 0.0, "sum_sq": 0.0, "min": None, "max": None}
+            for name in self.FIELDS
+        }
+
+    def add(self, record):
+        """
+        기록 하나 누적
+
+        Args:
+            record (dict): 건강 기록 (CSV 행 또는 저장할 데이터)
+        """
+        self.count += 1
+        if record.get("patient_id"):
+            self.linked += 1
+
+        for name in self.FIELDS:
+            try:
+                value = float(record.get(name, 0))
+            except (ValueError, TypeError):
+                continue
+            acc = self.fields[name]
+            acc["n"] += 1
+            acc["sum"] += value
+            acc["sum_sq"] += value * value
+            if acc["min"] is None or value < acc["min"]:
+                acc["min"] = value
+            if acc["max"] is None or value > acc["max"]:
+                acc["max"] = value
+
+    def mean(self, name):
+        """필드 평균 (기록이 없으면 0)"""
+        acc = self.fields[name]
+        return acc["sum"] / acc["n"] if acc["n"] else 0
+
+    def variance(self, name):
+        """필드 모분산 (기록이 없으면 0)"""
+        acc = self.fields[name]
+        if not acc["n"]:
+            return 0
+        mean = acc["sum"] / acc["n"]
+        return max(acc["sum_sq"] / acc["n"] - mean * mean, 0.0)
+
+    def to_dict(self):
+        """
+        통계 딕셔너리로 변환
+
+        Returns:
+            dict: {"count", "linked", "fields": {필드: {mean, std, min, max, ...}}}
+        """
+        fields = {}
+        for name, acc in self.fields.items():
+            fields[name] = dict(acc)
+            fields[name]["mean"] = self.mean(name)
+            fields[name]["std"] = math.sqrt(self.variance(name))
+        return {
+            "count": self.count,
+            "linked": self.linked,
+            "fields": fields
+        }
+
+    def save(self, path):
+        """사이드카 파일에 저장 (임시 파일 작성 후 교체)"""
+        data = {
+            "stamp": list(self.stamp) if self.stamp else None,
+            "count": self.count,
+            "linked": self.linked,
+            "fields": self.fields
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        사이드카 파일에서 불러오기
+
+        Returns:
+            RecordSummary or None: 파일이 없거나 손상되었으면 None
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            summary = cls(tuple(data["stamp"]) if data.get("stamp") else None)
+            summary.count = data["count"]
+            summary.linked = data["linked"]
+            for name in cls.FIELDS:
+                summary.fields[name].update(data["fields"][name])
+            return summary
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
@@ -0,0 +1,387 @@
+"""
+sample_dataset.py
+Kaggle 샘플 데이터 컬럼 캐시 클래스
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+데이터 출처: Kaggle - Cardiovascular Disease Dataset
+"""
+
+import csv
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import perf_monitor
+
+
+# 컬럼별 저장 타입 (array 모듈 typecode)
+COLUMN_TYPES = {
+    "id": "q",
+    "age": "h",
+    "gender": "b",
+    "height": "h",
+    "weight": "d",
+    "ap_hi": "i",
+    "ap_lo": "i",
+    "cholesterol": "b",
+    "gluc": "b",
+    "smoke": "b",
+    "alco": "b",
+    "active": "b",
+    "cardio": "b"
+}
+
+# 성별 코드 (Kaggle 원본 형식: 1 여성, 2 남성)
+GENDER_CODES = {"여성": 1, "남성": 2}
+GENDER_LABELS = {1: "여성", 2: "남성"}
+
+# 스트리밍 읽기 시 한 번에 읽는 행 수
+CHUNK_ROWS = 50_000
+
+# 이보다 작은 파일은 프로세스를 띄우는 비용이 더 커서 한 프로세스로 읽음
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+# 바이너리 컬럼 파일 형식: MAGIC(8) + 헤더 길이(uint32) + JSON 헤더 + 8바이트 정렬된 컬럼 데이터
+MAGIC = b"KCVDCOL1"
+HEADER_LEN = struct.Struct("<I")
+
+
+class SampleDataset:
+    """
+    Kaggle 샘플 데이터를 컬럼 단위로 보관하는 클래스
+
+    행마다 딕셔너리를 만드는 대신 컬럼마다 타입이 고정된 배열 하나를 사용
+
+    Attributes:
+        columns (dict): 컬럼명 → array (바이너리 파일에서 열면 memoryview)
+        stamp (tuple): 원본 파일의 (크기, 수정시각)
+        derived (dict): 이 데이터셋에서 계산한 결과 캐시 (파일이 바뀌면 함께 폐기)
+    """
+
+    def __init__(self, columns, stamp=None):
+        """생성자: 컬럼 배열 설정"""
+        self.columns = columns
+        self.stamp = stamp
+        self.derived = {}
+
+    def __len__(self):
+        return len(self.columns["id"])
+
+    @classmethod
+    def from_csv(cls, file_path, workers=None):
+        """
+        세미콜론 구분 CSV 파일에서 데이터셋 생성
+
+        Args:
+            file_path (str): 샘플 데이터 파일 경로
+            workers (int, optional): 파싱 작업 프로세스 수 (read_csv_columns() 참고)
+
+        Returns:
+            SampleDataset: 컬럼 데이터셋
+        """
+        stamp = file_stamp(file_path)
+        columns = read_csv_columns(file_path, workers)
+        perf_monitor.read_file(file_path, len(columns["id"]))
+        return cls(columns, stamp)
+
+    @classmethod
+    def from_binary(cls, bin_path, source_stamp=None):
+        """
+        바이너리 컬럼 파일을 mmap으로 열어 데이터셋 생성
+
+        각 컬럼은 mmap 영역을 가리키는 memoryview로, 데이터를 복사하지 않음
+        (파일 생성은 sample_binary.py 참고)
+
+        Args:
+            bin_path (str): 바이너리 파일 경로
+            source_stamp (tuple, optional): 현재 CSV의 (크기, 수정시각).
+                주어지면 변환 당시 원본과 다를 때 None 반환
+
+        Returns:
+            SampleDataset or None: 파일이 없거나 형식/원본이 맞지 않거나 잘린 파일이면 None
+        """
+        try:
+            with open(bin_path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    return None
+                size = HEADER_LEN.unpack(f.read(HEADER_LEN.size))[0]
+                header = json.loads(f.read(size).decode("utf-8"))
+                if header.get("byteorder") != sys.byteorder:
+                    return None
+                source = (header["source"]["size"], header["source"]["mtime_ns"])
+                if source_stamp is not None and source != tuple(source_stamp):
+                    return None
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+
+        # 컬럼 위치를 먼저 모두 검사 (저장 중 종료 등으로 잘린 파일이면 None)
+        try:
+            rows = header["rows"]
+            layout = []
+            for col in header["columns"]:
+                start = col["offset"]
+                end = start + rows * struct.calcsize(col["type"])
+                if rows < 0 or start < 0 or end > len(mm):
+                    raise ValueError(f"'{col['name']}' 컬럼이 파일 끝을 넘습니다.")
+                layout.append((col["name"], col["type"], start, end))
+        except (KeyError, TypeError, ValueError, struct.error):
+            mm.close()
+            return None
+
+        view = memoryview(mm)
+        columns = {}
+        for name, typecode, start, end in layout:
+            columns[name] = view[start:end].cast(typecode)
+
+        return cls(columns, source)
+
+    def to_records(self):
+        """
+        기존 load_sample_data() 형식의 딕셔너리 리스트로 변환
+
+        Returns:
+            list: 샘플 데이터 딕셔너리 리스트
+        """
+        c = self.columns
+        return [
+            {
+                "id": str(c["id"][i]),
+                "age": c["age"][i],
+                "gender": GENDER_LABELS[c["gender"][i]],
+                "height": c["height"][i],
+                "weight": c["weight"][i],
+                "ap_hi": c["ap_hi"][i],
+                "ap_lo": c["ap_lo"][i],
+                "cholesterol": c["cholesterol"][i],
+                "gluc": c["gluc"][i],
+                "smoke": c["smoke"][i],
+                "alco": c["alco"][i],
+                "active": c["active"][i],
+                "cardio": c["cardio"][i]
+            }
+            for i in range(len(self))
+        ]
+
+
+def iter_csv_chunks(file_path, chunk_rows=CHUNK_ROWS):
+    """
+    세미콜론 구분 CSV 파일을 chunk_rows행씩 컬럼 배열로 읽기
+
+    파일 전체를 메모리에 올리지 않으므로 파일 크기와 관계없이
+    한 번에 chunk_rows행 분량만 메모리를 사용
+
+    Args:
+        file_path (str): 샘플 데이터 파일 경로
+        chunk_rows (int): 한 번에 읽을 행 수
+
+    Yields:
+        dict: 컬럼명 → array (최대 chunk_rows행)
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=";")
+        header = next(reader, None)
+        if header is None:
+            return
+        yield from parse_rows(reader, header, chunk_rows)
+
+
+def parse_rows(reader, header, chunk_rows=None):
+    """
+    csv.reader 행들을 chunk_rows행씩 컬럼 배열로 변환
+
+    Args:
+        reader (iterable): 필드 리스트(행)들
+        header (list): 컬럼명 목록 (CSV 첫 줄)
+        chunk_rows (int, optional): 한 번에 넘길 행 수 (None이면 모든 행을 한 번에)
+
+    Yields:
+        dict: 컬럼명 → array
+    """
+    pos = {name: i for i, name in enumerate(header)}
+
+    def getter(name, default):
+        # 컬럼이 없으면 기본값을 돌려주는 읽기 함수
+        i = pos.get(name)
+        if i is None:
+            return lambda row: default
+        return lambda row: row[i]
+
+    get_id = getter("id", "0")
+    get_age = getter("age", "0")
+    get_gender = getter("gender", "")
+    get_height = getter("height", "0")
+    get_weight = getter("weight", "0")
+    get_ap_hi = getter("ap_hi", "0")
+    get_ap_lo = getter("ap_lo", "0")
+    get_chol = getter("cholesterol", "1")
+    get_gluc = getter("gluc", "1")
+    get_smoke = getter("smoke", "0")
+    get_alco = getter("alco", "0")
+    get_active = getter("active", "0")
+    get_cardio = getter("cardio", "0")
+
+    columns = {name: array(code) for name, code in COLUMN_TYPES.items()}
+    rows = 0
+    for row in reader:
+        if not row:
+            continue
+        columns["id"].append(int(get_id(row)))
+        # 나이를 일(days)에서 년(years)으로 변환
+        columns["age"].append(int(get_age(row)) // 365)
+        columns["gender"].append(1 if get_gender(row) == "1" else 2)
+        columns["height"].append(int(get_height(row)))
+        columns["weight"].append(float(get_weight(row)))
+        columns["ap_hi"].append(int(get_ap_hi(row)))
+        columns["ap_lo"].append(int(get_ap_lo(row)))
+        columns["cholesterol"].append(int(get_chol(row)))
+        columns["gluc"].append(int(get_gluc(row)))
+        columns["smoke"].append(int(get_smoke(row)))
+        columns["alco"].append(int(get_alco(row)))
+        columns["active"].append(int(get_active(row)))
+        columns["cardio"].append(int(get_cardio(row)))
+
+        rows += 1
+        if rows == chunk_rows:
+            yield columns
+            columns = {name: array(code) for name, code in COLUMN_TYPES.items()}
+            rows = 0
+
+    if rows:
+        yield columns
+
+
+def split_ranges(file_path, parts):
+    """
+    헤더 다음부터 파일 끝까지를 줄바꿈 경계에 맞춘 바이트 구간으로 나누기
+
+    Args:
+        file_path (str): 샘플 데이터 파일 경로
+        parts (int): 나눌 구간 수 (행이 적으면 더 적게 나뉨)
+
+    Returns:
+        tuple: (컬럼명 목록, [(시작, 끝), ...]) (빈 파일이면 (None, []))
+    """
+    with open(file_path, "rb") as f:
+        header_line = f.readline()
+        if not header_line:
+            return None, []
+        header = next(csv.reader([header_line.decode("utf-8")], delimiter=";"))
+
+        data_start = f.tell()
+        size = os.fstat(f.fileno()).st_size
+        bounds = [data_start]
+        for i in range(1, parts):
+            # 나눌 위치가 줄 중간이면 그 줄 끝까지 앞 구간에 포함
+            f.seek(max(data_start + (size - data_start) * i // parts - 1, bounds[-1]))
+            f.readline()
+            offset = f.tell()
+            if offset >= size:
+                break
+            if offset > bounds[-1]:
+                bounds.append(offset)
+        bounds.append(size)
+
+    return header, [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _parse_range(file_path, header, start, end):
+    """작업 프로세스: 바이트 구간 [start, end)의 행을 컬럼 배열로 변환 (행이 없으면 None)"""
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    reader = csv.reader(io.StringIO(text, newline=""), delimiter=";")
+    return next(parse_rows(reader, header), None)
+
+
+def read_csv_columns(file_path, workers=None, min_bytes=PARALLEL_MIN_BYTES):
+    """
+    CSV 파일 전체를 컬럼 배열로 읽기 (큰 파일은 여러 프로세스로 나눠 파싱)
+
+    파일을 줄바꿈 경계의 바이트 구간으로 나눠 프로세스마다 한 구간씩 파싱하고
+    구간 순서대로 이어 붙이므로 결과는 한 프로세스로 읽을 때와 같음
+    (따옴표 안에 줄바꿈이 있는 CSV는 지원하지 않음 - Kaggle 원본 형식은 해당 없음)
+
+    Args:
+        file_path (str): 샘플 데이터 파일 경로
+        workers (int, optional): 작업 프로세스 수 (None이면 CPU 수, 1 이하이면 한 프로세스)
+        min_bytes (int): 이보다 작은 파일은 한 프로세스로 읽음
+
+    Returns:
+        dict: 컬럼명 → array
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or os.path.getsize(file_path) < min_bytes:
+        chunks = iter_csv_chunks(file_path)
+    else:
+        header, ranges = split_ranges(file_path, workers)
+        starts = [start for start, _ in ranges]
+        ends = [end for _, end in ranges]
+        with ProcessPoolExecutor(max_workers=max(len(ranges), 1)) as pool:
+            chunks = list(pool.map(_parse_range, repeat(file_path), repeat(header), starts, ends))
+
+    columns = {name: array(code) for name, code in COLUMN_TYPES.items()}
+    for chunk in chunks:
+        if chunk is None:
+            continue
+        for name, values in chunk.items():
+            columns[name].extend(values)
+    return columns
+
+
+def binary_path_for(csv_path):
+    """CSV 파일에 대응하는 바이너리 컬럼 파일 경로"""
+    return os.path.splitext(csv_path)[0] + ".bin"
+
+
+def file_stamp(file_path):
+    """파일 변경 감지용 (크기, 수정시각) 반환"""
+    st = os.stat(file_path)
+    return (st.st_size, st.st_mtime_ns)
+
+
+# 파일 경로별 캐시: {절대경로: SampleDataset}
+_cache = {}
+
+
+def get_sample_dataset(file_path, workers=None):
+    """
+    캐시된 샘플 데이터셋 반환 (파일 크기/수정시각이 바뀌면 다시 로드)
+
+    같은 이름의 바이너리 컬럼 파일(.bin)이 원본과 일치하면 mmap으로 열고,
+    없거나 원본이 바뀌었으면 CSV를 파싱 (큰 파일은 여러 프로세스로)
+
+    Args:
+        file_path (str): 샘플 데이터 파일 경로
+        workers (int, optional): CSV 파싱 작업 프로세스 수 (None이면 CPU 수)
+
+    Returns:
+        SampleDataset: 컬럼 데이터셋
+
+    Raises:
+        FileNotFoundError: 파일이 없을 때
+    """
+    key = os.path.abspath(file_path)
+    stamp = file_stamp(key)
+
+    dataset = _cache.get(key)
+    if dataset is None or dataset.stamp != stamp:
+        dataset = SampleDataset.from_binary(binary_path_for(key), stamp)
+        if dataset is None:
+            dataset = SampleDataset.from_csv(key, workers)
+        _cache[key] = dataset
+    return dataset
+
+
+def clear_cache():
+    """샘플 데이터 캐시 비우기"""
+    _cache.clear()
@@ -0,0 +1,178 @@
+"""
+sample_stats.py
+샘플 데이터 그룹별 통계 집계
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+데이터 출처: Kaggle - Cardiovascular Disease Dataset
+"""
+
+from .sample_dataset import CHUNK_ROWS, GENDER_LABELS, iter_csv_chunks
+
+
+# 그룹 컬럼별 라벨 변환 (없으면 원래 값 사용)
+GROUP_LABELS = {
+    "gender": GENDER_LABELS
+}
+
+# 집계에 필요한 컬럼 (StatsAccumulator.add 인자 순서)
+STAT_COLUMNS = ("age", "height", "weight", "ap_hi", "ap_lo", "cholesterol", "smoke", "cardio")
+
+
+class StatsAccumulator:
+    """
+    한 그룹의 통계 누적값을 보관하는 클래스
+
+    행을 한 번씩만 넘겨받아 평균/비율 계산에 필요한 합계와 개수를 누적
+    """
+
+    __slots__ = ("count", "age_sum", "height_sum", "weight_sum", "ap_hi_sum", "ap_lo_sum",
+                 "bmi_sum", "bmi_count", "cardio_count", "smoke_count", "high_chol_count")
+
+    def __init__(self):
+        """생성자: 누적값 초기화"""
+        self.count = 0
+        self.age_sum = 0
+        self.height_sum = 0
+        self.weight_sum = 0
+        self.ap_hi_sum = 0
+        self.ap_lo_sum = 0
+        self.bmi_sum = 0
+        self.bmi_count = 0
+        self.cardio_count = 0
+        self.smoke_count = 0
+        self.high_chol_count = 0
+
+    def add(self, age, height, weight, ap_hi, ap_lo, cholesterol, smoke, cardio):
+        """행 하나 누적"""
+        self.count += 1
+        self.age_sum += age
+        self.height_sum += height
+        self.weight_sum += weight
+        self.ap_hi_sum += ap_hi
+        self.ap_lo_sum += ap_lo
+        if height > 0:
+            self.bmi_sum += weight / ((height / 100) ** 2)
+            self.bmi_count += 1
+        if cardio == 1:
+            self.cardio_count += 1
+        if smoke == 1:
+            self.smoke_count += 1
+        if cholesterol >= 2:
+            self.high_chol_count += 1
+
+    def result(self, label):
+        """
+        누적값으로 통계 딕셔너리 생성
+
+        Args:
+            label (dict): 결과에 붙일 그룹 라벨 (예: {"gender": "남성"})
+
+        Returns:
+            dict or None: 통계 데이터 (데이터가 없으면 None)
+        """
+        total = self.count
+        if not total:
+            return None
+
+        avg_bmi = self.bmi_sum / self.bmi_count if self.bmi_count else 0
+
+        stats = dict(label)
+        stats.update({
+            "total_samples": total,
+            "avg_age": round(self.age_sum / total, 1),
+            "avg_height": round(self.height_sum / total, 1),
+            "avg_weight": round(self.weight_sum / total, 1),
+            "avg_bmi": round(avg_bmi, 1),
+            "avg_ap_hi": round(self.ap_hi_sum / total, 1),
+            "avg_ap_lo": round(self.ap_lo_sum / total, 1),
+            "cardio_rate": round((self.cardio_count / total) * 100, 1),
+            "smoke_rate": round((self.smoke_count / total) * 100, 1),
+            "high_chol_rate": round((self.high_chol_count / total) * 100, 1)
+        })
+        return stats
+
+
+def accumulate(columns, by="gender", groups=None, total=None):
+    """
+    컬럼 데이터를 한 번만 훑으며 그룹별/전체 누적값 갱신
+
+    Args:
+        columns (dict): 컬럼명 → 시퀀스
+        by (str): 그룹 기준 컬럼명
+        groups (dict, optional): 이어서 누적할 {그룹 값: StatsAccumulator}
+        total (StatsAccumulator, optional): 이어서 누적할 전체 누적값
+
+    Returns:
+        tuple: (groups, total)
+    """
+    if groups is None:
+        groups = {}
+    if total is None:
+        total = StatsAccumulator()
+
+    add_total = total.add
+    rows = zip(columns[by], *(columns[name] for name in STAT_COLUMNS))
+    for key, *values in rows:
+        acc = groups.get(key)
+        if acc is None:
+            acc = groups[key] = StatsAccumulator()
+        acc.add(*values)
+        add_total(*values)
+
+    return groups, total
+
+
+def build_statistics(groups, total, by="gender"):
+    """
+    누적값을 통계 딕셔너리로 변환
+
+    Returns:
+        dict: {"groups": {그룹 라벨: 통계}, "total": 전체 통계}
+    """
+    labels = GROUP_LABELS.get(by, {})
+    result = {}
+    for key in sorted(groups):
+        label = labels.get(key, key)
+        result[label] = groups[key].result({by: label})
+
+    return {
+        "groups": result,
+        "total": total.result({by: "전체"})
+    }
+
+
+def group_statistics(columns, by="gender"):
+    """
+    모든 그룹의 모든 지표를 한 번의 순회로 계산
+
+    Args:
+        columns (dict): 컬럼명 → 시퀀스
+        by (str): 그룹 기준 컬럼명 (gender, cholesterol, cardio 등)
+
+    Returns:
+        dict: {"groups": {그룹 라벨: 통계}, "total": 전체 통계}
+    """
+    groups, total = accumulate(columns, by)
+    return build_statistics(groups, total, by)
+
+
+def streaming_statistics(file_path, by="gender", chunk_rows=CHUNK_ROWS):
+    """
+    CSV 파일을 chunk_rows행씩 읽으며 그룹별 통계 계산
+
+    그룹별 누적값만 유지하므로 파일 크기와 관계없이 메모리 사용량이 일정하고,
+    행을 같은 순서로 누적하므로 group_statistics()와 결과가 같음
+
+    Args:
+        file_path (str): 샘플 데이터 파일 경로
+        by (str): 그룹 기준 컬럼명
+        chunk_rows (int): 한 번에 읽을 행 수
+
+    Returns:
+        dict: {"groups": {그룹 라벨: 통계}, "total": 전체 통계}
+    """
+    groups, total = {}, StatsAccumulator()
+    for chunk in iter_csv_chunks(file_path, chunk_rows):
+        accumulate(chunk, by, groups, total)
+    return build_statistics(groups, total, by)
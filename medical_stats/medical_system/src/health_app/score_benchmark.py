@@ -0,0 +1,121 @@
+"""
+score_benchmark.py
+HealthChecker 일괄 계산(score_batch) 결과 일치 검사 및 속도 비교
+
+사용법:
+    python -m health_app.score_benchmark [반복 횟수]
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+데이터 출처: Kaggle - Cardiovascular Disease Dataset
+"""
+
+import os
+import sys
+import time
+
+from .health_checker import HealthChecker
+from .sample_dataset import get_sample_dataset
+
+
+# 검사용 경계값 (BMI/혈압/나이 구간 경계와 측정 불가 값 포함)
+EDGE_CASES = {
+    "age":         [39, 40, 49, 50, 59, 60, 70, 25, 45, 80, 30, 65],
+    "height":      [170, 0, 160, 150, 180, 175, 165, 100, 200, 170, -5, 158],
+    "weight":      [53.4, 60.0, 58.9, 67.5, 80.9, 76.6, 65.0, 30.0, 120.0, 0.0, 70.0, 74.9],
+    "ap_hi":       [89, 119, 120, 129, 130, 139, 140, 159, 160, 200, 110, 135],
+    "ap_lo":       [70, 79, 79, 79, 85, 89, 90, 99, 100, 120, 59, 60],
+    "cholesterol": [1, 2, 3, 1, 2, 3, 1, 2, 3, 1, 2, 3],
+    "gluc":        [1, 1, 2, 2, 3, 3, 1, 2, 3, 1, 1, 2],
+    "smoke":       [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1],
+    "alco":        [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1],
+    "active":      [1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 0, 0]
+}
+
+
+def score_scalar(columns):
+    """기존 방식: 행마다 HealthChecker 객체를 만들어 계산"""
+    result = {"bmi": [], "bmi_status": [], "bp_status": [], "risk_score": [], "risk_grade": []}
+    rows = zip(
+        columns["age"], columns["height"], columns["weight"],
+        columns["ap_hi"], columns["ap_lo"],
+        columns["cholesterol"], columns["gluc"],
+        columns["smoke"], columns["alco"], columns["active"]
+    )
+    for age, height, weight, ap_hi, ap_lo, chol, gluc, smoke, alco, active in rows:
+        checker = HealthChecker(age, "", height, weight, ap_hi, ap_lo,
+                                chol, gluc, smoke, alco, active)
+        bmi, bmi_status, _ = checker.calculate_bmi()
+        bp_status, _, _ = checker.analyze_blood_pressure()
+        score, grade, _, _ = checker.calculate_risk_score()
+        result["bmi"].append(bmi)
+        result["bmi_status"].append(bmi_status)
+        result["bp_status"].append(bp_status)
+        result["risk_score"].append(score)
+        result["risk_grade"].append(grade)
+    return result
+
+
+def check_parity(columns):
+    """
+    score_batch와 기존 메서드 결과 비교
+
+    Returns:
+        list: 불일치 목록 [(컬럼명, 행 번호, 기존 값, 일괄 값)]
+    """
+    expected = score_scalar(columns)
+    actual = HealthChecker.score_batch(columns)
+    mismatches = []
+    for name, values in expected.items():
+        for i, (a, b) in enumerate(zip(values, actual[name])):
+            if a != b:
+                mismatches.append((name, i, a, b))
+        if len(values) != len(actual[name]):
+            mismatches.append((name, -1, len(values), len(actual[name])))
+    return mismatches
+
+
+def best_time(func, arg, repeat):
+    """repeat번 실행 중 가장 짧은 시간 (초)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    argv = sys.argv[1:] if argv is None else argv
+    repeat = int(argv[0]) if argv else 3
+
+    base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    dataset = get_sample_dataset(os.path.join(base_path, "data", "cardiovascular_sample.csv"))
+
+    print("=" * 50)
+    print("HealthChecker 일괄 계산 검사")
+    print("=" * 50)
+
+    for label, columns in (("경계값", EDGE_CASES), ("샘플 데이터", dataset.columns)):
+        mismatches = check_parity(columns)
+        rows = len(columns["age"])
+        if mismatches:
+            print(f"❌ {label} {rows}행: 불일치 {len(mismatches)}건")
+            for item in mismatches[:10]:
+                print(f"   {item}")
+            return 1
+        print(f"✅ {label} {rows}행: 결과 일치")
+
+    scalar = best_time(score_scalar, dataset.columns, repeat)
+    batch = best_time(HealthChecker.score_batch, dataset.columns, repeat)
+    print(f"\n⏱️ {len(dataset)}행 (최소 {repeat}회 기준)")
+    print(f"   기존 방식 (객체 생성): {scalar * 1000:.1f}ms")
+    print(f"   score_batch:          {batch * 1000:.1f}ms")
+    print(f"   속도 향상:            {scalar / batch:.1f}배")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""
+data_benchmark.py
+데이터 계층 벤치마크 (샘플 통계, 환자 CRUD, 건강 추이) 및 결과 비교
+
+크기마다 임시 폴더에 가상 샘플/환자/건강 기록 데이터(data_generator.py)를 만들어 작업별 시간을 재고
+결과를 JSON으로 저장. 이전 결과 파일과 비교해 느려진 작업(회귀)을 표시
+
+사용법:
+    (src 폴더에서 실행)
+    python -m integration.data_benchmark run [--sizes 1000 10000 100000 1000000]
+                                             [-o 결과.json] [--baseline 이전.json]
+    python -m integration.data_benchmark compare 이전.json 현재.json [--threshold 0.25]
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# 상위 모듈 import를 위한 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from health_app.data_manager import HealthDataManager
+from health_app.sample_dataset import clear_cache, get_sample_dataset
+from patient_app.patient_manager import PatientManager
+from .data_generator import generate
+from .integration_manager import IntegrationManager
+
+
+# 결과 파일 형식 버전
+RESULT_VERSION = 1
+
+# 기본 측정 크기 (행 수)
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# 회귀 판정: 중앙값이 이전보다 THRESHOLD 비율 이상, MIN_DELTA초 이상 느려지면 회귀
+THRESHOLD = 0.25
+MIN_DELTA = 0.0005
+
+# compare_with_gender_average() 측정용 사용자 데이터
+USER_DATA = {"age": 45, "bmi": 24.2, "height": 172, "weight": 71.5, "ap_hi": 128, "ap_lo": 82}
+
+def measure(func, setup=None, repeat=3, number=1, batch=1):
+    """
+    func을 number번 실행하는 시간을 repeat번 측정 (setup은 매번 측정 전에 실행, 시간 제외)
+
+    Args:
+        batch (int): func 한 번이 작업을 batch번 하는 경우 (시간을 작업 1회 기준으로 나눔)
+
+    Returns:
+        dict: {"min", "median"} (작업 1회 평균, 초), "repeat", "number"
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / (number * batch))
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "repeat": repeat,
+        "number": number * batch
+    }
+
+
+def bench_health(base_path, repeat):
+    """샘플 데이터 로드/통계/비교 작업 측정"""
+    manager = HealthDataManager(base_path)
+    results = {}
+
+    # 로드: 캐시를 비워 매번 CSV 파싱부터 측정
+    results["health.load_sample_data"] = measure(manager.load_sample_data, clear_cache, repeat)
+
+    # 통계: 데이터셋은 캐시에 두고 파생 결과만 지워 그룹 집계를 매번 다시 계산
+    dataset = get_sample_dataset(manager.sample_file)
+    results["health.get_statistics"] = measure(
+        manager.get_statistics, dataset.derived.clear, repeat)
+    results["health.get_gender_statistics"] = measure(
+        manager.get_gender_statistics, dataset.derived.clear, repeat)
+
+    # 비교: 화면에서 분석할 때와 같이 통계/백분위 표가 만들어진 뒤의 호출 1회
+    manager.compare_with_gender_average(USER_DATA, "남성")
+    results["health.compare_with_gender_average"] = measure(
+        lambda: manager.compare_with_gender_average(USER_DATA, "남성"), repeat=repeat, number=100)
+    manager.close()
+    return results
+
+
+def bench_patients(base_path, size, repeat, ops):
+    """환자 CRUD/검색/통계 작업 측정 (등록/수정/삭제는 ops건 평균)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = PatientManager(base_path)
+    results = {}
+    rng = random.Random(0)
+    ids = [f"P{rng.randint(1, size):03d}" for _ in range(1000)]
+    template = dict(manager.patients[0].to_dict())
+    template.pop("patient_id")
+
+    created = []
+
+    def create():
+        ok, new_id = manager.create(dict(template))
+        created.append(new_id)
+
+    results["patient.create"] = measure(create, repeat=repeat, number=ops)
+    results["patient.read_by_id"] = measure(
+        lambda: [manager.read_by_id(pid) for pid in ids], repeat=repeat, batch=len(ids))
+    results["patient.search"] = measure(lambda: manager.search("민수", "name"), repeat=repeat)
+
+    pending = iter(created)
+    results["patient.update"] = measure(
+        lambda: manager.update(next(pending), {"medical_condition": "Asthma"}),
+        repeat=repeat, number=ops)
+    pending = iter(created)
+    results["patient.delete"] = measure(
+        lambda: manager.delete(next(pending)), repeat=repeat, number=ops)
+
+    results["patient.get_statistics"] = measure(manager.get_statistics, repeat=repeat, number=100)
+    results["patient.compute_statistics"] = measure(manager.compute_statistics, repeat=repeat)
+    manager.close()
+    return results
+
+
+def bench_integration(base_path, repeat):
+    """건강 추이 조회 측정 (첫 호출은 기록 인덱스 구성 포함)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = IntegrationManager(base_path)
+    records = manager.health_manager.load_records()
+    patient_ids = list(dict.fromkeys(r["patient_id"] for r in records))[:1000]
+
+    results = {}
+
+    def reset():
+        manager._records_stamp = None
+
+    results["integration.get_health_trend.cold"] = measure(
+        lambda: manager.get_health_trend(patient_ids[0]), reset, repeat)
+    results["integration.get_health_trend"] = measure(
+        lambda: [manager.get_health_trend(pid) for pid in patient_ids], repeat=repeat,
+        batch=len(patient_ids))
+    manager.health_manager.close()
+    manager.patient_manager.close()
+    return results
+
+
+def run_size(size, repeat, ops):
+    """
+    한 크기(행 수)의 가상 데이터를 만들어 모든 작업 측정
+
+    Returns:
+        dict: 작업명 → 측정 결과
+    """
+    work_dir = tempfile.mkdtemp(prefix="data_bench_")
+    try:
+        generate(os.path.join(work_dir, "data"), patients=size, records=size, samples=size)
+
+        results = {}
+        results.update(bench_health(work_dir, repeat))
+        results.update(bench_patients(work_dir, size, repeat, ops))
+        results.update(bench_integration(work_dir, repeat))
+        return results
+    finally:
+        clear_cache()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def run_suite(sizes=DEFAULT_SIZES, repeat=3, ops=5):
+    """
+    모든 크기에 대해 벤치마크 실행
+
+    Returns:
+        dict: 결과 파일 형식 ({"version", "environment", "results": {크기: {작업: 측정}}})
+    """
+    report = {
+        "version": RESULT_VERSION,
+        "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count()
+        },
+        "settings": {"repeat": repeat, "ops": ops},
+        "results": {}
+    }
+    for size in sizes:
+        report["results"][str(size)] = run_size(size, repeat, ops)
+    return report
+
+
+def compare_results(baseline, current, threshold=THRESHOLD, min_delta=MIN_DELTA):
+    """
+    두 결과에서 느려진 작업 찾기 (양쪽에 모두 있는 크기/작업만 비교)
+
+    Returns:
+        list: [(크기, 작업명, 이전 중앙값, 현재 중앙값, 배율)] 배율이 큰 순서
+    """
+    regressions = []
+    for size, tasks in current["results"].items():
+        before_tasks = baseline["results"].get(size, {})
+        for name, result in tasks.items():
+            before = before_tasks.get(name)
+            if before is None:
+                continue
+            old, new = before["median"], result["median"]
+            if new - old >= min_delta and new > old * (1 + threshold):
+                regressions.append((size, name, old, new, new / old if old else float("inf")))
+    regressions.sort(key=lambda item: item[4], reverse=True)
+    return regressions
+
+
+def load_results(path):
+    """결과 JSON 파일 읽기"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(path, report):
+    """결과 JSON 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def format_time(seconds):
+    """시간 표시 (1ms 미만은 µs)"""
+    if seconds < 0.001:
+        return f"{seconds * 1_000_000:.1f}µs"
+    return f"{seconds * 1000:.2f}ms"
+
+
+def print_report(report):
+    """크기별 작업 시간 표 출력"""
+    sizes = list(report["results"])
+    names = list(dict.fromkeys(name for size in sizes for name in report["results"][size]))
+    print(f"\n📊 데이터 계층 벤치마크 (1회 시간, {report['settings']['repeat']}번 측정 중 중앙값)")
+    print(f"   {'작업':<40}" + "".join(f"{int(size):>12,}" for size in sizes))
+    for name in names:
+        cells = []
+        for size in sizes:
+            result = report["results"][size].get(name)
+            cells.append(f"{format_time(result['median']) if result else '-':>12}")
+        print(f"   {name:<40}" + "".join(cells))
+
+
+def print_regressions(regressions, threshold):
+    """회귀 목록 출력 후 회귀 여부 반환"""
+    if not regressions:
+        print(f"✅ 회귀 없음 (기준: {threshold * 100:.0f}% 이상 느려짐)")
+        return False
+    print(f"❌ 회귀 {len(regressions)}건 (기준: {threshold * 100:.0f}% 이상 느려짐)")
+    for size, name, old, new, ratio in regressions:
+        print(f"   {int(size):>10,}행 {name:<40}{format_time(old):>12} → {format_time(new)} ({ratio:.2f}배)")
+    return True
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="데이터 계층 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="벤치마크 실행")
+    p_run.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    p_run.add_argument("--repeat", type=int, default=3)
+    p_run.add_argument("--ops", type=int, default=5, help="등록/수정/삭제 측정 건수")
+    p_run.add_argument("-o", "--output", default=None, help="결과 JSON 저장 경로")
+    p_run.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    p_run.add_argument("--threshold", type=float, default=THRESHOLD)
+
+    p_compare = sub.add_parser("compare", help="두 결과 JSON 비교")
+    p_compare.add_argument("baseline")
+    p_compare.add_argument("current")
+    p_compare.add_argument("--threshold", type=float, default=THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "compare":
+            baseline, report = load_results(args.baseline), load_results(args.current)
+        else:
+            baseline = load_results(args.baseline) if args.baseline else None
+            report = run_suite(args.sizes, args.repeat, args.ops)
+            print_report(report)
+            if args.output:
+                save_results(args.output, report)
+                print(f"\n💾 결과 저장: {args.output}")
+    except (OSError, ValueError) as e:
+        print(f"❌ 오류: {e}")
+        return 1
+
+    if baseline is None:
+        return 0
+    regressed = print_regressions(compare_results(baseline, report, args.threshold), args.threshold)
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
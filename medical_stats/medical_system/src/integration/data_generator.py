@@ -0,0 +1,359 @@
+"""
+data_generator.py
+부하 테스트/벤치마크용 가상 데이터 생성기 (시드 고정, 결과 재현 가능)
+
+patients.csv, health_records.csv, cardiovascular_sample.csv와 같은 형식의 파일을
+원하는 행 수만큼 생성. 값은 Patient.validate()의 허용 범위 안에서 만들고,
+심혈관 측정값은 Kaggle Cardiovascular Disease Dataset(70,000건)의
+성별 분포/평균/표준편차/상관관계에 맞춰 생성
+
+블록(BLOCK_ROWS행) 단위로 만들어 바로 파일에 쓰므로 메모리 사용량이 일정하고,
+행 수가 많으면 블록을 여러 프로세스에서 나눠 생성.
+난수는 블록/환자 번호로 시드를 정하므로 작업 프로세스 수와 관계없이 같은 파일이 생성됨
+
+사용법:
+    (src 폴더에서 실행)
+    python -m integration.data_generator 출력폴더 [--rows 1000000] [--seed 0] [--workers 4]
+                                         [--patients N] [--records N] [--samples N]
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# 상위 모듈 import를 위한 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from health_app.data_manager import HealthDataManager
+from health_app.health_checker import HealthChecker
+from patient_app.patient import Patient
+from patient_app.patient_manager import PatientManager
+from patient_app.storage_tool import GIVEN_NAMES, HOSPITALS, INSURERS, SURNAMES
+
+
+# 한 번에 만들어 쓰는 행 수 (작업 프로세스 1개가 맡는 단위)
+BLOCK_ROWS = 50_000
+
+# 이보다 적은 행은 프로세스를 띄우지 않고 한 프로세스로 생성
+PARALLEL_MIN_ROWS = 200_000
+
+SAMPLE_HEADERS = ["id", "age", "gender", "height", "weight", "ap_hi", "ap_lo",
+                  "cholesterol", "gluc", "smoke", "alco", "active", "cardio"]
+
+# 진단명 → 처방 약 (기존 patients.csv의 짝)
+MEDICATIONS = {
+    "Diabetes": "Metformin",
+    "Hypertension": "Lisinopril",
+    "Asthma": "Ventolin",
+    "Obesity": "Orlistat",
+    "Arthritis": "Ibuprofen",
+    "Cancer": "Tamoxifen"
+}
+
+# ==================== Kaggle 심혈관 데이터 분포 ====================
+# (성별 코드 1: 여성, 2: 남성, 혈압은 80~220/40~150 범위 밖 이상값 제외 후 계산)
+
+FEMALE_RATIO = 0.65
+
+# 나이(일): 평균, 표준편차, 최소, 최대
+AGE_DAYS = (19470, 2470, 10800, 23710)
+
+# 성별 → (평균, 표준편차)
+HEIGHT = {1: (161.4, 7.1), 2: (169.9, 7.2)}
+WEIGHT = {1: (72.6, 14.2), 2: (77.3, 14.2)}
+HEIGHT_WEIGHT_CORR = 0.29
+
+# 혈압: 수축기 평균/표준편차, 이완기 평균/표준편차, 상관계수
+AP_HI = (126.6, 16.7)
+AP_LO = (81.3, 9.5)
+AP_CORR = 0.71
+
+# 혈압을 10 단위로 기록한 비율 (원본 값 대부분이 120, 80처럼 10 단위)
+AP_ROUND_RATIO = 0.85
+
+# 성별 → 값별 비율
+CHOLESTEROL = {1: (0.737, 0.141, 0.122), 2: (0.769, 0.129, 0.102)}
+GLUC = {1: (0.845, 0.075, 0.080), 2: (0.859, 0.072, 0.069)}
+SMOKE = {1: 0.018, 2: 0.219}
+ALCO = {1: 0.025, 2: 0.106}
+ACTIVE = 0.80
+
+# 수축기 혈압 구간(상한 미만) → 심혈관 질환 비율, 나이 1년당 가산
+CARDIO_BY_AP_HI = ((120, 0.233), (130, 0.356), (140, 0.599), (160, 0.829), (999, 0.861))
+CARDIO_PER_YEAR = 0.012
+
+
+def _clip(value, low, high):
+    """low~high 범위로 자르기"""
+    return max(low, min(high, value))
+
+
+def _round_bp(rng, value):
+    """혈압 값 기록 (대부분 10 단위로 반올림)"""
+    if rng.random() < AP_ROUND_RATIO:
+        return int(round(value, -1))
+    return int(round(value))
+
+
+def cardio_values(rng, gender, age_days=None):
+    """
+    Kaggle 분포를 따르는 심혈관 측정값 한 행
+
+    Args:
+        rng (random.Random): 난수 생성기
+        gender (int): 1 여성, 2 남성
+        age_days (int, optional): 나이(일) (없으면 분포에서 생성)
+
+    Returns:
+        list: SAMPLE_HEADERS에서 id를 뺀 순서의 값
+    """
+    if age_days is None:
+        mean, sd, low, high = AGE_DAYS
+        age_days = int(_clip(rng.gauss(mean, sd), low, high))
+
+    # 키와 몸무게, 수축기와 이완기 혈압은 상관관계를 유지하도록 함께 생성
+    h_mean, h_sd = HEIGHT[gender]
+    w_mean, w_sd = WEIGHT[gender]
+    z_height = rng.gauss(0, 1)
+    z_weight = HEIGHT_WEIGHT_CORR * z_height + (1 - HEIGHT_WEIGHT_CORR ** 2) ** 0.5 * rng.gauss(0, 1)
+    height = int(_clip(round(h_mean + h_sd * z_height), 140, 200))
+    weight = float(_clip(round(w_mean + w_sd * z_weight), 40, 180))
+
+    z_hi = rng.gauss(0, 1)
+    z_lo = AP_CORR * z_hi + (1 - AP_CORR ** 2) ** 0.5 * rng.gauss(0, 1)
+    ap_hi = _clip(_round_bp(rng, AP_HI[0] + AP_HI[1] * z_hi), 80, 220)
+    ap_lo = _clip(_round_bp(rng, AP_LO[0] + AP_LO[1] * z_lo), 40, min(ap_hi - 10, 150))
+
+    cholesterol = rng.choices((1, 2, 3), CHOLESTEROL[gender])[0]
+    gluc = rng.choices((1, 2, 3), GLUC[gender])[0]
+    smoke = int(rng.random() < SMOKE[gender])
+    alco = int(rng.random() < ALCO[gender])
+    active = int(rng.random() < ACTIVE)
+
+    base = next(rate for upper, rate in CARDIO_BY_AP_HI if ap_hi < upper)
+    cardio_rate = _clip(base + CARDIO_PER_YEAR * (age_days / 365 - 53), 0.02, 0.98)
+    cardio = int(rng.random() < cardio_rate)
+
+    return [age_days, gender, height, weight, ap_hi, ap_lo,
+            cholesterol, gluc, smoke, alco, active, cardio]
+
+
+def patient_row(seed, number):
+    """
+    number번 환자 정보 (환자마다 시드를 정하므로 어느 블록/프로세스에서 만들어도 같음)
+
+    Returns:
+        dict: PatientManager.CSV_HEADERS 키의 환자 정보
+    """
+    rng = random.Random(f"{seed}:patient:{number}")
+    condition = rng.choice(Patient.VALID_CONDITIONS)
+    admission = f"{rng.choice((2024, 2025))}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    if rng.random() < 0.15:
+        discharge = ""
+    else:
+        year, month, day = map(int, admission.split("-"))
+        day += rng.randint(1, 27)
+        if day > 28:
+            month, day = month + 1, day - 28
+            if month > 12:
+                year, month = year + 1, 1
+        discharge = f"{year}-{month:02d}-{day:02d}"
+
+    return {
+        "patient_id": f"P{number:03d}",
+        "name": rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES),
+        "age": rng.randint(18, 85),
+        "gender": rng.choice(Patient.VALID_GENDERS),
+        "blood_type": rng.choice(Patient.VALID_BLOOD_TYPES),
+        "medical_condition": condition,
+        "date_of_admission": admission,
+        "doctor": "Dr. " + rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES),
+        "hospital": rng.choice(HOSPITALS),
+        "insurance_provider": rng.choice(INSURERS),
+        "billing_amount": float(rng.randint(50, 5000) * 1000),
+        "room_number": rng.randint(100, 999),
+        "admission_type": rng.choice(Patient.VALID_ADMISSION_TYPES),
+        "discharge_date": discharge,
+        "medication": MEDICATIONS[condition],
+        "test_results": rng.choice(Patient.VALID_TEST_RESULTS)
+    }
+
+
+# ==================== 블록 생성 (작업 프로세스에서 실행) ====================
+
+def _csv_text(header, rows, delimiter=","):
+    """행 목록 → CSV 문자열 (header가 있으면 맨 앞에 추가)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\n")
+    if header:
+        writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def patients_block(seed, start, end):
+    """start~end-1번 환자 (번호는 1부터) CSV 블록"""
+    headers = PatientManager.CSV_HEADERS
+    rows = []
+    for number in range(start + 1, end + 1):
+        patient = patient_row(seed, number)
+        rows.append([patient[name] for name in headers])
+    return _csv_text(headers if start == 0 else None, rows)
+
+
+def samples_block(seed, start, end):
+    """start~end-1번 심혈관 샘플 CSV 블록 (세미콜론 구분)"""
+    rng = random.Random(f"{seed}:sample:{start}")
+    rows = []
+    for i in range(start, end):
+        gender = 1 if rng.random() < FEMALE_RATIO else 2
+        rows.append([i] + cardio_values(rng, gender))
+    return _csv_text(SAMPLE_HEADERS if start == 0 else None, rows, ";")
+
+
+def records_block(seed, start, end, patients):
+    """
+    start~end-1번 건강 기록 CSV 블록
+
+    기록의 90%는 1~patients번 환자에 연결(이름/나이/성별/병원 정보가 환자와 같음),
+    나머지는 환자 ID 없는 기존 방식 기록. BMI/위험도는 HealthChecker와 같은 계산
+    """
+    rng = random.Random(f"{seed}:record:{start}")
+    base_rows = []
+    columns = {name: [] for name in ("age", "height", "weight", "ap_hi", "ap_lo",
+                                     "cholesterol", "gluc", "smoke", "alco", "active")}
+    for _ in range(start, end):
+        if patients and rng.random() < 0.9:
+            patient = patient_row(seed, rng.randint(1, patients))
+            gender = 2 if patient["gender"] == "Male" else 1
+            age = patient["age"]
+            link = [patient["patient_id"], patient["name"], age, "남성" if gender == 2 else "여성"]
+            extra = [patient["doctor"], patient["hospital"], patient["room_number"],
+                     patient["admission_type"], patient["test_results"], patient["billing_amount"]]
+        else:
+            gender = 1 if rng.random() < FEMALE_RATIO else 2
+            age = rng.randint(30, 65)
+            name = rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+            link = ["", name, age, "남성" if gender == 2 else "여성"]
+            extra = ["", "", 0, "Elective", "Normal", 0]
+
+        values = cardio_values(rng, gender, age * 365 + rng.randint(0, 364))
+        date = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(8, 18):02d}:{rng.randint(0, 59):02d}"
+        base_rows.append((date, link, values[2:11], extra))
+        for name, value in zip(columns, [age] + values[2:11]):
+            columns[name].append(value)
+
+    scores = HealthChecker.score_batch(columns)
+    rows = []
+    for (date, link, measures, extra), bmi, score in zip(base_rows, scores["bmi"], scores["risk_score"]):
+        rows.append([date] + link + measures + [bmi, score] + extra)
+    return _csv_text(HealthDataManager.CSV_HEADERS if start == 0 else None, rows)
+
+
+# ==================== 파일 쓰기 ====================
+
+def _blocks(total):
+    """(시작, 끝) 블록 목록"""
+    return [(start, min(start + BLOCK_ROWS, total)) for start in range(0, total, BLOCK_ROWS)]
+
+
+def write_blocks(path, make_block, args, total, workers=None):
+    """
+    블록을 순서대로 만들어 파일에 쓰기 (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        path (str): 출력 파일 경로
+        make_block (function): (*args, 시작, 끝, ...) → CSV 문자열
+        args (tuple): (시드,) 또는 (시드, 환자 수) — 시작/끝 앞뒤에 붙일 인자
+        total (int): 행 수
+        workers (int, optional): 작업 프로세스 수 (None이면 CPU 수)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    seed, *rest = args
+    blocks = _blocks(total) or [(0, 0)]
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        if workers <= 1 or total < PARALLEL_MIN_ROWS:
+            for start, end in blocks:
+                f.write(make_block(seed, start, end, *rest))
+        else:
+            # 작업 중인 블록을 프로세스 수의 2배까지만 두어 메모리 사용량 제한
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for start, end in blocks:
+                    pending.append(pool.submit(make_block, seed, start, end, *rest))
+                    if len(pending) >= workers * 2:
+                        f.write(pending.popleft().result())
+                while pending:
+                    f.write(pending.popleft().result())
+    os.replace(tmp_path, path)
+
+
+def generate(out_dir, patients=0, records=0, samples=0, seed=0, workers=None):
+    """
+    가상 데이터 파일 생성 (행 수가 0인 파일은 만들지 않음)
+
+    Args:
+        out_dir (str): 출력 폴더 (patients.csv, health_records.csv, cardiovascular_sample.csv)
+        patients (int): 환자 수
+        records (int): 건강 기록 수 (1~patients번 환자에 연결)
+        samples (int): 심혈관 샘플 수
+        seed (int): 시드 (같은 시드와 행 수면 같은 파일)
+        workers (int, optional): 작업 프로세스 수
+
+    Returns:
+        dict: 파일 이름 → 경로
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = (
+        ("patients.csv", patients_block, (seed,), patients),
+        ("health_records.csv", records_block, (seed, patients), records),
+        ("cardiovascular_sample.csv", samples_block, (seed,), samples)
+    )
+    written = {}
+    for name, make_block, args, total in jobs:
+        if total:
+            path = os.path.join(out_dir, name)
+            write_blocks(path, make_block, args, total, workers)
+            written[name] = path
+    return written
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="가상 데이터 생성 (환자/건강 기록/심혈관 샘플)")
+    parser.add_argument("output", help="출력 폴더")
+    parser.add_argument("--rows", type=int, default=1000, help="파일별 기본 행 수")
+    parser.add_argument("--patients", type=int, default=None, help="환자 수 (기본: --rows)")
+    parser.add_argument("--records", type=int, default=None, help="건강 기록 수 (기본: --rows)")
+    parser.add_argument("--samples", type=int, default=None, help="심혈관 샘플 수 (기본: --rows)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args(argv)
+
+    def pick(value):
+        return args.rows if value is None else value
+
+    try:
+        written = generate(args.output, pick(args.patients), pick(args.records),
+                           pick(args.samples), args.seed, args.workers)
+    except OSError as e:
+        print(f"❌ 생성 오류: {e}")
+        return 1
+    for name, path in written.items():
+        print(f"✅ {name}: {path} ({os.path.getsize(path) / 1024 / 1024:.1f}MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,21 +6,25 @@ Author: KDT12 Python Project
 Date: 2026-01-09
 """
 
+import bisect
 import os
 import sys
 
 # 상위 모듈 import를 위한 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import perf_monitor
 from health_app.health_checker import HealthChecker
 from health_app.data_manager import HealthDataManager
 from patient_app.patient import Patient
 from patient_app.patient_manager import PatientManager
 
 
+@perf_monitor.instrument
 class IntegrationManager:
     """
     건강 체크 시스템과 환자 관리 시스템을 연동하는 브릿지 클래스
+    (MEDICAL_PERF=1이면 공개 메서드 성능 측정)
     
     주요 기능:
     - 환자 ID로 건강 기록 조회
@@ -38,15 +42,22 @@ class IntegrationManager:
         "default": "Asthma"
     }
     
-    def __init__(self, base_path=None):
-        """생성자"""
+    def __init__(self, base_path=None, health_backend="csv"):
+        """생성자 (health_backend="sqlite"이면 건강 기록을 SQLite DB로 관리)"""
         if base_path is None:
             self.base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         else:
             self.base_path = base_path
         
-        self.health_manager = HealthDataManager(self.base_path)
+        self.health_manager = HealthDataManager(self.base_path, health_backend)
         self.patient_manager = PatientManager(self.base_path)
+        
+        # 건강 기록 인덱스: 환자 ID → 기록 리스트 (날짜순), 이름 → 기록 리스트 (저장 순서)
+        # 환자별 날짜 리스트는 기록 리스트와 같은 순서 (새 기록을 끼워 넣을 위치 이진 탐색용)
+        self._records_by_patient = {}
+        self._record_dates = {}
+        self._records_by_name = {}
+        self._records_stamp = None
     
     def get_patient_list(self):
         """
@@ -55,6 +66,7 @@ class IntegrationManager:
         Returns:
             list: [(patient_id, name, age, gender), ...]
         """
+        self._sync_patients()
         patients = self.patient_manager.read_all()
         return [
             (p.patient_id, p.name, p.age, p.gender)
@@ -71,8 +83,58 @@ class IntegrationManager:
         Returns:
             Patient or None
         """
+        self._sync_patients()
         return self.patient_manager.read_by_id(patient_id)
     
+    def _sync_patients(self):
+        """
+        환자 관리 창 등 다른 프로그램이 환자 파일을 저장했으면 다시 로드
+        
+        (건강 체크 창은 PatientManager 하나를 계속 쓰므로 다시 로드하지 않으면
+        다른 곳에서 등록한 환자가 보이지 않고 등록도 세대 번호 충돌로 실패함)
+        """
+        self.patient_manager.reload_if_changed()
+    
+    def _ensure_record_index(self):
+        """
+        건강 기록 인덱스가 최신인지 확인하고, 기록이 외부에서 바뀌었으면 다시 구성
+        
+        (건강 체크 창 등 다른 매니저가 기록을 추가한 경우 파일 상태 값이 달라짐)
+        """
+        stamp = self.health_manager.records_stamp()
+        if stamp is not None and stamp == self._records_stamp:
+            return
+        
+        by_patient = {}
+        by_name = {}
+        for record in self.health_manager.load_records():
+            if record.get("patient_id"):
+                by_patient.setdefault(record["patient_id"], []).append(record)
+            by_name.setdefault(record.get("name"), []).append(record)
+        
+        # 재구성할 때만 정렬 (이후 추가되는 기록은 순서에 맞게 끼워 넣음)
+        dates = {}
+        for patient_id, records in by_patient.items():
+            records.sort(key=lambda r: r.get("date", ""))
+            dates[patient_id] = [r.get("date", "") for r in records]
+        
+        self._records_by_patient = by_patient
+        self._record_dates = dates
+        self._records_by_name = by_name
+        self._records_stamp = stamp
+    
+    def _index_record(self, record):
+        """새로 저장된 기록을 인덱스에 추가"""
+        if record.get("patient_id"):
+            records = self._records_by_patient.setdefault(record["patient_id"], [])
+            dates = self._record_dates.setdefault(record["patient_id"], [])
+            # 같은 날짜의 기록 뒤에 삽입 (대부분 최신 기록이므로 끝에 추가됨)
+            date = record.get("date", "")
+            pos = bisect.bisect_right(dates, date)
+            dates.insert(pos, date)
+            records.insert(pos, record)
+        self._records_by_name.setdefault(record.get("name"), []).append(record)
+    
     def get_health_records_by_patient(self, patient_id):
         """
         환자 ID로 건강 기록 조회
@@ -81,13 +143,10 @@ class IntegrationManager:
             patient_id: 환자 ID
             
         Returns:
-            list: 해당 환자의 건강 기록 리스트
+            list: 해당 환자의 건강 기록 리스트 (날짜순)
         """
-        all_records = self.health_manager.load_records()
-        return [
-            record for record in all_records
-            if record.get("patient_id") == patient_id
-        ]
+        self._ensure_record_index()
+        return list(self._records_by_patient.get(patient_id, ()))
     
     def get_health_records_by_name(self, name):
         """
@@ -99,11 +158,8 @@ class IntegrationManager:
         Returns:
             list: 해당 이름의 건강 기록 리스트
         """
-        all_records = self.health_manager.load_records()
-        return [
-            record for record in all_records
-            if record.get("name") == name
-        ]
+        self._ensure_record_index()
+        return list(self._records_by_name.get(name, ()))
     
     def suggest_condition(self, health_data):
         """
@@ -166,7 +222,17 @@ class IntegrationManager:
         """
         # patient_id를 데이터에 추가
         health_data["patient_id"] = patient_id if patient_id else ""
-        return self.health_manager.save_record_with_patient_id(patient_id, name, health_data)
+        
+        # 저장 직전까지 인덱스가 최신이었으면 새 기록만 추가, 아니면 다음 조회 때 재구성
+        self._ensure_record_index()
+        stamp_before = self._records_stamp
+        record = self.health_manager.append_record(patient_id, name, health_data)
+        if record is None:
+            return False
+        if stamp_before is not None:
+            self._index_record(record)
+            self._records_stamp = self.health_manager.records_stamp()
+        return True
     
     def register_patient_from_health(self, health_data, extra_info):
         """
@@ -199,6 +265,7 @@ class IntegrationManager:
             "test_results": extra_info.get("test_results", "Normal")
         }
         
+        self._sync_patients()
         return self.patient_manager.create(patient_data)
     
     def get_health_trend(self, patient_id):
@@ -211,16 +278,15 @@ class IntegrationManager:
         Returns:
             dict: 추이 정보 (bmi_trend, bp_trend, risk_trend)
         """
-        records = self.get_health_records_by_patient(patient_id)
+        self._ensure_record_index()
+        records = self._records_by_patient.get(patient_id, ())
         
         if len(records) < 2:
             return None
         
-        # 날짜순 정렬 (최신이 마지막)
-        records_sorted = sorted(records, key=lambda x: x.get("date", ""))
-        
-        latest = records_sorted[-1]
-        previous = records_sorted[-2]
+        # 인덱스는 날짜순으로 유지됨 (최신이 마지막)
+        latest = records[-1]
+        previous = records[-2]
         
         def get_trend(current, prev):
             if current < prev:
@@ -260,20 +326,17 @@ class IntegrationManager:
         Returns:
             dict: 통합 통계 정보
         """
+        self._sync_patients()
         patient_stats = self.patient_manager.get_statistics()
-        health_records = self.health_manager.load_records()
+        summary = self.health_manager.get_record_summary()
         
-        # 건강 기록 통계
-        total_health_records = len(health_records)
-        linked_records = sum(1 for r in health_records if r.get("patient_id"))
+        # 건강 기록 통계 (누적 통계 사이드카 사용, 기록 파일 재조회 없음)
+        total_health_records = summary["count"]
+        linked_records = summary["linked"]
         
         # 평균 BMI, 위험도
-        if health_records:
-            avg_bmi = sum(float(r.get("bmi", 0)) for r in health_records) / len(health_records)
-            avg_risk = sum(int(r.get("risk_score", 0)) for r in health_records) / len(health_records)
-        else:
-            avg_bmi = 0
-            avg_risk = 0
+        avg_bmi = summary["fields"]["bmi"]["mean"]
+        avg_risk = summary["fields"]["risk_score"]["mean"]
         
         return {
             "patient_stats": patient_stats,
@@ -302,6 +365,7 @@ class IntegrationManager:
         else:
             gender_norm = "Female"
         
+        self._sync_patients()
         for patient in self.patient_manager.patients:
             if (patient.name == name and 
                 patient.age == int(age) and 
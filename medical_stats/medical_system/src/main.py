@@ -18,6 +18,8 @@ from tkinter import ttk
 # 모듈 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import perf_monitor
+
 # 기본 경로 설정
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -244,6 +246,18 @@ class MedicalSystemApp:
             cursor="hand2",
             command=self.open_patient_app
         ).pack(pady=(0, 15), ipadx=30, ipady=8)
+        
+        # 성능 통계 (MEDICAL_PERF=1로 실행하면 매니저 메서드별 측정값 표시)
+        Button(
+            main_frame,
+            text="📈 성능 통계",
+            font=("맑은 고딕", 10),
+            bg=self.colors["light"],
+            fg=self.colors["dark"],
+            relief=FLAT,
+            cursor="hand2",
+            command=self.show_perf_stats
+        ).pack(pady=(5, 0), ipadx=15, ipady=3)
     
     def create_footer(self):
         """하단 푸터 생성"""
@@ -279,6 +293,10 @@ class MedicalSystemApp:
             from tkinter import messagebox
             messagebox.showerror("오류", f"환자 관리 시스템을 열 수 없습니다.\n{str(e)}")
     
+    def show_perf_stats(self):
+        """성능 통계 팝업 열기"""
+        perf_monitor.show_window(self.window)
+    
     def run(self):
         """애플리케이션 실행"""
         # 윈도우 중앙 배치
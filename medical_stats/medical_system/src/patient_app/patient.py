@@ -6,11 +6,26 @@ Author: KDT12 Python Project
 Date: 2026-01-09
 """
 
+import sys
 from datetime import datetime
 
 
+def _intern(value):
+    """문자열이면 intern된 객체 반환 (같은 값은 한 객체를 공유)"""
+    return sys.intern(value) if type(value) is str else value
+
+
 class Patient:
-    """환자 정보를 담는 클래스"""
+    """환자 정보를 담는 클래스 (__slots__ 사용, 범주형 값은 intern하여 공유)"""
+    
+    __slots__ = ("patient_id", "name", "age", "gender", "blood_type", "medical_condition",
+                 "date_of_admission", "doctor", "hospital", "insurance_provider",
+                 "billing_amount", "room_number", "admission_type", "discharge_date",
+                 "medication", "test_results")
+    
+    INTERNED_FIELDS = ("gender", "blood_type", "medical_condition", "date_of_admission",
+                       "doctor", "hospital", "insurance_provider", "admission_type",
+                       "discharge_date", "medication", "test_results")
     
     VALID_GENDERS = ["Male", "Female"]
     VALID_BLOOD_TYPES = ["A+", "A-", "B+", "B-", "O+", "O-", "AB+", "AB-"]
@@ -27,19 +42,19 @@ class Patient:
         self.patient_id = patient_id
         self.name = name
         self.age = age
-        self.gender = gender
-        self.blood_type = blood_type
-        self.medical_condition = medical_condition
-        self.date_of_admission = date_of_admission if date_of_admission else datetime.now().strftime("%Y-%m-%d")
-        self.doctor = doctor
-        self.hospital = hospital
-        self.insurance_provider = insurance_provider
+        self.gender = _intern(gender)
+        self.blood_type = _intern(blood_type)
+        self.medical_condition = _intern(medical_condition)
+        self.date_of_admission = _intern(date_of_admission if date_of_admission else datetime.now().strftime("%Y-%m-%d"))
+        self.doctor = _intern(doctor)
+        self.hospital = _intern(hospital)
+        self.insurance_provider = _intern(insurance_provider)
         self.billing_amount = billing_amount
         self.room_number = room_number
-        self.admission_type = admission_type
-        self.discharge_date = discharge_date
-        self.medication = medication
-        self.test_results = test_results
+        self.admission_type = _intern(admission_type)
+        self.discharge_date = _intern(discharge_date)
+        self.medication = _intern(medication)
+        self.test_results = _intern(test_results)
     
     def to_dict(self):
         """딕셔너리로 변환"""
@@ -62,6 +77,11 @@ class Patient:
             "test_results": self.test_results
         }
     
+    @classmethod
+    def intern_value(cls, name, value):
+        """필드에 저장할 값 (INTERNED_FIELDS의 문자열이면 intern, 수정할 때 사용)"""
+        return _intern(value) if name in cls.INTERNED_FIELDS else value
+    
     @classmethod
     def from_dict(cls, data):
         """딕셔너리에서 객체 생성"""
@@ -10,11 +10,15 @@ from tkinter import *
 from tkinter import ttk, messagebox
 from .patient import Patient
 from .patient_manager import PatientManager
+from .patient_tree import VirtualPatientTree
 
 
 class PatientManagementApp(Toplevel):
     """환자 정보 관리 GUI (Toplevel 기반)"""
     
+    # 예약 저장 실패 확인 간격 (ms)
+    WRITE_CHECK_MS = 500
+    
     def __init__(self, parent=None, base_path=None):
         """생성자"""
         super().__init__(parent)
@@ -41,7 +45,7 @@ class PatientManagementApp(Toplevel):
         
         # 데이터 매니저 초기화
         try:
-            self.manager = PatientManager(base_path)
+            self.manager = PatientManager(base_path, write_behind=True)
         except Exception as e:
             print(f"[PatientManagementApp] 매니저 초기화 오류: {e}")
             self.manager = None
@@ -58,11 +62,33 @@ class PatientManagementApp(Toplevel):
         
         # 창 닫기 이벤트
         self.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # 예약 저장 실패 확인
+        self._write_check = None
+        if self.manager:
+            self._write_check = self.after(self.WRITE_CHECK_MS, self.check_writes)
     
     def on_close(self):
-        """창 닫기"""
+        """창 닫기 (예약된 저장을 모두 마친 뒤 닫음)"""
+        if self.manager:
+            ok, msg = self.manager.flush()
+            if not ok and not messagebox.askyesno(
+                    "저장 실패", f"{msg}\n\n저장하지 못한 변경은 취소되었습니다. 그래도 닫을까요?"):
+                self.refresh_table()
+                return
+            self.manager.close()
+        if self._write_check is not None:
+            self.after_cancel(self._write_check)
         self.destroy()
     
+    def check_writes(self):
+        """예약 저장 실패 확인 (실패하면 저장하지 못한 변경을 되돌리고 알림)"""
+        error = self.manager.poll_writes()
+        if error:
+            messagebox.showerror("저장 실패", f"{error}\n\n저장하지 못한 변경은 취소되었습니다.")
+            self.refresh_table()
+        self._write_check = self.after(self.WRITE_CHECK_MS, self.check_writes)
+    
     def create_widgets(self):
         """모든 위젯 생성"""
         # 헤더
@@ -141,12 +167,10 @@ class PatientManagementApp(Toplevel):
             table_frame,
             columns=columns,
             show="headings",
-            yscrollcommand=y_scroll.set,
             xscrollcommand=x_scroll.set,
             height=18
         )
         
-        y_scroll.config(command=self.tree.yview)
         x_scroll.config(command=self.tree.xview)
         
         column_configs = {
@@ -171,6 +195,9 @@ class PatientManagementApp(Toplevel):
         self.tree.pack(fill=BOTH, expand=True)
         self.tree.bind("<Double-1>", lambda e: self.show_detail_dialog())
         
+        # 보이는 행만 그리는 가상 스크롤 (세로 스크롤바도 여기서 조작)
+        self.table = VirtualPatientTree(self.tree, y_scroll, self.format_row)
+        
         # 버튼 영역
         btn_frame = Frame(self, bg=self.colors["bg"], pady=10)
         btn_frame.pack(fill=X, padx=20)
@@ -259,7 +286,7 @@ class PatientManagementApp(Toplevel):
             return
         
         total = len(self.manager.patients)
-        hospitalized = sum(1 for p in self.manager.patients if p.is_hospitalized())
+        hospitalized = self.manager.get_hospitalized_count()
         today = self.manager.get_today_admissions()
         
         from datetime import datetime
@@ -270,48 +297,40 @@ class PatientManagementApp(Toplevel):
         )
     
     def refresh_table(self, patients=None):
-        """테이블 새로고침"""
-        # 기존 데이터 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
+        """테이블 새로고침 (보이는 행 중 바뀐 행만 다시 그림)"""
         if not self.manager:
             return
         
         if patients is None:
-            self.manager.load_from_file()
-            patients = self.manager.read_all()
-        
-        for patient in patients:
-            values = (
-                patient.patient_id,
-                patient.name,
-                patient.age,
-                patient.get_gender_korean(),
-                patient.blood_type,
-                patient.medical_condition,
-                patient.doctor,
-                patient.hospital,
-                patient.room_number if patient.room_number else "-",
-                patient.get_admission_type_korean(),
-                patient.get_test_results_korean(),
-                patient.get_billing_formatted()
-            )
-            self.tree.insert("", END, values=values)
+            # 다른 프로그램이 저장한 경우에만 다시 로드
+            self.manager.reload_if_changed()
+            self.table.show(self.manager.read_all())
+        else:
+            # 검색 결과는 맨 위부터 표시
+            self.table.show(patients, top=True)
         
         self.update_status_bar()
     
+    def format_row(self, patient):
+        """테이블 한 행에 표시할 값"""
+        return (
+            patient.patient_id,
+            patient.name,
+            patient.age,
+            patient.get_gender_korean(),
+            patient.blood_type,
+            patient.medical_condition,
+            patient.doctor,
+            patient.hospital,
+            patient.room_number if patient.room_number else "-",
+            patient.get_admission_type_korean(),
+            patient.get_test_results_korean(),
+            patient.get_billing_formatted()
+        )
+    
     def get_selected_patient_id(self):
-        """선택된 환자 ID 반환 (문자열로 변환)"""
-        selected = self.tree.selection()
-        if not selected:
-            return None
-        item = self.tree.item(selected[0])
-        values = item.get("values", [])
-        if values:
-            # 명시적으로 문자열로 변환
-            return str(values[0])
-        return None
+        """선택된 환자 ID 반환 (화면 밖으로 스크롤된 행의 선택도 유지)"""
+        return self.table.selected()
     
     def search_patients(self):
         """환자 검색"""
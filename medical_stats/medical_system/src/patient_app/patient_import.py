@@ -0,0 +1,169 @@
+"""
+patient_import.py
+Kaggle Healthcare Dataset 일괄 가져오기 도구
+
+사용법:
+    (src 폴더에서 실행)
+    python -m patient_app.patient_import <healthcare_dataset.csv 또는 .zip> [--limit N]
+                                         [--rejects 거부목록.csv] [--backend csv|journal|sqlite]
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import argparse
+import csv
+import io
+import sys
+import time
+import zipfile
+
+from .patient_manager import PatientManager
+
+
+# Kaggle 컬럼명 → Patient 필드명
+KAGGLE_COLUMNS = {
+    "Name": "name",
+    "Age": "age",
+    "Gender": "gender",
+    "Blood Type": "blood_type",
+    "Medical Condition": "medical_condition",
+    "Date of Admission": "date_of_admission",
+    "Doctor": "doctor",
+    "Hospital": "hospital",
+    "Insurance Provider": "insurance_provider",
+    "Billing Amount": "billing_amount",
+    "Room Number": "room_number",
+    "Admission Type": "admission_type",
+    "Discharge Date": "discharge_date",
+    "Medication": "medication",
+    "Test Results": "test_results"
+}
+
+
+def map_kaggle_row(row):
+    """
+    Kaggle 행 → Patient.from_dict() 입력 딕셔너리
+
+    Kaggle 이름은 대소문자가 뒤섞여 있어(예: "Bobby JacksOn") 단어별 첫 글자만 대문자로 정리
+    이미 Patient 필드명으로 된 CSV도 그대로 사용 가능
+    """
+    data = {}
+    for column, value in row.items():
+        if column is None:
+            continue
+        field = KAGGLE_COLUMNS.get(column.strip(), column.strip())
+        data[field] = value.strip() if isinstance(value, str) else value
+    if data.get("name"):
+        data["name"] = data["name"].title()
+    return data
+
+
+def open_source(path):
+    """
+    CSV 또는 zip(첫 번째 .csv 항목) 파일을 텍스트 스트림으로 열기
+
+    Returns:
+        tuple: (텍스트 스트림, 닫을 객체 리스트)
+    """
+    if zipfile.is_zipfile(path):
+        archive = zipfile.ZipFile(path)
+        names = [n for n in archive.namelist() if n.lower().endswith(".csv")]
+        if not names:
+            archive.close()
+            raise ValueError("zip 파일에 CSV가 없습니다.")
+        raw = archive.open(names[0])
+        stream = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+        return stream, [stream, archive]
+    stream = open(path, "r", encoding="utf-8-sig", newline="")
+    return stream, [stream]
+
+
+def iter_source(path, limit=None):
+    """소스 파일의 행을 Patient 필드 딕셔너리로 하나씩 반환"""
+    stream, handles = open_source(path)
+    try:
+        for i, row in enumerate(csv.DictReader(stream)):
+            if limit is not None and i >= limit:
+                break
+            yield map_kaggle_row(row)
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def import_file(manager, path, limit=None):
+    """
+    소스 파일을 읽어 manager.create_many()로 일괄 등록
+
+    Returns:
+        tuple: (성공 여부, 결과 딕셔너리 또는 오류 메시지)
+            결과: {"added", "rejected", "rows", "seconds"}
+    """
+    counter = {"rows": 0}
+
+    def counted(rows):
+        for row in rows:
+            counter["rows"] += 1
+            yield row
+
+    start = time.perf_counter()
+    ok, result = manager.create_many(counted(iter_source(path, limit)))
+    elapsed = time.perf_counter() - start
+    if not ok:
+        return (False, result)
+
+    result["rows"] = counter["rows"]
+    result["seconds"] = elapsed
+    return (True, result)
+
+
+def write_rejects(path, rejected):
+    """거부된 행 목록을 CSV로 저장"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["row", "error"])
+        writer.writerows(rejected)
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="Kaggle Healthcare Dataset 일괄 가져오기")
+    parser.add_argument("source", help="healthcare_dataset.csv 또는 Kaggle에서 받은 zip 파일")
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 N행만 가져오기")
+    parser.add_argument("--rejects", default=None, help="거부된 행 목록을 저장할 CSV 경로")
+    parser.add_argument("--backend", choices=PatientManager.BACKENDS, default="csv")
+    args = parser.parse_args(argv)
+
+    manager = PatientManager(backend=args.backend)
+    before = len(manager.patients)
+    try:
+        ok, result = import_file(manager, args.source, args.limit)
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"❌ 가져오기 오류: {e}")
+        return 1
+    finally:
+        manager.close()
+
+    if not ok:
+        print(f"❌ {result}")
+        return 1
+
+    rows, seconds = result["rows"], result["seconds"]
+    rate = rows / seconds if seconds > 0 else 0
+    print(f"✅ {len(result['added'])}명 등록 (읽은 행 {rows}, 거부 {len(result['rejected'])})")
+    print(f"   환자 수: {before} → {before + len(result['added'])}")
+    print(f"   소요 시간: {seconds:.2f}초 ({rate:,.0f}행/초)")
+
+    for row_number, message in result["rejected"][:10]:
+        print(f"   ⚠️ {row_number}행: {message}")
+    if len(result["rejected"]) > 10:
+        print(f"   ... 외 {len(result['rejected']) - 10}건")
+    if args.rejects and result["rejected"]:
+        write_rejects(args.rejects, result["rejected"])
+        print(f"   거부 목록 저장: {args.rejects}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""
+patient_journal.py
+환자 데이터 변경 로그(저널) 관리 클래스
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import csv
+import json
+import os
+import tempfile
+import threading
+
+
+class PatientJournal:
+    """
+    환자 CSV 스냅샷 + 추가 전용 변경 로그를 관리하는 클래스
+
+    변경이 생길 때마다 CSV 전체를 다시 쓰는 대신 한 줄짜리 기록을 로그에 추가하고,
+    로그가 스냅샷 크기의 절반(최소 compact_bytes)을 넘으면 새 CSV 스냅샷으로 압축(compaction).
+    기준이 스냅샷 크기에 비례하므로 환자 수가 많아도 압축 비용을 나눈 변경 1건당 비용이 일정함
+
+    로그 기록은 두 종류뿐이며 모두 같은 기록을 다시 적용해도 결과가 같음(멱등)
+        {"op": "put", "data": {...}}     환자 전체 정보 저장 (등록/수정)
+        {"op": "del", "patient_id": ...} 환자 삭제
+
+    Attributes:
+        snapshot_path (str): CSV 스냅샷 파일 경로
+        log_path (str): 변경 로그 파일 경로
+        sealed_path (str): 압축 중인(봉인된) 로그 파일 경로
+        compact_bytes (int): 압축 기준 최소 크기 (로그가 이 크기와 스냅샷 크기의 절반을 모두 넘으면 압축)
+        background (bool): 압축을 별도 스레드에서 수행할지 여부
+        lock (PatientFileLock): 백그라운드 압축 중 잡을 쓰기 잠금 (None이면 잠그지 않음)
+    """
+
+    def __init__(self, snapshot_path, fieldnames, compact_bytes=1_000_000, background=True, lock=None):
+        """생성자: 파일 경로 및 압축 기준 설정"""
+        self.lock = lock
+        self.snapshot_path = snapshot_path
+        self.fieldnames = fieldnames
+        self.log_path = os.path.splitext(snapshot_path)[0] + ".journal"
+        self.sealed_path = self.log_path + ".sealed"
+        self.compact_bytes = compact_bytes
+        self.background = background
+        self._worker = None
+        self._sealed_stamp = None   # 봉인 직후 봉인 로그 상태 (압축 마무리 전에 바뀌었는지 확인)
+
+    # ==================== 기록 ====================
+
+    def append(self, op, patient):
+        """
+        변경 기록 한 줄 추가
+
+        Args:
+            op (str): "put" 또는 "del"
+            patient (Patient): 대상 환자
+        """
+        if op == "put":
+            entry = {"op": "put", "data": patient.to_dict()}
+        else:
+            entry = {"op": "del", "patient_id": patient.patient_id}
+
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def append_many(self, op, patients):
+        """여러 환자의 변경 기록을 한 번에 추가 (파일을 한 번만 열어 기록)"""
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            for patient in patients:
+                if op == "put":
+                    entry = {"op": "put", "data": patient.to_dict()}
+                else:
+                    entry = {"op": "del", "patient_id": patient.patient_id}
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def log_size(self):
+        """현재 변경 로그 크기 (바이트)"""
+        try:
+            return os.path.getsize(self.log_path)
+        except OSError:
+            return 0
+
+    def needs_compaction(self):
+        """압축이 필요한지 여부 (로그가 최소 크기와 스냅샷 크기의 절반을 모두 넘었는지)"""
+        size = self.log_size()
+        if size < self.compact_bytes:
+            return False
+        try:
+            return size >= os.path.getsize(self.snapshot_path) // 2
+        except OSError:
+            return True
+
+    # ==================== 복원 ====================
+
+    def replay(self, patients, patient_cls):
+        """
+        스냅샷에서 읽은 환자 목록에 변경 로그를 순서대로 적용
+
+        압축 도중 종료된 경우 남아 있는 봉인 로그를 먼저 적용
+
+        Args:
+            patients (list): 스냅샷에서 읽은 Patient 리스트 (직접 수정됨)
+            patient_cls (type): Patient 클래스
+
+        Returns:
+            int: 적용한 기록 수
+        """
+        position = {p.patient_id: i for i, p in enumerate(patients)}
+        deleted = set()
+        applied = 0
+
+        for path in (self.sealed_path, self.log_path):
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # 비정상 종료로 잘린 마지막 줄은 무시
+                        continue
+
+                    if entry.get("op") == "put":
+                        patient = patient_cls.from_dict(entry["data"])
+                        pid = patient.patient_id
+                        if pid in position:
+                            patients[position[pid]] = patient
+                        else:
+                            position[pid] = len(patients)
+                            patients.append(patient)
+                        deleted.discard(pid)
+                    elif entry.get("op") == "del":
+                        pid = entry.get("patient_id")
+                        if pid in position:
+                            deleted.add(pid)
+                    applied += 1
+
+        if deleted:
+            patients[:] = [p for p in patients if p.patient_id not in deleted]
+        return applied
+
+    # ==================== 압축 ====================
+
+    def write_snapshot(self, rows):
+        """
+        CSV 스냅샷 작성 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            rows (list): 환자 정보 딕셔너리 리스트
+        """
+        os.replace(self._write_temp(rows), self.snapshot_path)
+
+    def _write_temp(self, rows):
+        """스냅샷 내용을 같은 폴더의 임시 파일에 쓰고 경로 반환 (압축 스레드와 겹치지 않도록 이름은 매번 다름)"""
+        folder = os.path.dirname(self.snapshot_path) or "."
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=os.path.basename(self.snapshot_path) + ".",
+                                        suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=self.fieldnames)
+                writer.writeheader()
+                writer.writerows(rows)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return tmp_path
+
+    def reset(self):
+        """
+        스냅샷이 최신 상태가 된 뒤 로그 비우기 (쓰기 잠금 안에서 호출)
+
+        진행 중인 백그라운드 압축은 기다리지 않음: 봉인 로그가 없어진 것을 보고 스스로 결과를 버림
+        """
+        for path in (self.log_path, self.sealed_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def compact(self, patients):
+        """
+        현재 상태를 새 스냅샷으로 저장하고 로그 정리
+
+        현재 로그를 봉인한 뒤(이후 변경은 새 로그에 기록) 스냅샷을 작성하고 봉인 로그를 삭제.
+        쓰기 잠금 안에서 호출하며, background가 True이면 스냅샷 파일 작성은 별도 스레드에서
+        잠금 없이 하고 마지막 교체/봉인 로그 삭제만 잠금을 잡고 하므로 그 사이 저장이 기다리지 않음
+
+        Args:
+            patients (list): 현재 Patient 리스트
+
+        Returns:
+            bool: 압축을 시작했으면 True (이미 진행 중이면 False)
+        """
+        if self._worker is not None and self._worker.is_alive():
+            return False
+        if os.path.exists(self.sealed_path):
+            # 이전 압축이 끝나지 않은 채 종료된 경우: 현재 로그를 이어 붙여 하나로 봉인
+            if os.path.exists(self.log_path):
+                with open(self.log_path, "r", encoding="utf-8") as src, \
+                        open(self.sealed_path, "a", encoding="utf-8") as dst:
+                    dst.write(src.read())
+                os.remove(self.log_path)
+        elif os.path.exists(self.log_path):
+            os.replace(self.log_path, self.sealed_path)
+        self._sealed_stamp = self._stat_sealed()
+
+        rows = [p.to_dict() for p in patients]
+
+        if self.background:
+            self._worker = threading.Thread(target=self._finish_compaction, args=(rows,))
+            self._worker.start()
+        else:
+            self._finish_compaction(rows)
+        return True
+
+    def _stat_sealed(self):
+        """봉인 로그 상태 (inode, 크기, 수정 시각), 없으면 None"""
+        try:
+            stat = os.stat(self.sealed_path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _finish_compaction(self, rows):
+        """임시 스냅샷을 잠금 없이 작성한 뒤 잠금 안에서 교체하고 봉인 로그 삭제"""
+        try:
+            tmp_path = self._write_temp(rows)
+        except OSError as e:
+            # 봉인 로그가 남아 있으므로 다음 로드 시 그대로 복원됨
+            print(f"저널 압축 오류: {e}")
+            return
+        try:
+            if self.lock is None:
+                self._replace_compacted(tmp_path)
+            else:
+                with self.lock:
+                    self._replace_compacted(tmp_path)
+        except (OSError, TimeoutError) as e:
+            print(f"저널 압축 오류: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _replace_compacted(self, tmp_path):
+        """
+        봉인 로그가 봉인한 그대로일 때만 스냅샷 교체 후 봉인 로그 삭제
+
+        그 사이 전체 저장(reset)이나 다른 프로그램의 압축으로 봉인 로그가 바뀌었으면
+        이 스냅샷은 최신이 아니므로 버림 (봉인/변경 로그는 그대로 남아 다음 로드 때 적용)
+        """
+        if self._sealed_stamp is None or self._stat_sealed() != self._sealed_stamp:
+            return
+        os.replace(tmp_path, self.snapshot_path)
+        os.remove(self.sealed_path)
+
+    def wait(self):
+        """진행 중인 백그라운드 압축이 끝날 때까지 대기"""
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
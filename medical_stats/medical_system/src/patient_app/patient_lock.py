@@ -0,0 +1,110 @@
+"""
+patient_lock.py
+환자 데이터 파일 쓰기 잠금 (여러 프로그램이 같은 파일을 쓸 때 사용)
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# 잠금 대기 시간 기본값 (초)
+LOCK_TIMEOUT = 5.0
+
+# 잠금 재시도 간격 (초)
+RETRY_INTERVAL = 0.05
+
+
+class PatientFileLock:
+    """
+    잠금 파일을 이용한 권고(advisory) 잠금
+
+    같은 잠금 파일을 쓰는 PatientManager끼리만 서로 기다림 (잠금을 쓰지 않는 프로그램은 막지 못함).
+    한 프로세스 안에서는 스레드 잠금(RLock)으로 먼저 순서를 정하고,
+    처음 잡을 때만 운영체제 파일 잠금을 잡으므로 같은 스레드에서 중첩해서 잡아도 됨
+
+    Attributes:
+        lock_path (str): 잠금 파일 경로
+        timeout (float): 잠금 대기 시간 (초, 넘으면 TimeoutError)
+    """
+
+    def __init__(self, lock_path, timeout=LOCK_TIMEOUT):
+        """생성자: 잠금 파일 경로 설정 (파일은 처음 잡을 때 생성)"""
+        self.lock_path = lock_path
+        self.timeout = timeout
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def acquire(self):
+        """
+        잠금 잡기 (다른 프로그램이 잡고 있으면 timeout까지 대기)
+
+        Raises:
+            TimeoutError: timeout 안에 잠금을 잡지 못한 경우
+        """
+        if not self._thread_lock.acquire(timeout=self.timeout):
+            raise TimeoutError(f"잠금 대기 시간 초과: {self.lock_path}")
+        if self._depth == 0:
+            try:
+                self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        """잠금 풀기 (중첩해서 잡은 경우 마지막에 풀 때 파일 잠금 해제)"""
+        self._depth -= 1
+        if self._depth == 0:
+            self._unlock_file()
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def _lock_file(self):
+        """운영체제 파일 잠금 (기다리지 않는 잠금을 timeout까지 반복 시도)"""
+        os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+        f = open(self.lock_path, "a+")
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                self._file = f
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    f.close()
+                    raise TimeoutError(f"다른 프로그램이 환자 데이터를 저장 중입니다: {self.lock_path}")
+                time.sleep(RETRY_INTERVAL)
+
+    def _unlock_file(self):
+        """운영체제 파일 잠금 해제"""
+        f, self._file = self._file, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            f.close()
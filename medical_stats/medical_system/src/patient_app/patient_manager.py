@@ -7,13 +7,30 @@ Date: 2026-01-09
 """
 
 import csv
+import json
 import os
+import threading
 from datetime import datetime
+
+import perf_monitor
 from .patient import Patient
+from .patient_journal import PatientJournal
+from .patient_lock import PatientFileLock
+from .patient_writer import PatientWriteBehind
+from .patient_index import PatientSearchIndex
+from .patient_store import PatientSQLiteStore, migrate_csv
+from .patient_table import PatientTable
+from .patient_stats import PatientStatistics, diff_statistics
 
 
+@perf_monitor.instrument
 class PatientManager:
-    """환자 데이터를 관리하는 CRUD 클래스"""
+    """
+    환자 데이터를 관리하는 CRUD 클래스 (MEDICAL_PERF=1이면 공개 메서드 성능 측정)
+    
+    저장은 잠금 파일(patients.lock)을 잡고 하며 세대 번호를 올림.
+    다른 프로그램이 먼저 저장했으면 덮어쓰지 않고 실패 (conflict), has_changed()로 변경 확인
+    """
     
     CSV_HEADERS = [
         "patient_id", "name", "age", "gender", "blood_type",
@@ -22,8 +39,36 @@ class PatientManager:
         "admission_type", "discharge_date", "medication", "test_results"
     ]
     
-    def __init__(self, base_path=None):
-        """생성자"""
+    # 필드 지정 검색이 가능한 필드
+    SEARCH_FIELDS = ("name", "medical_condition", "doctor", "hospital")
+    
+    # 사용 가능한 저장 방식
+    BACKENDS = ("csv", "journal", "sqlite")
+    
+    def __init__(self, base_path=None, journal=False, compact_bytes=1_000_000, backend=None,
+                 columnar=False, debug_stats=False, write_behind=False):
+        """
+        생성자
+        
+        backend: 저장 방식
+            "csv"      변경마다 CSV 전체 저장 (기본)
+            "journal"  CSV 스냅샷 + 변경 로그 (journal=True와 같음, 로그가
+                       compact_bytes와 스냅샷 크기의 절반을 넘으면 CSV 스냅샷으로 압축)
+            "sqlite"   data/patients.db 사용 (DB 파일이 없으면 처음 열 때 CSV 내용을 옮겨 옴)
+        
+        columnar: True이면 환자 정보를 열 저장 테이블(PatientTable)에 보관하고 통계를 열 단위로 계산
+            (patients 항목은 Patient와 같은 속성/메서드의 행 보기)
+        debug_stats: True이면 get_statistics()마다 통계 카운터를 전체 재계산 결과와 비교
+        write_behind: True이면 변경을 메모리에 바로 반영하고 CSV 저장은 쓰기 스레드가 모아서 함
+            (csv 저장 방식만, 창 닫기 전 flush(), 실패는 poll_writes()로 확인)
+        """
+        if backend is None:
+            backend = "journal" if journal else "csv"
+        if backend not in self.BACKENDS:
+            raise ValueError(f"지원하지 않는 저장 방식입니다: {backend}")
+        if write_behind and backend != "csv":
+            raise ValueError("쓰기 지연 저장은 csv 저장 방식에서만 사용할 수 있습니다.")
+        
         if base_path is None:
             # 현재 파일 기준으로 상위 폴더 찾기
             current_file = os.path.abspath(__file__)
@@ -33,7 +78,42 @@ class PatientManager:
             self.base_path = base_path
         
         self.file_path = os.path.join(self.base_path, "data", "patients.csv")
+        self.db_path = os.path.splitext(self.file_path)[0] + ".db"
+        self.columnar = columnar
+        self.debug_stats = debug_stats
         self.patients = []
+        self.backend = backend
+        self.journal = None
+        self.store = None
+        # 같은 파일을 쓰는 다른 프로그램(PatientManager)과 공유하는 쓰기 잠금
+        self.lock = PatientFileLock(os.path.splitext(self.file_path)[0] + ".lock")
+        if backend == "journal":
+            self.journal = PatientJournal(self.file_path, self.CSV_HEADERS, compact_bytes,
+                                          lock=self.lock)
+        elif backend == "sqlite":
+            self.store = self._open_store()
+        self.meta_path = os.path.splitext(self.file_path)[0] + ".meta.json"
+        
+        # 환자 ID 인덱스 (patient_id → Patient)와 다음 ID 번호
+        self._by_id = {}
+        self._next_id = 1
+        
+        # 검색용 보조 인덱스 (필드별 정확 일치 + 부분 문자열)
+        self._index = PatientSearchIndex()
+        
+        # 통계 카운터 (등록/수정/삭제 때 증감만 반영)
+        self._stats = PatientStatistics()
+        
+        # 마지막으로 읽거나 쓴 데이터 버전 (부가 정보 파일의 세대 번호와 파일 상태)
+        self._generation = 0
+        self._meta_stamp = None
+        self.conflict = False
+        
+        # 쓰기 지연 모드의 쓰기 스레드와 메모리 상태 잠금 (변경과 저장할 행 복사가 겹치지 않도록)
+        self.writer = None
+        self.last_write = None
+        self._write_error = None
+        self._state_lock = threading.RLock()
         
         # 디버깅용 출력 (문제 발생 시 확인용)
         print(f"[PatientManager] base_path: {self.base_path}")
@@ -41,24 +121,54 @@ class PatientManager:
         print(f"[PatientManager] file exists: {os.path.exists(self.file_path)}")
         
         self.load_from_file()
+        if write_behind:
+            self.writer = PatientWriteBehind(self._snapshot_rows, self._write_behind, self._state_lock)
+    
+    def _open_store(self):
+        """SQLite 저장소 열기 (DB 파일이 없고 CSV가 있으면 먼저 이전)"""
+        with self.lock:
+            if not os.path.exists(self.db_path) and os.path.exists(self.file_path):
+                migrate_csv(self.file_path, self.db_path, self.CSV_HEADERS)
+        return PatientSQLiteStore(self.db_path, self.CSV_HEADERS)
     
     def load_from_file(self):
-        """CSV 파일에서 데이터 로드"""
-        self.patients = []
+        """CSV 파일에서 데이터 로드 (저널 모드면 변경 로그까지 적용, SQLite 모드면 DB에서 로드)"""
+        if self.journal is not None:
+            self.journal.wait()
+        if self.writer is not None:
+            # 예약된 저장을 먼저 마침 (실패하면 되돌리고 poll_writes()로 알림)
+            self.writer.flush()
+            self._write_error = self.writer.process() or self._write_error
+        self.patients = PatientTable() if self.columnar else []
         try:
-            if os.path.exists(self.file_path):
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        patient = Patient.from_dict(row)
-                        self.patients.append(patient)
-                return True
-            else:
-                self._create_empty_file()
-                return True
+            with self.lock:
+                self._read_version()
+                if self.store is not None:
+                    self.patients.extend(Patient.from_dict(row) for row in self.store.load_all())
+                elif os.path.exists(self.file_path):
+                    with open(self.file_path, "r", encoding="utf-8") as f:
+                        reader = csv.DictReader(f)
+                        for row in reader:
+                            patient = Patient.from_dict(row)
+                            self.patients.append(patient)
+                else:
+                    self._create_empty_file()
+                
+                if self.journal is not None:
+                    self.journal.replay(self.patients, Patient)
+            perf_monitor.read_file(self.db_path if self.store is not None else self.file_path,
+                                   len(self.patients))
+            return True
         except Exception as e:
             print(f"파일 로드 오류: {e}")
             return False
+        finally:
+            self._rebuild_index()
+    
+    def _read_version(self):
+        """부가 정보 파일의 세대 번호와 파일 상태를 현재 버전으로 기록 (잠금 안에서 호출)"""
+        self._meta_stamp = self._stat_meta()
+        self._generation = int(self._load_meta().get("generation", 0))
     
     def _create_empty_file(self):
         """빈 CSV 파일 생성"""
@@ -67,35 +177,275 @@ class PatientManager:
             writer = csv.writer(f)
             writer.writerow(self.CSV_HEADERS)
     
+    # ==================== 쓰기 지연 저장 ====================
+    
+    def _schedule(self, next_id, undo):
+        """쓰기 스레드에 저장 예약 (앞서 예약한 저장이 실패한 채 처리되지 않았으면 False)"""
+        if self.writer.failed():
+            return False
+        if next_id is not None:
+            # 저장 전에 다음 등록이 오므로 ID 번호는 바로 올림 (실패해도 다시 발급하지 않음)
+            self._next_id = max(self._next_id, next_id)
+        self.last_write = self.writer.submit(undo)
+        return True
+    
+    def _snapshot_rows(self):
+        """쓰기 스레드가 저장할 전체 행 (메모리 상태 잠금 안에서 호출)"""
+        return [p.to_dict() for p in self.patients]
+    
+    def _write_behind(self, rows):
+        """쓰기 스레드에서 모은 변경을 한 번에 저장 (성공 여부, 실패 메시지)"""
+        if self._commit(lambda: self._write_all(rows)):
+            return (True, "")
+        return (False, self._failure_message())
+    
+    def flush(self, timeout=None):
+        """예약된 저장을 모두 마침 (창 닫기 전 호출), (성공 여부, 메시지) 반환 - 실패한 변경은 되돌림"""
+        if self.writer is None:
+            return (True, "")
+        if self.writer.flush(timeout):
+            return (True, "")
+        error = self.poll_writes()
+        return (False, error or "저장 대기 시간이 초과되었습니다.")
+    
+    def poll_writes(self):
+        """예약 저장 실패 확인 (실패했으면 그 뒤 변경까지 되돌리고 메시지 반환, 없으면 None)"""
+        error, self._write_error = self._write_error, None
+        if self.writer is not None:
+            error = self.writer.process() or error
+        return error
+    
+    # ==================== 쓰기 잠금 / 변경 감지 ====================
+    
     def save_to_file(self):
-        """데이터를 CSV 파일에 저장"""
+        """데이터 전체 저장 (다른 프로그램이 마지막 로드 이후 저장했으면 덮어쓰지 않고 실패, conflict = True)"""
+        return self._commit(self._write_all)
+    
+    def _persist(self, op, patient, next_id=None, undo=None):
+        """변경 내용 저장 (쓰기 잠금 안에서 _write_change 실행, 성공하면 next_id 기록)"""
+        if self.writer is not None:
+            return self._schedule(next_id, undo)
+        return self._commit(lambda: self._write_change(op, patient), next_id)
+    
+    def _persist_many(self, patients, next_id=None, undo=None):
+        """여러 환자 등록을 한 번에 저장 (쓰기 잠금 안에서 _write_changes 실행)"""
+        if self.writer is not None:
+            return self._schedule(next_id, undo)
+        return self._commit(lambda: self._write_changes(patients), next_id)
+    
+    def _commit(self, write, next_id=None):
+        """
+        쓰기 잠금을 잡고 write() 실행 후 세대 번호를 올려 부가 정보 파일에 기록
+        
+        세대 번호가 마지막으로 읽거나 쓴 값과 다르면 다른 프로그램이 저장한 것이므로 쓰지 않고 실패
+        """
+        # 쓰기 지연 모드에서는 쓰기 스레드에서도 호출되므로 충돌 여부/세대 번호는 메모리 상태 잠금 안에서 갱신
+        # (부가 정보 파일 기록과 세대 번호 반영 사이에 has_changed()가 끼어들지 않도록)
+        with self._state_lock:
+            self.conflict = False
+        # 백그라운드 압축은 기다리지 않음 (압축 스레드는 마지막 스냅샷 교체 때만 잠금을 잡음)
+        try:
+            with self.lock:
+                if int(self._load_meta().get("generation", 0)) != self._generation:
+                    with self._state_lock:
+                        self.conflict = True
+                    print("저장 충돌: 다른 프로그램이 환자 데이터를 변경했습니다.")
+                    return False
+                if not write():
+                    return False
+                # 부가 정보 파일에 기록된 뒤에만 세대 번호/다음 ID 번호 반영 (실패하면 저장 실패)
+                with self._state_lock:
+                    generation = self._generation + 1
+                    if next_id is None or next_id < self._next_id:
+                        next_id = self._next_id
+                    if not self._save_meta(next_id, generation):
+                        return False
+                    self._generation = generation
+                    self._next_id = next_id
+                    self._meta_stamp = self._stat_meta()
+                return True
+        except TimeoutError as e:
+            print(f"잠금 오류: {e}")
+            return False
+    
+    def _save_error(self):
+        """저장 실패 메시지 (쓰기 지연 모드에서 앞선 저장이 실패했으면 그 변경들을 되돌리고 그 메시지)"""
+        error = self.poll_writes()
+        if error is not None:
+            return error
+        return self._failure_message()
+    
+    def _failure_message(self):
+        """저장 실패 메시지 (다른 프로그램과 충돌했으면 새로고침 안내)"""
+        if self.conflict:
+            return "다른 곳에서 환자 데이터가 변경되었습니다.\n새로고침 후 다시 시도하세요."
+        return "파일 저장에 실패했습니다."
+    
+    def _stat_meta(self):
+        """부가 정보 파일 상태 (수정 시각, 크기), 파일이 없으면 None"""
+        try:
+            stat = os.stat(self.meta_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def has_changed(self):
+        """다른 프로그램이 변경했는지 (부가 정보 파일이 그대로면 stat 한 번, 바뀐 경우에만 세대 번호 비교)"""
+        with self._state_lock:
+            stamp = self._stat_meta()
+            if stamp == self._meta_stamp:
+                return False
+            if int(self._load_meta().get("generation", 0)) != self._generation:
+                return True
+            self._meta_stamp = stamp
+            return False
+    
+    def reload_if_changed(self):
+        """다른 프로그램이 변경한 경우에만 다시 로드 (다시 로드했으면 True)"""
+        if not self.has_changed():
+            return False
+        return self.load_from_file()
+    
+    def _write_all(self, rows=None):
+        """데이터를 CSV 파일에 저장 (쓰기 잠금 안에서 호출, 저널 모드면 새 스냅샷 작성 후 로그 비움, SQLite 모드면 DB 내용 교체)"""
+        if rows is None:
+            rows = [p.to_dict() for p in self.patients]
         try:
+            if self.store is not None:
+                self.store.replace_all(rows)
+                perf_monitor.record_io(rows_written=len(rows))
+                return True
+            
+            if self.journal is not None:
+                # 진행 중인 압축은 봉인 로그가 지워진 것을 보고 결과를 버림
+                self.journal.write_snapshot(rows)
+                self.journal.reset()
+                perf_monitor.wrote_file(self.file_path, len(rows))
+                return True
+            
+            # 임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 이전 파일이 남음)
             os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-            with open(self.file_path, "w", newline="", encoding="utf-8") as f:
+            tmp_path = self.file_path + ".tmp"
+            with open(tmp_path, "w", newline="", encoding="utf-8") as f:
                 writer = csv.DictWriter(f, fieldnames=self.CSV_HEADERS)
                 writer.writeheader()
-                for patient in self.patients:
-                    writer.writerow(patient.to_dict())
+                writer.writerows(rows)
+            os.replace(tmp_path, self.file_path)
+            perf_monitor.wrote_file(self.file_path, len(rows))
             return True
         except Exception as e:
             print(f"파일 저장 오류: {e}")
             return False
     
-    def generate_id(self):
-        """새 환자 ID 생성"""
-        if not self.patients:
-            return "P001"
-        
-        max_id = 0
-        for patient in self.patients:
+    def _write_change(self, op, patient):
+        """변경 내용 저장 (기본: CSV 전체 저장, 저널 모드: 로그 한 줄 추가, SQLite 모드: 해당 행만 기록)"""
+        if self.store is not None:
             try:
-                num = int(patient.patient_id[1:])
-                if num > max_id:
-                    max_id = num
-            except (ValueError, IndexError):
-                continue
+                if op == "put":
+                    self.store.put(patient.to_dict())
+                else:
+                    self.store.delete(patient.patient_id)
+                perf_monitor.record_io(rows_written=1)
+                return True
+            except Exception as e:
+                print(f"DB 저장 오류: {e}")
+                return False
+        
+        if self.journal is None:
+            return self._write_all()
+        
+        try:
+            size_before = perf_monitor.file_size(self.journal.log_path)
+            self.journal.append(op, patient)
+            perf_monitor.wrote_file(self.journal.log_path, 1, size_before)
+        except Exception as e:
+            print(f"저널 기록 오류: {e}")
+            return False
         
-        return f"P{max_id + 1:03d}"
+        # 로그가 기준 크기를 넘으면 스냅샷으로 압축 (실패해도 로그는 유효)
+        try:
+            if self.journal.needs_compaction():
+                self.journal.compact(self.patients)
+        except Exception as e:
+            print(f"저널 압축 오류: {e}")
+        return True
+    
+    def _write_changes(self, patients):
+        """여러 환자 등록을 한 번에 저장 (CSV 1회 저장 / 저널 일괄 추가 / SQLite 트랜잭션 1회)"""
+        if self.store is None and self.journal is None:
+            return self._write_all()
+        
+        try:
+            if self.store is not None:
+                self.store.put_many(p.to_dict() for p in patients)
+                perf_monitor.record_io(rows_written=len(patients))
+                return True
+            size_before = perf_monitor.file_size(self.journal.log_path)
+            self.journal.append_many("put", patients)
+            perf_monitor.wrote_file(self.journal.log_path, len(patients), size_before)
+        except Exception as e:
+            print(f"일괄 저장 오류: {e}")
+            return False
+        
+        try:
+            if self.journal.needs_compaction():
+                self.journal.compact(self.patients)
+        except Exception as e:
+            print(f"저널 압축 오류: {e}")
+        return True
+    
+    def close(self):
+        """진행 중인 저장 작업 마무리 (창 닫을 때 호출)"""
+        if self.writer is not None:
+            ok, msg = self.flush()
+            if not ok:
+                print(f"저장 오류: {msg}")
+            self.writer.close()
+            self.writer = None
+        if self.journal is not None:
+            self.journal.wait()
+        if self.store is not None:
+            self.store.close()
+    
+    @staticmethod
+    def _id_number(patient_id):
+        """환자 ID의 숫자 부분 (형식이 다르면 0)"""
+        try:
+            return int(patient_id[1:])
+        except (ValueError, IndexError, TypeError):
+            return 0
+    
+    def _load_meta(self):
+        """부가 정보 파일 읽기 (없거나 손상되었으면 빈 딕셔너리)"""
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_meta(self, next_id, generation):
+        """부가 정보 파일 저장 (임시 파일에 쓴 뒤 교체, 성공 여부 반환)"""
+        try:
+            tmp_path = self.meta_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"next_id": next_id, "generation": generation}, f)
+            os.replace(tmp_path, self.meta_path)
+            return True
+        except OSError as e:
+            print(f"부가 정보 저장 오류: {e}")
+            return False
+    
+    def _rebuild_index(self):
+        """ID/검색 인덱스, 통계 카운터와 다음 ID 번호 재구성 (삭제된 ID는 다시 발급하지 않음)"""
+        self._by_id = {p.patient_id: p for p in self.patients}
+        self._index.build(self.patients)
+        self._stats.build(self.patients)
+        max_id = max((self._id_number(pid) for pid in self._by_id), default=0)
+        self._next_id = max(max_id + 1, int(self._load_meta().get("next_id", 1)))
+    
+    def generate_id(self):
+        """새 환자 ID 생성 (O(1), 999 이후는 P1000 형식)"""
+        return f"P{self._next_id:03d}"
     
     def create(self, data):
         """새 환자 등록"""
@@ -111,49 +461,114 @@ class PatientManager:
         if not is_valid:
             return (False, error_msg)
         
-        self.patients.append(patient)
+        with self._state_lock:
+            self.patients.append(patient)
+            patient = self.patients[-1]  # 열 저장 모드에서는 추가된 행 보기
+            self._by_id[new_id] = patient
+            self._index.add(patient)
+            self._stats.add(patient)
+            
+            def undo():
+                self.patients.remove(patient)
+                del self._by_id[new_id]
+                self._index.remove(patient)
+                self._stats.remove(patient)
+            
+            if self._persist("put", patient, next_id=self._id_number(new_id) + 1, undo=undo):
+                return (True, new_id)
+            undo()
+            return (False, self._save_error())
+    
+    def create_many(self, records):
+        """
+        여러 환자 일괄 등록 (검사 통과한 행에 차례로 ID 발급, 저장은 마지막에 한 번)
         
-        if self.save_to_file():
-            return (True, new_id)
-        else:
-            self.patients.pop()
-            return (False, "파일 저장에 실패했습니다.")
+        Returns:
+            tuple: (성공 여부, {"added": ID 리스트, "rejected": [(행 번호, 오류 메시지)]} 또는 오류 메시지)
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        next_id = self._next_id
+        added = []
+        rejected = []
+        
+        for row_number, data in enumerate(records, start=1):
+            data = dict(data)
+            data["patient_id"] = f"P{next_id:03d}"
+            if not data.get("date_of_admission"):
+                data["date_of_admission"] = today
+            
+            try:
+                patient = Patient.from_dict(data)
+            except (ValueError, TypeError) as e:
+                rejected.append((row_number, f"값 변환 오류: {e}"))
+                continue
+            
+            is_valid, error_msg = patient.validate()
+            if not is_valid:
+                rejected.append((row_number, error_msg.replace("\n", " / ")))
+                continue
+            
+            added.append(patient)
+            next_id += 1
+        
+        if not added:
+            return (True, {"added": [], "rejected": rejected})
+        
+        with self._state_lock:
+            # 리스트 및 인덱스에 추가 후 한 번에 저장
+            start = len(self.patients)
+            self.patients.extend(added)
+            added = self.patients[start:]
+            for patient in added:
+                self._by_id[patient.patient_id] = patient
+                self._index.add(patient)
+                self._stats.add(patient)
+            
+            def undo():
+                for patient in reversed(added):
+                    self.patients.remove(patient)
+                    del self._by_id[patient.patient_id]
+                    self._index.remove(patient)
+                    self._stats.remove(patient)
+            
+            if self._persist_many(added, next_id=next_id, undo=undo):
+                return (True, {"added": [p.patient_id for p in added], "rejected": rejected})
+            
+            # 저장 실패 시 롤백
+            undo()
+            return (False, self._save_error())
     
     def read_all(self):
         """모든 환자 목록 조회"""
         return self.patients
     
     def read_by_id(self, patient_id):
-        """ID로 환자 조회"""
-        for patient in self.patients:
-            if patient.patient_id == patient_id:
-                return patient
-        return None
+        """ID로 환자 조회 (인덱스 사용, O(1))"""
+        return self._by_id.get(patient_id)
     
     def search(self, keyword, field="all"):
-        """환자 검색"""
+        """환자 검색 (필드별 n-gram 인덱스로 후보를 찾은 뒤 포함 여부 확인)"""
         keyword = keyword.lower().strip()
-        results = []
-        
-        for patient in self.patients:
-            if field == "all":
-                searchable = f"{patient.patient_id} {patient.name} {patient.medical_condition} {patient.doctor} {patient.hospital}".lower()
-                if keyword in searchable:
-                    results.append(patient)
-            elif field == "name":
-                if keyword in patient.name.lower():
-                    results.append(patient)
-            elif field == "medical_condition":
-                if keyword in patient.medical_condition.lower():
-                    results.append(patient)
-            elif field == "doctor":
-                if keyword in patient.doctor.lower():
-                    results.append(patient)
-            elif field == "hospital":
-                if keyword in patient.hospital.lower():
-                    results.append(patient)
-        
-        return results
+        
+        if field != "all" and field not in self.SEARCH_FIELDS:
+            return []
+        if not keyword:
+            return list(self.patients)
+        
+        if field == "all":
+            if " " in keyword:
+                # 필드 경계(공백)를 넘는 검색어는 전체 문자열에서 직접 검색
+                return [
+                    p for p in self.patients
+                    if keyword in f"{p.patient_id} {p.name} {p.medical_condition} {p.doctor} {p.hospital}".lower()
+                ]
+            ids = set()
+            for name in PatientSearchIndex.TEXT_FIELDS:
+                ids |= self._index.substring(name, keyword)
+        else:
+            ids = self._index.substring(field, keyword)
+        
+        return [self._by_id[pid] for pid in self._index.ordered(ids)]
     
     def update(self, patient_id, updated_data):
         """환자 정보 수정"""
@@ -161,24 +576,47 @@ class PatientManager:
         if not patient:
             return (False, f"환자 ID {patient_id}를 찾을 수 없습니다.")
         
-        backup = patient.to_dict()
-        
-        for key, value in updated_data.items():
-            if hasattr(patient, key) and key != "patient_id":
-                setattr(patient, key, value)
-        
-        is_valid, error_msg = patient.validate()
-        if not is_valid:
-            for key, value in backup.items():
-                setattr(patient, key, value)
-            return (False, error_msg)
-        
-        if self.save_to_file():
-            return (True, "환자 정보가 수정되었습니다.")
-        else:
-            for key, value in backup.items():
-                setattr(patient, key, value)
-            return (False, "파일 저장에 실패했습니다.")
+        with self._state_lock:
+            backup = patient.to_dict()
+            
+            try:
+                for key, value in updated_data.items():
+                    if hasattr(patient, key) and key != "patient_id":
+                        setattr(patient, key, Patient.intern_value(key, value))
+            except (TypeError, OverflowError) as e:
+                # 열 저장 모드의 숫자 열에 숫자가 아닌 값
+                for key, value in backup.items():
+                    setattr(patient, key, value)
+                return (False, f"값 변환 오류: {e}")
+            
+            is_valid, error_msg = patient.validate()
+            if not is_valid:
+                for key, value in backup.items():
+                    setattr(patient, key, value)
+                return (False, error_msg)
+            
+            # 색인/통계 반영 (통계에서 값 형식 오류면 환자 정보와 색인도 되돌림)
+            updated = patient.to_dict()
+            self._index.update(patient, backup)
+            try:
+                self._stats.update(patient, backup)
+            except (TypeError, ValueError) as e:
+                for key, value in backup.items():
+                    setattr(patient, key, value)
+                self._index.update(patient, updated)
+                return (False, f"값 변환 오류: {e}")
+            
+            def undo():
+                current = patient.to_dict()
+                for key, value in backup.items():
+                    setattr(patient, key, value)
+                self._index.update(patient, current)
+                self._stats.update(patient, current)
+            
+            if self._persist("put", patient, undo=undo):
+                return (True, "환자 정보가 수정되었습니다.")
+            undo()
+            return (False, self._save_error())
     
     def delete(self, patient_id):
         """환자 삭제"""
@@ -186,13 +624,23 @@ class PatientManager:
         if not patient:
             return (False, f"환자 ID {patient_id}를 찾을 수 없습니다.")
         
-        self.patients.remove(patient)
-        
-        if self.save_to_file():
-            return (True, f"환자 {patient.name}({patient_id})이(가) 삭제되었습니다.")
-        else:
-            self.patients.append(patient)
-            return (False, "파일 저장에 실패했습니다.")
+        with self._state_lock:
+            position = self.patients.index(patient)
+            del self.patients[position]
+            del self._by_id[patient_id]
+            seq = self._index.remove(patient)
+            self._stats.remove(patient)
+            
+            def undo():
+                self.patients.insert(position, patient)
+                self._by_id[patient_id] = patient
+                self._index.add(patient, seq)
+                self._stats.add(patient)
+            
+            if self._persist("del", patient, undo=undo):
+                return (True, f"환자 {patient.name}({patient_id})이(가) 삭제되었습니다.")
+            undo()
+            return (False, self._save_error())
     
     def discharge_patient(self, patient_id, discharge_date=None):
         """환자 퇴원 처리"""
@@ -200,11 +648,38 @@ class PatientManager:
             discharge_date = datetime.now().strftime("%Y-%m-%d")
         return self.update(patient_id, {"discharge_date": discharge_date})
     
+    # 전체 통계(열 저장/SQLite 집계 결과) 중 이 매니저가 반환하는 항목
+    STATISTICS_KEYS = (
+        "total_patients", "male_count", "female_count", "male_ratio", "female_ratio",
+        "conditions", "hospitalized_count", "discharged_count",
+        "avg_age", "avg_billing", "total_billing"
+    )
+    
     def get_statistics(self):
-        """통계 계산"""
+        """통계 (등록/수정/삭제 때 갱신한 카운터에서 읽음, debug_stats 모드면 재계산 결과와 비교)"""
         if not self.patients:
             return None
         
+        counters = self._stats.snapshot()
+        stats = {key: counters[key] for key in self.STATISTICS_KEYS}
+        if self.debug_stats:
+            expected = self.compute_statistics()
+            mismatched = diff_statistics(stats, expected)
+            if mismatched:
+                print(f"⚠️ 통계 카운터 불일치: {', '.join(mismatched)}")
+                self._stats.build(self.patients)
+                return expected
+        return stats
+    
+    def compute_statistics(self):
+        """통계를 처음부터 계산 (열 저장 모드면 열 단위로, SQLite 모드도 SQL보다 빠른 메모리에서 집계)"""
+        if not self.patients:
+            return None
+        
+        if self.columnar:
+            stats = self.patients.statistics()
+            return {key: stats[key] for key in self.STATISTICS_KEYS}
+        
         total = len(self.patients)
         
         male_count = sum(1 for p in self.patients if p.gender == "Male")
@@ -235,6 +710,10 @@ class PatientManager:
         }
     
     def get_today_admissions(self):
-        """오늘 입원 환자 수"""
+        """오늘 입원 환자 수 (통계 카운터 사용)"""
         today = datetime.now().strftime("%Y-%m-%d")
-        return sum(1 for p in self.patients if p.date_of_admission == today)
+        return self._stats.admissions_on(today)
+    
+    def get_hospitalized_count(self):
+        """입원 중인 환자 수 (통계 카운터 사용)"""
+        return self._stats.hospitalized
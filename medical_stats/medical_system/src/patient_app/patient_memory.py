@@ -0,0 +1,99 @@
+"""
+patient_memory.py
+Patient 객체 메모리 사용량 측정 도구
+
+CSV에서 읽은 환자 N명을 이전 구조(인스턴스 __dict__, 문자열 중복)와
+현재 Patient(__slots__, 범주형 값 intern)로 각각 만들어 환자 1명당 메모리를 비교
+
+사용법:
+    (src 폴더에서 실행)
+    python -m patient_app.patient_memory [--count 1000000]
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import argparse
+import csv
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from .patient import Patient
+from .storage_tool import synthetic_rows, write_csv
+
+
+class DictPatient:
+    """비교용: 이전 Patient와 같은 구조 (인스턴스 __dict__, intern 없음)"""
+
+    def __init__(self, data):
+        """Patient.from_dict()와 같은 변환으로 16개 속성 설정"""
+        for name in Patient.__slots__:
+            setattr(self, name, data.get(name, ""))
+        self.age = int(self.age or 0)
+        self.billing_amount = float(self.billing_amount or 0)
+        self.room_number = int(self.room_number) if self.room_number else 0
+
+
+def measure(csv_path, factory):
+    """
+    CSV의 모든 행으로 객체를 만들어 유지할 때 늘어난 메모리 측정
+
+    Returns:
+        tuple: (객체 수, 늘어난 메모리(바이트), 인스턴스 1개 크기(바이트), 걸린 시간(초))
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with open(csv_path, "r", encoding="utf-8") as f:
+        objects = [factory(row) for row in csv.DictReader(f)]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    sample = objects[0]
+    shallow = sys.getsizeof(sample)
+    if hasattr(sample, "__dict__"):
+        shallow += sys.getsizeof(sample.__dict__)
+    count = len(objects)
+    del objects
+    return count, used, shallow, elapsed
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="Patient 객체 메모리 사용량 측정")
+    parser.add_argument("--count", type=int, default=1_000_000, help="환자 수")
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix="patient_memory_")
+    try:
+        csv_path = os.path.join(work_dir, "patients.csv")
+        write_csv(csv_path, synthetic_rows(args.count))
+
+        results = {
+            "이전 (__dict__)": measure(csv_path, DictPatient),
+            "현재 (__slots__ + intern)": measure(csv_path, Patient.from_dict)
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"\n📊 환자 {args.count:,}명 메모리 사용량 (CSV에서 읽은 값 기준)")
+    print(f"   {'구조':<24}{'1명당':>10}{'객체 자체':>10}{'전체':>12}{'생성 시간':>10}")
+    for label, (count, used, shallow, elapsed) in results.items():
+        print(f"   {label:<24}{used / count:>8.0f}B{shallow:>8}B"
+              f"{used / 1024 / 1024:>10.1f}MB{elapsed:>9.2f}s")
+
+    before = results["이전 (__dict__)"][1]
+    after = results["현재 (__slots__ + intern)"][1]
+    print(f"   → {(1 - after / before) * 100:.1f}% 감소")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""
+patient_store.py
+환자 데이터 SQLite 저장소
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import csv
+import os
+import sqlite3
+
+from .patient import Patient
+
+
+# 컬럼 타입 (나머지는 TEXT)
+COLUMN_TYPES = {
+    "age": "INTEGER",
+    "billing_amount": "REAL",
+    "room_number": "INTEGER"
+}
+
+# 인덱스를 만드는 컬럼 (patient_id는 기본키 인덱스 사용)
+INDEXED_COLUMNS = ("medical_condition", "doctor", "hospital", "date_of_admission")
+
+# 분포(개수)를 집계하는 컬럼 → get_statistics() 결과 키
+DISTRIBUTION_COLUMNS = {
+    "medical_condition": "conditions",
+    "admission_type": "admission_types",
+    "blood_type": "blood_types",
+    "test_results": "test_results"
+}
+
+# Patient.get_age_group()과 같은 구간
+AGE_GROUP_SQL = """
+    CASE
+        WHEN age < 20 THEN '10대 이하'
+        WHEN age < 30 THEN '20대'
+        WHEN age < 40 THEN '30대'
+        WHEN age < 50 THEN '40대'
+        WHEN age < 60 THEN '50대'
+        WHEN age < 70 THEN '60대'
+        ELSE '70대 이상'
+    END
+"""
+
+
+class PatientSQLiteStore:
+    """
+    환자 정보를 SQLite 파일에 저장하는 클래스
+
+    WAL 모드로 열어 변경 한 건마다 행 하나만 기록. 환자 목록을 불러오지 않고
+    DB 파일만으로 통계를 낼 때는 SQL 집계(statistics) 사용
+    (PatientManager는 메모리 목록에서 집계하는 쪽이 빠름). SQL 문은 모두 고정 문자열 + 자리표시자(?)이므로
+    sqlite3 모듈의 문장 캐시에서 준비된(prepared) 문장으로 재사용됨
+
+    Attributes:
+        db_path (str): DB 파일 경로
+        fieldnames (list): 컬럼 순서 (CSV 헤더와 동일)
+    """
+
+    def __init__(self, db_path, fieldnames):
+        """생성자: DB 연결 및 테이블/인덱스 생성"""
+        self.db_path = db_path
+        self.fieldnames = list(fieldnames)
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        columns = ", ".join(
+            "patient_id TEXT PRIMARY KEY" if name == "patient_id"
+            else f"{name} {COLUMN_TYPES.get(name, 'TEXT')} NOT NULL DEFAULT ''"
+            for name in self.fieldnames
+        )
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS patients ({columns})")
+            for name in INDEXED_COLUMNS:
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_patients_{name} ON patients({name})"
+                )
+
+        # 등록/수정 공용 문장: 기존 행은 rowid를 유지한 채 갱신 (목록 순서 보존)
+        placeholders = ", ".join("?" for _ in self.fieldnames)
+        updates = ", ".join(
+            f"{name}=excluded.{name}" for name in self.fieldnames if name != "patient_id"
+        )
+        self._upsert_sql = (
+            f"INSERT INTO patients ({', '.join(self.fieldnames)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(patient_id) DO UPDATE SET {updates}"
+        )
+
+    def _values(self, row):
+        """딕셔너리 → 컬럼 순서 값 튜플"""
+        return tuple(row.get(name, "") for name in self.fieldnames)
+
+    # ==================== 읽기/쓰기 ====================
+
+    def count(self):
+        """저장된 환자 수"""
+        return self.conn.execute("SELECT COUNT(*) FROM patients").fetchone()[0]
+
+    def load_all(self):
+        """
+        전체 환자 정보 (등록 순서)
+
+        Returns:
+            list: 환자 정보 딕셔너리 리스트
+        """
+        cursor = self.conn.execute("SELECT * FROM patients ORDER BY rowid")
+        return [dict(row) for row in cursor]
+
+    def put(self, row):
+        """환자 한 명 등록 또는 수정"""
+        with self.conn:
+            self.conn.execute(self._upsert_sql, self._values(row))
+
+    def put_many(self, rows):
+        """여러 환자 등록/수정 (하나의 트랜잭션)"""
+        with self.conn:
+            self.conn.executemany(self._upsert_sql, (self._values(row) for row in rows))
+
+    def delete(self, patient_id):
+        """환자 한 명 삭제"""
+        with self.conn:
+            self.conn.execute("DELETE FROM patients WHERE patient_id = ?", (patient_id,))
+
+    def replace_all(self, rows):
+        """전체 환자 정보 교체 (하나의 트랜잭션)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM patients")
+            self.conn.executemany(self._upsert_sql, (self._values(row) for row in rows))
+
+    def close(self):
+        """DB 연결 종료"""
+        self.conn.close()
+
+    # ==================== 통계 ====================
+
+    def statistics(self):
+        """
+        PatientManager.get_statistics()와 같은 형식의 통계를 SQL로 계산
+
+        분포 컬럼 조합별로 한 번에 GROUP BY 하여 테이블을 한 번만 읽고,
+        조합 결과를 처음 등장한 순서(MIN(rowid))대로 합산
+
+        Returns:
+            dict: 통계 데이터 (환자가 없으면 None)
+        """
+        columns = ", ".join(DISTRIBUTION_COLUMNS)
+        cursor = self.conn.execute(
+            f"SELECT {AGE_GROUP_SQL} AS age_group, {columns}, "
+            "       COUNT(*), SUM(gender = 'Male'), "
+            "       SUM(discharge_date IS NULL OR discharge_date = ''), "
+            "       SUM(age), SUM(billing_amount) "
+            f"FROM patients GROUP BY age_group, {columns} ORDER BY MIN(rowid)"
+        )
+
+        keys = ["age_groups"] + list(DISTRIBUTION_COLUMNS.values())
+        distributions = {key: {} for key in keys}
+        total = male_count = hospitalized = age_sum = 0
+        total_billing = 0.0
+        for row in cursor:
+            count = row[len(keys)]
+            for key, value in zip(keys, row):
+                dist = distributions[key]
+                dist[value] = dist.get(value, 0) + count
+            male, stay, ages, billing = row[len(keys) + 1:]
+            total += count
+            male_count += male
+            hospitalized += stay
+            age_sum += ages
+            total_billing += billing
+        if not total:
+            return None
+
+        female_count = total - male_count
+        stats = {
+            "total_patients": total,
+            "male_count": male_count,
+            "female_count": female_count,
+            "male_ratio": round(male_count / total * 100, 1),
+            "female_ratio": round(female_count / total * 100, 1)
+        }
+        stats.update(distributions)
+        stats.update({
+            "hospitalized_count": hospitalized,
+            "discharged_count": total - hospitalized,
+            "avg_age": round(age_sum / total, 1),
+            "avg_billing": round(total_billing / total, 0),
+            "total_billing": round(total_billing, 0)
+        })
+        return stats
+
+
+def migrate_csv(csv_path, db_path, fieldnames):
+    """
+    환자 CSV 파일을 SQLite DB로 한 번에 이전 (기존 DB 내용은 교체)
+
+    Returns:
+        int: 이전한 환자 수
+    """
+    with open(csv_path, "r", encoding="utf-8") as f:
+        rows = [Patient.from_dict(row).to_dict() for row in csv.DictReader(f)]
+
+    store = PatientSQLiteStore(db_path, fieldnames)
+    try:
+        store.replace_all(rows)
+    finally:
+        store.close()
+    return len(rows)
+
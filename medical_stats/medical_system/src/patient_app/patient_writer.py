@@ -0,0 +1,160 @@
+"""
+patient_writer.py
+환자 데이터 쓰기 지연(write-behind) 저장 스레드
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+
+
+# 변경을 모으는 시간 (초): 첫 변경 후 이 시간 동안 들어온 변경을 한 번에 저장
+WRITE_DELAY = 0.2
+
+
+class PatientWriteBehind:
+    """
+    변경은 메모리에 먼저 반영하고 파일 저장은 별도 스레드에서 모아서 하는 쓰기 지연 저장
+
+    submit()은 저장을 예약하고 바로 Future를 반환. 쓰기 스레드는 첫 예약 후 delay 동안 들어온
+    예약을 모아 snapshot()으로 얻은 전체 행을 write()로 한 번만 저장하고 Future 결과를 True로 설정.
+
+    저장이 실패하면 그 저장에 모인 예약의 Future 결과가 False가 되고, 이후 예약은 저장하지 않고 대기.
+    예약한 쪽에서 process()를 호출하면 실패한 변경과 그 뒤 예약된 변경을 최근 것부터 되돌려
+    메모리 상태를 마지막으로 저장된 상태로 맞춤 (되돌리기는 예약한 스레드에서 실행)
+
+    Attributes:
+        lock (RLock): 메모리 상태 잠금 (변경하는 쪽과 snapshot() 호출이 함께 사용)
+        delay (float): 변경을 모으는 시간 (초)
+    """
+
+    def __init__(self, snapshot, write, lock, delay=WRITE_DELAY):
+        """
+        생성자: 쓰기 스레드 시작
+
+        Args:
+            snapshot (callable): 저장할 전체 행 리스트 반환 (lock 안에서 호출)
+            write (callable): 행 리스트를 저장하고 (성공 여부, 실패 메시지) 반환
+            lock (RLock): 메모리 상태 잠금
+            delay (float): 변경을 모으는 시간 (초)
+        """
+        self.snapshot = snapshot
+        self.write = write
+        self.lock = lock
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._pending = []      # 저장 전 예약 [(Future, 되돌리기 함수)]
+        self._failed = []       # 저장에 실패한 예약
+        self._error = None      # 실패 메시지 (process() 전까지 저장 중단)
+        self._writing = False
+        self._urgent = False    # flush 요청: 모으는 시간을 기다리지 않음
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="patient-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, undo=None):
+        """
+        저장 예약
+
+        Args:
+            undo (callable): 저장이 실패했을 때 이 변경을 되돌리는 함수
+
+        Returns:
+            Future: 저장되면 True, 실패하면 False
+        """
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("쓰기 스레드가 종료되었습니다.")
+            self._pending.append((future, undo))
+            self._cond.notify_all()
+        return future
+
+    def failed(self):
+        """처리(process)하지 않은 저장 실패가 있는지 여부"""
+        return self._error is not None
+
+    def flush(self, timeout=None):
+        """
+        예약된 저장이 모두 끝날 때까지 대기 (모으는 시간은 기다리지 않음)
+
+        Returns:
+            bool: 실패 없이 모두 저장되었으면 True (실패했거나 시간 초과면 False)
+        """
+        with self._cond:
+            if self._pending or self._writing:
+                self._urgent = True
+                self._cond.notify_all()
+            done = self._cond.wait_for(
+                lambda: self._error is not None or not (self._pending or self._writing), timeout)
+            return done and self._error is None
+
+    def process(self):
+        """
+        저장 실패 처리: 실패한 변경과 그 뒤 예약된 변경을 최근 것부터 되돌리고 저장 재개
+
+        Returns:
+            str: 실패 메시지 (실패가 없으면 None)
+        """
+        with self.lock:
+            with self._cond:
+                if self._error is None:
+                    return None
+                entries = self._failed + self._pending
+                error = self._error
+                self._failed, self._pending, self._error = [], [], None
+                self._cond.notify_all()
+            for future, undo in reversed(entries):
+                if undo is not None:
+                    undo()
+                if not future.done():
+                    future.set_result(False)
+        return error
+
+    def close(self):
+        """남은 예약을 저장하고 쓰기 스레드 종료 (처리하지 않은 실패가 있으면 남은 예약은 저장하지 않음)"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        """쓰기 스레드: 예약이 생기면 delay 동안 더 모은 뒤 한 번에 저장"""
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or (self._pending and self._error is None))
+                if not self._pending or self._error is not None:
+                    return
+
+                deadline = time.monotonic() + self.delay
+                while not (self._urgent or self._closed):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                self._urgent = False
+                self._writing = True
+
+            with self.lock:
+                with self._cond:
+                    batch, self._pending = self._pending, []
+                rows = self.snapshot()
+
+            try:
+                ok, message = self.write(rows)
+            except Exception as e:
+                ok, message = False, f"파일 저장 오류: {e}"
+
+            # 결과를 먼저 설정한 뒤 실패를 알림 (process()가 같은 Future를 다시 설정하지 않도록)
+            for future, _ in batch:
+                future.set_result(ok)
+            with self._cond:
+                self._writing = False
+                if not ok:
+                    self._failed = batch
+                    self._error = message
+                self._cond.notify_all()
@@ -0,0 +1,230 @@
+"""
+storage_tool.py
+환자 데이터 저장 방식 도구 (CSV → SQLite 이전, DB 통계, 저장 방식 속도 비교)
+
+사용법:
+    (src 폴더에서 실행)
+    python -m patient_app.storage_tool migrate [CSV 경로] [-o DB 경로]
+    python -m patient_app.storage_tool stats [DB 경로]
+    python -m patient_app.storage_tool benchmark [--sizes 1000 100000 1000000] [--ops 5]
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import argparse
+import csv
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+from .patient_manager import PatientManager
+from .patient_store import PatientSQLiteStore, migrate_csv
+
+
+# 벤치마크용 가상 데이터 값
+SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임"]
+GIVEN_NAMES = ["민수", "영희", "지훈", "수진", "동훈", "서연", "현우", "지민", "예린", "준호"]
+CONDITIONS = ["Diabetes", "Hypertension", "Asthma", "Obesity", "Arthritis", "Cancer"]
+HOSPITALS = ["서울대병원", "연세세브란스", "삼성서울병원", "서울아산병원", "고려대병원"]
+INSURERS = ["국민건강보험", "삼성생명", "한화생명", "교보생명"]
+MEDICATIONS = ["Metformin", "Ventolin", "Lisinopril", "Ibuprofen", "Aspirin"]
+
+
+def synthetic_rows(count, seed=0):
+    """
+    벤치마크용 가상 환자 데이터 생성
+
+    Returns:
+        list: 환자 정보 딕셔너리 리스트
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(1, count + 1):
+        rows.append({
+            "patient_id": f"P{i:03d}",
+            "name": rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES),
+            "age": rng.randint(1, 95),
+            "gender": rng.choice(("Male", "Female")),
+            "blood_type": rng.choice(("A+", "A-", "B+", "B-", "AB+", "AB-", "O+", "O-")),
+            "medical_condition": rng.choice(CONDITIONS),
+            "date_of_admission": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "doctor": "Dr. " + rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES),
+            "hospital": rng.choice(HOSPITALS),
+            "insurance_provider": rng.choice(INSURERS),
+            "billing_amount": float(rng.randint(10, 500) * 10000),
+            "room_number": rng.randint(100, 999),
+            "admission_type": rng.choice(("Emergency", "Elective", "Urgent")),
+            "discharge_date": "" if rng.random() < 0.3 else "2026-01-05",
+            "medication": rng.choice(MEDICATIONS),
+            "test_results": rng.choice(("Normal", "Abnormal", "Inconclusive"))
+        })
+    return rows
+
+
+def write_csv(path, rows):
+    """가상 데이터를 CSV로 저장"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=PatientManager.CSV_HEADERS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def timed(func, *args):
+    """(결과, 걸린 시간(초))"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run_backend(csv_path, backend, ops):
+    """
+    한 저장 방식에 대해 로드/등록/수정/삭제/검색/통계 시간 측정
+
+    Returns:
+        dict: 작업명 → 걸린 시간(초), 등록/수정/삭제는 1건 평균
+    """
+    result = {}
+    base_path = os.path.dirname(os.path.dirname(csv_path))
+    manager, result["load"] = timed(lambda: PatientManager(base_path, backend=backend))
+
+    template = dict(manager.patients[0].to_dict())
+    template.pop("patient_id")
+    created = []
+    start = time.perf_counter()
+    for _ in range(ops):
+        ok, new_id = manager.create(dict(template))
+        created.append(new_id)
+    result["create"] = (time.perf_counter() - start) / ops
+
+    start = time.perf_counter()
+    for pid in created:
+        manager.update(pid, {"medical_condition": "Asthma"})
+    result["update"] = (time.perf_counter() - start) / ops
+
+    start = time.perf_counter()
+    for pid in created:
+        manager.delete(pid)
+    result["delete"] = (time.perf_counter() - start) / ops
+
+    _, result["search"] = timed(manager.search, "민수", "name")
+    # get_statistics()는 카운터를 읽으므로 저장 방식별 전체 집계 시간을 측정
+    _, result["statistics"] = timed(manager.compute_statistics)
+    if manager.store is not None:
+        # 같은 통계를 DB에서 SQL로 집계 (환자 목록을 불러오지 않는 stats 명령의 경로)
+        _, result["sql_statistics"] = timed(manager.store.statistics)
+    manager.close()
+    return result
+
+
+def benchmark(sizes, ops):
+    """크기별로 CSV / SQLite 저장 방식 비교 결과 출력"""
+    tasks = ("load", "create", "update", "delete", "search", "statistics", "sql_statistics")
+    for size in sizes:
+        work_dir = tempfile.mkdtemp(prefix="patient_bench_")
+        try:
+            os.makedirs(os.path.join(work_dir, "data"))
+            csv_path = os.path.join(work_dir, "data", "patients.csv")
+            write_csv(csv_path, synthetic_rows(size))
+            _, migrate_time = timed(
+                migrate_csv, csv_path, os.path.splitext(csv_path)[0] + ".db",
+                PatientManager.CSV_HEADERS
+            )
+
+            results = {backend: run_backend(csv_path, backend, ops) for backend in ("csv", "sqlite")}
+
+            print(f"\n📊 환자 {size:,}명 (등록/수정/삭제는 {ops}건 평균)")
+            print(f"   SQLite 이전: {migrate_time * 1000:.1f}ms")
+            print(f"   {'작업':<16}{'CSV':>12}{'SQLite':>12}")
+            for task in tasks:
+                cells = [
+                    f"{results[backend][task] * 1000:>10.1f}ms" if task in results[backend] else f"{'-':>12}"
+                    for backend in ("csv", "sqlite")
+                ]
+                print(f"   {task:<16}{''.join(cells)}")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def print_db_statistics(db_path):
+    """
+    DB 파일의 통계를 SQL 집계로 출력 (환자 목록을 불러오지 않음)
+
+    Returns:
+        bool: 통계를 출력했으면 True (환자가 없으면 False)
+    """
+    store = PatientSQLiteStore(db_path, PatientManager.CSV_HEADERS)
+    try:
+        stats = store.statistics()
+    finally:
+        store.close()
+    if stats is None:
+        print(f"⚠️ 환자 데이터가 없습니다: {db_path}")
+        return False
+
+    print(f"📊 환자 {stats['total_patients']:,}명 "
+          f"(남성 {stats['male_count']:,}명 {stats['male_ratio']}% / "
+          f"여성 {stats['female_count']:,}명 {stats['female_ratio']}%)")
+    print(f"   입원 중 {stats['hospitalized_count']:,}명, 퇴원 {stats['discharged_count']:,}명")
+    print(f"   평균 나이 {stats['avg_age']}세, 평균 청구 금액 {stats['avg_billing']:,.0f}, "
+          f"총 청구 금액 {stats['total_billing']:,.0f}")
+    for key, title in (("conditions", "진단명"), ("age_groups", "연령대"),
+                       ("admission_types", "입원 유형"), ("blood_types", "혈액형"),
+                       ("test_results", "검사 결과")):
+        counts = ", ".join(f"{name} {count:,}" for name, count in stats[key].items())
+        print(f"   {title}: {counts}")
+    return True
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    # storage_tool.py -> patient_app -> src -> medical_system
+    base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    default_csv = os.path.join(base_path, "data", "patients.csv")
+
+    parser = argparse.ArgumentParser(description="환자 데이터 저장 방식 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_migrate = sub.add_parser("migrate", help="CSV → SQLite 이전")
+    p_migrate.add_argument("csv", nargs="?", default=default_csv)
+    p_migrate.add_argument("-o", "--output", default=None)
+
+    p_stats = sub.add_parser("stats", help="DB 파일 통계 (SQL 집계)")
+    p_stats.add_argument("db", nargs="?", default=os.path.splitext(default_csv)[0] + ".db")
+
+    p_bench = sub.add_parser("benchmark", help="CSV / SQLite 저장 방식 속도 비교")
+    p_bench.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    p_bench.add_argument("--ops", type=int, default=5)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "benchmark":
+        benchmark(args.sizes, args.ops)
+        return 0
+
+    if args.command == "stats":
+        if not os.path.exists(args.db):
+            print(f"❌ DB 파일이 없습니다: {args.db}")
+            return 1
+        try:
+            return 0 if print_db_statistics(args.db) else 1
+        except sqlite3.Error as e:
+            print(f"❌ DB 통계 오류: {e}")
+            return 1
+
+    db_path = args.output or os.path.splitext(args.csv)[0] + ".db"
+    try:
+        count = migrate_csv(args.csv, db_path, PatientManager.CSV_HEADERS)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"❌ 이전 오류: {e}")
+        return 1
+    print(f"✅ {count}명 이전 완료: {db_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
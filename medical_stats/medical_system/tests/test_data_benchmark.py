@@ -0,0 +1,110 @@
+"""
+test_data_benchmark.py
+데이터 계층 벤치마크(data_benchmark) 실행과 결과 비교 테스트
+
+작은 데이터(100행) 실행은 항상, 실제 크기 측정은 MEDICAL_PERF 환경 변수가 있을 때만 실행
+(MEDICAL_PERF를 켜면 perf_monitor 계측도 함께 켜지므로 비교할 이전 결과도 이 테스트로 저장)
+    MEDICAL_PERF=1 MEDICAL_PERF_RESULT=이전.json python -m pytest tests/test_data_benchmark.py
+    MEDICAL_PERF=1 MEDICAL_PERF_BASELINE=이전.json python -m pytest tests/test_data_benchmark.py
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from integration import data_benchmark
+from integration.data_benchmark import RESULT_VERSION, compare_results, run_suite
+
+
+TASKS = [
+    "health.load_sample_data", "health.get_statistics", "health.get_gender_statistics",
+    "health.compare_with_gender_average",
+    "patient.create", "patient.read_by_id", "patient.search", "patient.update", "patient.delete",
+    "patient.get_statistics", "patient.compute_statistics",
+    "integration.get_health_trend.cold", "integration.get_health_trend"
+]
+
+
+def result(median):
+    return {"min": median, "median": median, "repeat": 1, "number": 1}
+
+
+class RunSuiteTest(unittest.TestCase):
+    """작은 데이터로 전체 작업 실행 후 결과 형식 확인"""
+
+    def test_result_structure(self):
+        report = run_suite(sizes=[100], repeat=1, ops=1)
+        self.assertEqual(report["version"], RESULT_VERSION)
+        self.assertEqual(report["settings"], {"repeat": 1, "ops": 1})
+        self.assertEqual(set(report["environment"]), {"python", "platform", "cpu_count"})
+        self.assertEqual(list(report["results"]), ["100"])
+        self.assertEqual(list(report["results"]["100"]), TASKS)
+        for name, measured in report["results"]["100"].items():
+            self.assertEqual(set(measured), {"min", "median", "repeat", "number"}, name)
+            self.assertGreaterEqual(measured["median"], measured["min"], name)
+            self.assertGreater(measured["min"], 0, name)
+
+        # JSON으로 저장/읽기 후에도 같은 결과와 비교하면 회귀 없음
+        work_dir = tempfile.mkdtemp(prefix="data_bench_test_")
+        try:
+            path = os.path.join(work_dir, "result.json")
+            data_benchmark.save_results(path, report)
+            self.assertEqual(data_benchmark.load_results(path), json.loads(json.dumps(report)))
+            self.assertEqual(compare_results(data_benchmark.load_results(path), report), [])
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+class CompareResultsTest(unittest.TestCase):
+    """회귀 판정 기준 (비율과 최소 차이 모두 넘어야 회귀)"""
+
+    def test_regressions(self):
+        baseline = {"results": {
+            "1000": {"a": result(0.010), "b": result(0.010), "c": result(0.0001), "d": result(0.010)},
+            "10000": {"a": result(0.100)}
+        }}
+        current = {"results": {
+            "1000": {"a": result(0.020), "b": result(0.012), "c": result(0.0003),
+                     "d": result(0.005), "new": result(1.0)},
+            "10000": {"a": result(0.150)},
+            "100000": {"a": result(1.0)}
+        }}
+        regressions = compare_results(baseline, current)
+        self.assertEqual([(size, name) for size, name, *_ in regressions],
+                         [("1000", "a"), ("10000", "a")])
+        self.assertEqual(regressions[0][2:], (0.010, 0.020, 2.0))
+
+        # 기준을 낮추면 b도 회귀, 최소 차이를 없애면 c도 회귀
+        self.assertIn(("1000", "b"), [r[:2] for r in compare_results(baseline, current, threshold=0.1)])
+        self.assertIn(("1000", "c"), [r[:2] for r in compare_results(baseline, current, min_delta=0)])
+
+
+@unittest.skipUnless(os.environ.get("MEDICAL_PERF"), "MEDICAL_PERF 환경 변수가 있을 때만 실행")
+class PerformanceTest(unittest.TestCase):
+    """실제 크기 측정 (MEDICAL_PERF_RESULT에 저장, MEDICAL_PERF_BASELINE보다 느려진 작업이 없어야 함)"""
+
+    def test_no_regressions(self):
+        sizes = [int(size) for size in os.environ.get("MEDICAL_PERF_SIZES", "1000 10000").split()]
+        report = run_suite(sizes=sizes)
+        data_benchmark.print_report(report)
+        if os.environ.get("MEDICAL_PERF_RESULT"):
+            data_benchmark.save_results(os.environ["MEDICAL_PERF_RESULT"], report)
+
+        baseline_path = os.environ.get("MEDICAL_PERF_BASELINE")
+        if baseline_path:
+            regressions = compare_results(data_benchmark.load_results(baseline_path), report)
+            self.assertEqual(regressions, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+test_data_generator.py
+가상 데이터 생성기(data_generator) 테스트 (같은 시드면 같은 파일, 값이 각 모듈의 허용 범위 안인지)
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from health_app import sample_dataset
+from health_app.data_manager import HealthDataManager
+from integration import data_generator
+from integration.data_generator import SAMPLE_HEADERS, generate
+from patient_app.patient import Patient
+from patient_app.patient_manager import PatientManager
+
+
+FILES = ("patients.csv", "health_records.csv", "cardiovascular_sample.csv")
+
+
+def read_files(folder):
+    """폴더의 생성 파일 이름 → 내용 (바이트)"""
+    contents = {}
+    for name in FILES:
+        path = os.path.join(folder, name)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                contents[name] = f.read()
+    return contents
+
+
+class GeneratorTestCase(unittest.TestCase):
+    """임시 폴더에 생성"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="data_generator_test_")
+
+    def tearDown(self):
+        sample_dataset.clear_cache()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def generate(self, folder, **options):
+        options = dict({"patients": 50, "records": 300, "samples": 400, "workers": 1}, **options)
+        out_dir = os.path.join(self.work_dir, folder, "data")
+        generate(out_dir, **options)
+        return read_files(out_dir)
+
+
+class DeterminismTest(GeneratorTestCase):
+    """시드와 행 수가 같으면 작업 프로세스 수와 관계없이 같은 파일"""
+
+    def test_same_seed_same_files(self):
+        first = self.generate("a", seed=7)
+        self.assertEqual(list(first), list(FILES))
+        self.assertEqual(self.generate("b", seed=7), first)
+
+        other = self.generate("c", seed=8)
+        for name in FILES:
+            self.assertNotEqual(other[name], first[name], name)
+
+    def test_workers_do_not_change_output(self):
+        block_rows, parallel_min_rows = data_generator.BLOCK_ROWS, data_generator.PARALLEL_MIN_ROWS
+        # 작은 행 수로도 여러 블록을 여러 프로세스에서 만들도록 기준을 낮춤
+        data_generator.BLOCK_ROWS, data_generator.PARALLEL_MIN_ROWS = 64, 0
+        try:
+            serial = self.generate("serial", seed=3, workers=1)
+            parallel = self.generate("parallel", seed=3, workers=3)
+        finally:
+            data_generator.BLOCK_ROWS, data_generator.PARALLEL_MIN_ROWS = block_rows, parallel_min_rows
+        self.assertEqual(parallel, serial)
+        # 블록 크기가 달라도 환자 정보는 번호마다 같음
+        self.assertEqual(parallel["patients.csv"], self.generate("default", seed=3)["patients.csv"])
+
+    def test_zero_rows_skip_file(self):
+        written = generate(os.path.join(self.work_dir, "out"), patients=5, workers=1)
+        self.assertEqual(list(written), ["patients.csv"])
+        self.assertEqual(sorted(os.listdir(os.path.join(self.work_dir, "out"))), ["patients.csv"])
+
+
+class ValueDomainTest(GeneratorTestCase):
+    """생성한 값이 Patient.validate()와 각 관리자의 형식에 맞는지"""
+
+    def setUp(self):
+        super().setUp()
+        self.generate("base", seed=1)
+        self.base_path = os.path.join(self.work_dir, "base")
+        self.data_dir = os.path.join(self.base_path, "data")
+
+    def test_patients_are_valid(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = PatientManager(self.base_path)
+        try:
+            patients = manager.read_all()
+            self.assertEqual([p.patient_id for p in patients], [f"P{i:03d}" for i in range(1, 51)])
+            for patient in patients:
+                self.assertEqual(patient.validate(), (True, ""), patient.patient_id)
+                self.assertIn(patient.medical_condition, Patient.VALID_CONDITIONS)
+                self.assertIn(patient.admission_type, Patient.VALID_ADMISSION_TYPES)
+                self.assertIn(patient.test_results, Patient.VALID_TEST_RESULTS)
+                if patient.discharge_date:
+                    self.assertGreater(patient.discharge_date, patient.date_of_admission)
+            self.assertEqual(manager.generate_id(), "P051")
+        finally:
+            manager.close()
+
+    def test_records_link_to_patients(self):
+        with open(os.path.join(self.data_dir, "patients.csv"), "r", encoding="utf-8") as f:
+            patients = {row["patient_id"]: row for row in csv.DictReader(f)}
+        with contextlib.redirect_stdout(io.StringIO()):
+            records = HealthDataManager(self.base_path).load_records()
+        self.assertEqual(len(records), 300)
+
+        linked = [r for r in records if r["patient_id"]]
+        self.assertGreater(len(linked), len(records) // 2)
+        for record in linked:
+            patient = patients[record["patient_id"]]
+            self.assertEqual((record["name"], str(record["age"]), record["hospital"]),
+                             (patient["name"], patient["age"], patient["hospital"]))
+            self.assertEqual(record["gender"], "남성" if patient["gender"] == "Male" else "여성")
+        for record in records:
+            height, weight = float(record["height"]), float(record["weight"])
+            self.assertAlmostEqual(float(record["bmi"]), weight / ((height / 100) ** 2), delta=0.1)
+            self.assertTrue(0 <= float(record["risk_score"]) <= 100)
+
+    def test_samples_match_sample_format(self):
+        path = os.path.join(self.data_dir, "cardiovascular_sample.csv")
+        with open(path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.readline().strip(), ";".join(SAMPLE_HEADERS))
+        samples = sample_dataset.SampleDataset.from_csv(path, workers=1).to_records()
+        self.assertEqual(len(samples), 400)
+        for sample in samples:
+            self.assertIn(sample["gender"], ("남성", "여성"))
+            self.assertTrue(140 <= sample["height"] <= 200)
+            self.assertTrue(40 <= sample["weight"] <= 180)
+            self.assertTrue(80 <= sample["ap_hi"] <= 220)
+            self.assertTrue(40 <= sample["ap_lo"] < sample["ap_hi"])
+            self.assertIn(sample["cholesterol"], (1, 2, 3))
+            self.assertIn(sample["cardio"], (0, 1))
+        self.assertGreater(sum(1 for s in samples if s["gender"] == "여성"), len(samples) // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
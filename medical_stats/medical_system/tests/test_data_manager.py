@@ -0,0 +1,73 @@
+"""
+test_data_manager.py
+HealthDataManager 샘플 데이터 로드 테스트
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from health_app.data_manager import HealthDataManager
+
+
+SAMPLE_LINES = [
+    "id;age;gender;height;weight;ap_hi;ap_lo;cholesterol;gluc;smoke;alco;active;cardio",
+    "0;18393;2;168;62.0;110;80;1;1;0;0;1;0",
+    "1;20228;1;156;85.0;140;90;3;1;0;0;1;1",
+    "2;18857;1;165;64.0;130;70;3;1;0;0;0;1"
+]
+
+
+class SampleLoadTest(unittest.TestCase):
+    """load_sample_data(): 형식 오류 행이 있으면 그 앞까지 읽은 행 반환 (기존 동작)"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="health_test_")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.manager = HealthDataManager(self.work_dir, workers=1)
+        self.sample_file = self.manager.sample_file
+        os.makedirs(os.path.dirname(self.sample_file), exist_ok=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def write_sample(self, lines):
+        with open(self.sample_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def test_valid_file(self):
+        self.write_sample(SAMPLE_LINES)
+        samples = self.manager.load_sample_data()
+        self.assertEqual([s["id"] for s in samples], ["0", "1", "2"])
+        self.assertEqual(samples[1], {
+            "id": "1", "age": 55, "gender": "여성", "height": 156, "weight": 85.0, "ap_hi": 140,
+            "ap_lo": 90, "cholesterol": 3, "gluc": 1, "smoke": 0, "alco": 0, "active": 1, "cardio": 1
+        })
+
+    def test_bad_row_returns_rows_before_it(self):
+        self.write_sample(SAMPLE_LINES[:3] + ["9;19000;2;abc;70.0;120;80;1;1;0;0;1;0"] + SAMPLE_LINES[3:])
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            samples = self.manager.load_sample_data()
+        self.assertIn("샘플 데이터 로드 오류", out.getvalue())
+        self.assertEqual([s["id"] for s in samples], ["0", "1"])
+        self.assertEqual(samples[0]["gender"], "남성")
+
+    def test_missing_file(self):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(self.manager.load_sample_data(), [])
+        self.assertIn("샘플 데이터 파일을 찾을 수 없습니다.", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
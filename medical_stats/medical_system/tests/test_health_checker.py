@@ -0,0 +1,103 @@
+"""
+test_health_checker.py
+HealthChecker 판정 기준과 일괄 계산(score_batch) 일치 테스트
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import itertools
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from health_app.health_checker import HealthChecker
+
+
+FIELDS = ["age", "height", "weight", "ap_hi", "ap_lo", "cholesterol", "gluc", "smoke", "alco", "active"]
+
+# 구간 경계 바로 아래/위 값 (키 100cm이면 BMI = 몸무게)
+AGES = [39, 40, 49, 50, 59, 60, 70]
+BODIES = [(0, 60), (170, 0), (100, 18.4), (100, 18.5), (100, 22.9), (100, 23), (100, 24.9),
+          (100, 25), (100, 29.9), (100, 30), (170, 66.4), (160, 64.0)]
+PRESSURES = [(89, 70), (90, 59), (90, 60), (119, 79), (120, 79), (129, 79), (130, 79), (119, 80),
+             (139, 89), (140, 89), (139, 90), (140, 90), (159, 99), (160, 99), (160, 100)]
+HABITS = list(itertools.product([1, 2, 3], [1, 2, 3], [0, 1], [0, 1], [0, 1]))
+
+
+def boundary_columns():
+    """경계값 조합을 컬럼 딕셔너리로"""
+    columns = {name: [] for name in FIELDS}
+    for age, (height, weight), (ap_hi, ap_lo), habit in itertools.product(AGES, BODIES, PRESSURES, HABITS):
+        for name, value in zip(FIELDS, (age, height, weight, ap_hi, ap_lo) + habit):
+            columns[name].append(value)
+    return columns
+
+
+def checker(age=30, height=170, weight=65, ap_hi=110, ap_lo=70,
+            cholesterol=1, gluc=1, smoke=0, alco=0, active=1):
+    return HealthChecker(age, "남성", height, weight, ap_hi, ap_lo,
+                         cholesterol, gluc, smoke, alco, active)
+
+
+class ThresholdTest(unittest.TestCase):
+    """개별 메서드의 구간 경계 판정"""
+
+    def test_bmi_boundaries(self):
+        expected = {18.4: "저체중", 18.5: "정상", 22.9: "정상", 23: "과체중", 24.9: "과체중",
+                    25: "비만", 29.9: "비만", 30: "고도비만"}
+        for weight, status in expected.items():
+            self.assertEqual(checker(height=100, weight=weight).calculate_bmi()[:2], (weight, status))
+        self.assertEqual(checker(height=0).calculate_bmi()[1], "측정 불가")
+        self.assertEqual(checker(weight=0).calculate_bmi()[:2], (0, "저체중"))
+
+    def test_blood_pressure_boundaries(self):
+        expected = {(89, 70): "저혈압", (90, 59): "저혈압", (119, 79): "정상", (120, 79): "주의",
+                    (129, 79): "주의", (130, 79): "고혈압 전단계", (119, 80): "고혈압 전단계",
+                    (139, 99): "고혈압 전단계", (140, 90): "고혈압 1기", (160, 99): "고혈압 1기",
+                    (160, 100): "고혈압 2기"}
+        for (ap_hi, ap_lo), status in expected.items():
+            self.assertEqual(checker(ap_hi=ap_hi, ap_lo=ap_lo).analyze_blood_pressure()[0], status)
+
+    def test_risk_score_points(self):
+        self.assertEqual(checker(age=39).calculate_risk_score()[:2], (0, "낮음"))
+        self.assertEqual(checker(age=40).calculate_risk_score()[0], 5)
+        self.assertEqual(checker(age=70).calculate_risk_score()[:2], (20, "낮음"))
+        self.assertEqual(checker(age=70, alco=1).calculate_risk_score()[:2], (25, "보통"))
+        self.assertEqual(checker(height=100, weight=18.4).calculate_risk_score()[0], 5)
+        self.assertEqual(checker(height=100, weight=23).calculate_risk_score()[0], 10)
+        self.assertEqual(checker(ap_hi=130, ap_lo=70).calculate_risk_score()[0], 15)
+        self.assertEqual(checker(ap_hi=110, ap_lo=90).calculate_risk_score()[0], 20)
+        worst = checker(age=70, height=100, weight=30, ap_hi=160, ap_lo=100,
+                        cholesterol=3, gluc=3, smoke=1, alco=1, active=0)
+        self.assertEqual(worst.calculate_risk_score()[:2], (120, "위험"))
+
+
+class ScoreBatchTest(unittest.TestCase):
+    """score_batch가 개별 메서드와 행마다 같은 결과인지"""
+
+    def test_matches_scalar_methods(self):
+        columns = boundary_columns()
+        result = HealthChecker.score_batch(columns)
+        self.assertEqual(len(result["risk_score"]), len(columns["age"]))
+
+        for i, values in enumerate(zip(*(columns[name] for name in FIELDS))):
+            age, height, weight, ap_hi, ap_lo, chol, gluc, smoke, alco, active = values
+            one = HealthChecker(age, "남성", height, weight, ap_hi, ap_lo, chol, gluc, smoke, alco, active)
+            bmi, bmi_status, _ = one.calculate_bmi()
+            bp_status, _, _ = one.analyze_blood_pressure()
+            score, grade, _, _ = one.calculate_risk_score()
+            self.assertEqual(
+                (result["bmi"][i], result["bmi_status"][i], result["bp_status"][i],
+                 result["risk_score"][i], result["risk_grade"][i]),
+                (bmi, bmi_status, bp_status, score, grade),
+                values
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+test_integration_manager.py
+IntegrationManager 테스트 (환자 관리 창과 건강 체크 창이 같은 환자 파일을 쓰는 경우)
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC)
+
+from integration.data_generator import generate
+from integration.integration_manager import IntegrationManager
+from patient_app.patient_manager import PatientManager
+
+
+PATIENT = {
+    "name": "홍길동", "age": 45, "gender": "Male", "blood_type": "A+",
+    "medical_condition": "Asthma", "doctor": "김의사", "hospital": "서울병원",
+    "insurance_provider": "", "billing_amount": 1000, "room_number": 101,
+    "admission_type": "Elective", "medication": "", "test_results": "Normal"
+}
+
+
+class TwoManagersTest(unittest.TestCase):
+    """같은 base_path를 쓰는 IntegrationManager와 PatientManager"""
+
+    def setUp(self):
+        self.base_path = tempfile.mkdtemp(prefix="integration_test_")
+        generate(os.path.join(self.base_path, "data"), patients=20, records=20, samples=100)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.integration = IntegrationManager(self.base_path)
+            self.patients = PatientManager(self.base_path)
+
+    def tearDown(self):
+        self.integration.health_manager.close()
+        self.integration.patient_manager.close()
+        self.patients.close()
+        shutil.rmtree(self.base_path, ignore_errors=True)
+
+    def test_sees_patients_saved_elsewhere(self):
+        ok, patient_id = self.patients.create(dict(PATIENT))
+        self.assertTrue(ok)
+
+        patient = self.integration.get_patient_by_id(patient_id)
+        self.assertIsNotNone(patient)
+        self.assertEqual(patient.name, "홍길동")
+        self.assertIn(patient_id, [row[0] for row in self.integration.get_patient_list()])
+
+    def test_register_after_other_save(self):
+        ok, first_id = self.patients.create(dict(PATIENT))
+        self.assertTrue(ok)
+
+        health_data = {"name": "이몽룡", "age": 30, "gender": "남성", "bmi": 22, "ap_hi": 120,
+                       "ap_lo": 80, "gluc": 1, "risk_score": 10}
+        with contextlib.redirect_stdout(io.StringIO()):
+            ok, new_id = self.integration.register_patient_from_health(health_data, {})
+        self.assertTrue(ok, new_id)
+        self.assertNotEqual(new_id, first_id)
+
+        # 환자 관리 쪽도 새로고침하면 두 환자가 모두 보임
+        self.assertTrue(self.patients.reload_if_changed())
+        self.assertIsNotNone(self.patients.read_by_id(first_id))
+        self.assertIsNotNone(self.patients.read_by_id(new_id))
+
+
+class RecordIndexTest(unittest.TestCase):
+    """환자별 건강 기록 인덱스가 날짜순으로 유지되는지"""
+
+    def setUp(self):
+        self.base_path = tempfile.mkdtemp(prefix="integration_test_")
+        generate(os.path.join(self.base_path, "data"), patients=5, records=30, samples=10)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.integration = IntegrationManager(self.base_path)
+
+    def tearDown(self):
+        self.integration.health_manager.close()
+        self.integration.patient_manager.close()
+        shutil.rmtree(self.base_path, ignore_errors=True)
+
+    def test_inserted_records_stay_sorted(self):
+        integration = self.integration
+        patient_id = integration.get_patient_list()[0][0]
+        before = integration.get_health_records_by_patient(patient_id)
+        dates = [r["date"] for r in before]
+        self.assertEqual(dates, sorted(dates))
+
+        added = [{"patient_id": patient_id, "name": "추가", "date": date, "bmi": str(i)}
+                 for i, date in enumerate(["2000-01-01 00:00", "2999-12-31 23:59", "2020-06-15 12:00",
+                                           "2020-06-15 12:00", dates[0] if dates else "2010-01-01 00:00"])]
+        for record in added:
+            integration._index_record(record)
+
+        expected = sorted(before + added, key=lambda r: r.get("date", ""))
+        records = integration._records_by_patient[patient_id]
+        self.assertEqual(records, expected)
+        self.assertEqual(integration._record_dates[patient_id], [r["date"] for r in expected])
+        self.assertEqual(integration.get_health_trend(patient_id) is None, len(expected) < 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
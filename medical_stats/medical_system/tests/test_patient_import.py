@@ -0,0 +1,170 @@
+"""
+test_patient_import.py
+Kaggle Healthcare Dataset 일괄 가져오기(create_many, patient_import) 테스트
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from patient_app.patient_import import KAGGLE_COLUMNS, import_file, map_kaggle_row, write_rejects
+from patient_app.patient_manager import PatientManager
+
+
+KAGGLE_HEADER = list(KAGGLE_COLUMNS)
+
+# Kaggle 원본 형식 행 (3, 5번째 행은 거부 대상)
+KAGGLE_ROWS = [
+    ["Bobby JacksOn", "30", "Male", "B-", "Cancer", "2024-01-31", "Matthew Smith", "Sons and Miller",
+     "Blue Cross", "18856.281305978155", "328", "Urgent", "2024-02-02", "Paracetamol", "Normal"],
+    ["LesLie TErRy", "62", "Male", "A+", "Obesity", "2019-08-20", "Samantha Davies", "Kim Inc",
+     "Medicare", "33643.327286577885", "265", "Emergency", "2019-08-26", "Ibuprofen", "Inconclusive"],
+    ["DaNnY sMitH", "76", "Other", "A-", "Obesity", "2022-09-22", "Tiffany Mitchell", "Cook PLC",
+     "Aetna", "27955.096078842456", "205", "Emergency", "2022-10-07", "Aspirin", "Normal"],
+    ["andrEw waTtS", "28", "Female", "O+", "Diabetes", "2020-11-18", "Kevin Wells", "Hernandez Rogers",
+     "Medicare", "37909.78240987528", "450", "Elective", "2020-12-18", "Ibuprofen", "Abnormal"],
+    ["adrIENNE bEll", "abc", "Female", "AB+", "Cancer", "2022-09-19", "Kathleen Hanna", "White-White",
+     "Aetna", "14238.317813937623", "458", "Urgent", "2022-10-09", "Penicillin", "Abnormal"],
+    ["EMILY JOHNSOn", "36", "Male", "A+", "Asthma", "2023-12-20", "Taylor Newton", "Nunez-Humphrey",
+     "UnitedHealthcare", "48145.11095104189", "389", "Urgent", "2023-12-24", "Ibuprofen", "Normal"]
+]
+
+
+class ImportTestCase(unittest.TestCase):
+    """임시 폴더에 환자 파일과 Kaggle 형식 소스 파일 준비"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="patient_import_test_")
+        self.source = os.path.join(self.work_dir, "healthcare_dataset.csv")
+        with open(self.source, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(KAGGLE_HEADER)
+            writer.writerows(KAGGLE_ROWS)
+        self.managers = []
+        self.manager = self.open()
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def open(self, folder="", **options):
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = PatientManager(os.path.join(self.work_dir, folder), **options)
+        self.managers.append(manager)
+        return manager
+
+
+class ImportFileTest(ImportTestCase):
+    """행 변환, 거부 목록, ID 발급, 한 번에 저장"""
+
+    def test_import_kaggle_csv(self):
+        self.assertTrue(self.manager.create({"name": "홍길동", "age": 45, "gender": "Male",
+                                             "blood_type": "A+", "medical_condition": "Asthma"})[0])
+        calls = []
+        write_all = self.manager._write_all
+        self.manager._write_all = lambda rows=None: calls.append(rows) or write_all(rows)
+
+        ok, result = import_file(self.manager, self.source)
+        self.assertTrue(ok, result)
+        self.assertEqual(result["rows"], 6)
+        self.assertEqual(result["added"], ["P002", "P003", "P004", "P005"])
+        self.assertEqual([row for row, _ in result["rejected"]], [3, 5])
+        self.assertIn("성별", result["rejected"][0][1])
+        self.assertIn("값 변환 오류", result["rejected"][1][1])
+        self.assertGreaterEqual(result["seconds"], 0)
+        self.assertEqual(len(calls), 1)
+
+        patient = self.manager.read_by_id("P002")
+        self.assertEqual((patient.name, patient.age, patient.blood_type, patient.room_number),
+                         ("Bobby Jackson", 30, "B-", 328))
+        self.assertAlmostEqual(patient.billing_amount, 18856.281305978155)
+        self.assertEqual(self.manager.get_statistics(), self.manager.compute_statistics())
+        self.assertEqual(self.manager.generate_id(), "P006")
+
+        reopened = self.open()
+        self.assertEqual([p.to_dict() for p in reopened.read_all()],
+                         [p.to_dict() for p in self.manager.read_all()])
+        self.assertEqual(reopened.generate_id(), "P006")
+
+    def test_zip_source_and_limit(self):
+        zip_path = os.path.join(self.work_dir, "healthcare.zip")
+        with zipfile.ZipFile(zip_path, "w") as archive:
+            archive.write(self.source, "healthcare_dataset.csv")
+        ok, result = import_file(self.manager, zip_path, limit=2)
+        self.assertTrue(ok, result)
+        self.assertEqual((result["rows"], result["added"], result["rejected"]), (2, ["P001", "P002"], []))
+
+    def test_failed_save_adds_nothing(self):
+        self.manager._write_all = lambda rows=None: False
+        with contextlib.redirect_stdout(io.StringIO()):
+            ok, msg = import_file(self.manager, self.source)
+        self.assertFalse(ok)
+        self.assertEqual(msg, "파일 저장에 실패했습니다.")
+        self.assertEqual(self.manager.read_all(), [])
+        self.assertEqual(self.manager._by_id, {})
+        self.assertIsNone(self.manager.get_statistics())
+        self.assertEqual(self.manager.generate_id(), "P001")
+
+    def test_only_rejects(self):
+        ok, result = self.manager.create_many([{"name": "가", "gender": "X"}, {"name": "홍길동", "age": 200}])
+        self.assertTrue(ok)
+        self.assertEqual(result["added"], [])
+        self.assertEqual([row for row, _ in result["rejected"]], [1, 2])
+        # 여러 오류는 한 줄로
+        self.assertNotIn("\n", result["rejected"][0][1])
+        self.assertIn(" / ", result["rejected"][0][1])
+
+    def test_other_backends(self):
+        for backend in ("journal", "sqlite"):
+            manager = self.open(folder=backend, backend=backend)
+            ok, result = import_file(manager, self.source)
+            self.assertTrue(ok, result)
+            self.assertEqual(len(result["added"]), 4)
+            expected = [p.to_dict() for p in manager.read_all()]
+            manager.close()
+            self.managers.remove(manager)
+            self.assertEqual([p.to_dict() for p in self.open(folder=backend, backend=backend).read_all()],
+                             expected)
+
+
+class MappingTest(unittest.TestCase):
+    """Kaggle 컬럼명 변환과 거부 목록 저장"""
+
+    def test_map_kaggle_row(self):
+        row = dict(zip(KAGGLE_HEADER, KAGGLE_ROWS[0]))
+        row[None] = ["남는 값"]
+        data = map_kaggle_row(row)
+        self.assertEqual(set(data), set(KAGGLE_COLUMNS.values()))
+        self.assertEqual(data["name"], "Bobby Jackson")
+        self.assertEqual(data["billing_amount"], "18856.281305978155")
+        # 이미 Patient 필드명이면 그대로
+        self.assertEqual(map_kaggle_row({" name ": " lee sun ", "age": "3"}), {"name": "Lee Sun", "age": "3"})
+
+    def test_write_rejects(self):
+        work_dir = tempfile.mkdtemp(prefix="patient_import_test_")
+        try:
+            path = os.path.join(work_dir, "rejects.csv")
+            write_rejects(path, [(3, "성별 오류"), (5, "값 변환 오류: abc")])
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertEqual(list(csv.reader(f)),
+                                 [["row", "error"], ["3", "성별 오류"], ["5", "값 변환 오류: abc"]])
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
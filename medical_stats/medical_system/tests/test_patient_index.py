@@ -0,0 +1,132 @@
+"""
+test_patient_index.py
+검색 인덱스(PatientSearchIndex) 결과가 전체 순회 검색과 같은지 테스트
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from patient_app.patient_manager import PatientManager
+from patient_app.storage_tool import synthetic_rows
+
+
+SEARCH_FIELDS = ("all", "name", "medical_condition", "doctor", "hospital")
+BLOOD_TYPES = ("A+", "A-", "B+", "B-", "AB+", "AB-", "O+", "O-")
+
+
+def linear_search(patients, keyword, field="all"):
+    """인덱스 도입 전 search(): 전체 환자를 순회하며 부분 문자열 비교"""
+    keyword = keyword.lower().strip()
+    results = []
+    for patient in patients:
+        if field == "all":
+            searchable = f"{patient.patient_id} {patient.name} {patient.medical_condition} {patient.doctor} {patient.hospital}".lower()
+            if keyword in searchable:
+                results.append(patient)
+        elif keyword in getattr(patient, field).lower():
+            results.append(patient)
+    return results
+
+
+class SearchIndexTest(unittest.TestCase):
+    """등록/수정/삭제 후에도 인덱스 검색이 전체 순회 결과와 같은지"""
+
+    columnar = False
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="patient_index_test_")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.manager = PatientManager(self.work_dir, columnar=self.columnar)
+        ok, result = self.manager.create_many(synthetic_rows(300, seed=7))
+        self.assertTrue(ok)
+        self.assertEqual(len(result["added"]), 300)
+        self.rng = random.Random(11)
+
+    def tearDown(self):
+        self.manager.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def keywords(self):
+        """1글자, 2글자, 더 긴 검색어 (대소문자 섞기, 없는 값, 필드 경계 포함)"""
+        patients = self.manager.read_all()
+        keywords = {"", "p0", "P1", "dr. ", "zzz", "없는이름", "  ast  "}
+        for _ in range(40):
+            patient = patients[self.rng.randrange(len(patients))]
+            text = f"{patient.patient_id} {patient.name} {patient.medical_condition} {patient.doctor} {patient.hospital}"
+            for length in (1, 2, 3, 6):
+                start = self.rng.randrange(len(text) - length)
+                keyword = text[start:start + length]
+                keywords.add(keyword.upper() if self.rng.random() < 0.3 else keyword)
+        return sorted(keywords)
+
+    def ids(self, patients):
+        return [p.patient_id for p in patients]
+
+    def assert_matches_linear(self):
+        manager = self.manager
+        patients = list(manager.read_all())
+        for keyword in self.keywords():
+            for field in SEARCH_FIELDS:
+                self.assertEqual(self.ids(manager.search(keyword, field)),
+                                 self.ids(linear_search(patients, keyword, field)),
+                                 (keyword, field))
+
+        for patient in patients[::17]:
+            self.assertEqual(manager.read_by_id(patient.patient_id).patient_id, patient.patient_id)
+        self.assertIsNone(manager.read_by_id("P99999"))
+        for blood_type in BLOOD_TYPES:
+            self.assertEqual(self.ids(manager._by_id[pid] for pid in manager._index.ordered(
+                                 manager._index.exact("blood_type", blood_type))),
+                             self.ids(p for p in patients if p.blood_type == blood_type))
+        for patient in patients[::29]:
+            for field in ("doctor", "medical_condition"):
+                value = getattr(patient, field)
+                self.assertEqual(self.ids(manager._by_id[pid] for pid in manager._index.ordered(
+                                     manager._index.exact(field, value))),
+                                 self.ids(p for p in patients if getattr(p, field) == value))
+
+    def test_after_create(self):
+        self.assert_matches_linear()
+        ok, _ = self.manager.create(dict(synthetic_rows(1, seed=99)[0], name="Grace Kim", doctor="Dr. Lee"))
+        self.assertTrue(ok)
+        self.assert_matches_linear()
+
+    def test_after_update(self):
+        patients = self.manager.read_all()
+        for i in range(0, 300, 7):
+            ok, msg = self.manager.update(patients[i].patient_id, {
+                "name": f"수정환자{i}", "doctor": "Dr. 새의사", "blood_type": BLOOD_TYPES[i % 8],
+                "hospital": patients[(i + 1) % 300].hospital
+            })
+            self.assertTrue(ok, msg)
+        self.assert_matches_linear()
+
+    def test_after_delete(self):
+        ids = self.ids(self.manager.read_all())
+        for patient_id in ids[::5]:
+            ok, msg = self.manager.delete(patient_id)
+            self.assertTrue(ok, msg)
+        self.assert_matches_linear()
+
+
+class ColumnarSearchIndexTest(SearchIndexTest):
+    """열 저장(PatientTable) 모드에서 같은 검사"""
+
+    columnar = True
+
+
+if __name__ == "__main__":
+    unittest.main()
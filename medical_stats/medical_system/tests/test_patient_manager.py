@@ -0,0 +1,233 @@
+"""
+test_patient_manager.py
+PatientManager 수정(update) 테스트 (통계 카운터/색인이 환자 정보와 맞는지)
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import contextlib
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from patient_app.patient_manager import PatientManager
+
+
+PATIENT = {
+    "name": "홍길동", "age": 45, "gender": "Male", "blood_type": "A+",
+    "medical_condition": "Asthma", "doctor": "김의사", "hospital": "서울병원",
+    "insurance_provider": "", "billing_amount": 1000, "room_number": 101,
+    "admission_type": "Elective", "medication": "", "test_results": "Normal"
+}
+
+
+class UpdateTest(unittest.TestCase):
+    """문자열 청구금액 수정과 실패 시 롤백"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="patient_test_")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.manager = PatientManager(self.work_dir)
+        ok, self.patient_id = self.manager.create(dict(PATIENT))
+        self.assertTrue(ok)
+        self.manager.create(dict(PATIENT, name="성춘향", gender="Female", doctor="박의사", billing_amount=3000))
+
+    def tearDown(self):
+        self.manager.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def assert_stats_consistent(self):
+        self.assertEqual(self.manager.get_statistics(), self.manager.compute_statistics())
+
+    def test_string_billing_amount(self):
+        ok, msg = self.manager.update(self.patient_id, {"billing_amount": "5000"})
+        self.assertTrue(ok, msg)
+        self.assertEqual(self.manager.get_statistics()["total_billing"], 8000)
+
+    def test_updated_values_are_interned(self):
+        # 실행 중 만든 문자열도 다른 환자의 같은 값과 한 객체를 공유
+        doctor = "".join(["박", "의사"])
+        ok, msg = self.manager.update(self.patient_id, {"doctor": doctor, "medication": "".join(["Aspi", "rin"])})
+        self.assertTrue(ok, msg)
+        patient = self.manager.read_by_id(self.patient_id)
+        other = [p for p in self.manager.read_all() if p.patient_id != self.patient_id][0]
+        self.assertIs(patient.doctor, other.doctor)
+        self.assertIs(patient.medication, sys.intern("Aspirin"))
+
+    def test_invalid_billing_amount_rolls_back(self):
+        before = self.manager.get_statistics()
+        ok, msg = self.manager.update(self.patient_id, {"billing_amount": "abc", "doctor": "이의사"})
+        self.assertFalse(ok)
+        self.assertEqual(self.manager.get_statistics(), before)
+        self.assert_stats_consistent()
+
+        patient = self.manager.read_by_id(self.patient_id)
+        self.assertEqual(patient.billing_amount, 1000)
+        self.assertEqual(patient.doctor, "김의사")
+        self.assertEqual([p.patient_id for p in self.manager.search("김의사", "doctor")], [self.patient_id])
+        self.assertEqual(self.manager.search("이의사", "doctor"), [])
+
+
+class MetaSaveTest(unittest.TestCase):
+    """부가 정보 파일(세대 번호) 저장 실패는 저장 실패로 처리"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="patient_test_")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.manager = PatientManager(self.work_dir)
+        ok, self.patient_id = self.manager.create(dict(PATIENT))
+        self.assertTrue(ok)
+
+    def tearDown(self):
+        self.manager.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_meta_failure_is_save_error(self):
+        generation = self.manager._generation
+        next_id = self.manager.generate_id()
+        # 임시 파일 자리에 폴더가 있으면 부가 정보 파일을 쓸 수 없음
+        blocker = self.manager.meta_path + ".tmp"
+        os.mkdir(blocker)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            ok, msg = self.manager.create(dict(PATIENT, name="성춘향"))
+        self.assertFalse(ok)
+        self.assertEqual(msg, "파일 저장에 실패했습니다.")
+        self.assertIn("부가 정보 저장 오류", out.getvalue())
+        self.assertEqual(self.manager._generation, generation)
+        self.assertEqual(self.manager.generate_id(), next_id)
+        self.assertEqual(len(self.manager.read_all()), 1)
+        self.assertFalse(self.manager.has_changed())
+
+        # 다시 쓸 수 있게 되면 충돌 없이 저장
+        os.rmdir(blocker)
+        ok, msg = self.manager.create(dict(PATIENT, name="성춘향"))
+        self.assertTrue(ok, msg)
+        self.assertEqual(self.manager._generation, generation + 1)
+
+
+class IdCounterTest(unittest.TestCase):
+    """ID 인덱스와 다음 ID 번호 (삭제/재시작 후에도 ID를 다시 발급하지 않음)"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="patient_test_")
+        self.managers = []
+        self.manager = self.open()
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def open(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = PatientManager(self.work_dir)
+        self.managers.append(manager)
+        return manager
+
+    def create(self, manager=None, **fields):
+        ok, patient_id = (manager or self.manager).create(dict(PATIENT, **fields))
+        self.assertTrue(ok, patient_id)
+        return patient_id
+
+    def test_ids_are_sequential_and_not_reused(self):
+        ids = [self.create(name=f"환자{i}") for i in range(3)]
+        self.assertEqual(ids, ["P001", "P002", "P003"])
+        self.assertTrue(self.manager.delete("P003")[0])
+        self.assertEqual(self.create(), "P004")
+
+        # 다시 열어도 저장된 다음 번호에서 이어서 발급
+        self.assertTrue(self.manager.delete("P004")[0])
+        reopened = self.open()
+        self.assertEqual(reopened.generate_id(), "P005")
+        self.assertEqual(self.create(reopened), "P005")
+
+    def test_invalid_create_does_not_use_id(self):
+        self.create()
+        ok, msg = self.manager.create(dict(PATIENT, gender="X"))
+        self.assertFalse(ok)
+        self.assertEqual(self.create(), "P002")
+        self.assertEqual(len(self.manager.read_all()), 2)
+
+    def test_counter_without_meta_file(self):
+        with open(os.path.join(self.work_dir, "data", "patients.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=PatientManager.CSV_HEADERS)
+            writer.writeheader()
+            for patient_id in ("P007", "P041", "X9", "P002"):
+                writer.writerow(dict(PATIENT, patient_id=patient_id, date_of_admission="2026-01-01"))
+        manager = self.open()
+        self.assertEqual(manager.generate_id(), "P042")
+        self.assertEqual(manager.read_by_id("X9").patient_id, "X9")
+        self.assertIsNone(manager.read_by_id("P001"))
+
+    def test_id_past_999(self):
+        self.manager._next_id = 999
+        self.assertEqual(self.create(), "P999")
+        self.assertEqual(self.create(), "P1000")
+        self.assertEqual(self.open().generate_id(), "P1001")
+
+    def test_lookup_matches_list_after_changes(self):
+        ids = [self.create(name=f"환자{i}") for i in range(10)]
+        self.assertTrue(self.manager.update(ids[2], {"name": "수정"})[0])
+        for patient_id in ids[::3]:
+            self.assertTrue(self.manager.delete(patient_id)[0])
+
+        for manager in (self.manager, self.open()):
+            patients = manager.read_all()
+            self.assertEqual(sorted(manager._by_id), sorted(p.patient_id for p in patients))
+            for patient_id in ids:
+                expected = [p for p in patients if p.patient_id == patient_id]
+                found = manager.read_by_id(patient_id)
+                self.assertEqual(found.to_dict() if found else None,
+                                 expected[0].to_dict() if expected else None)
+            self.assertEqual(manager.read_by_id(ids[2]).name, "수정")
+
+
+class DeleteRollbackTest(unittest.TestCase):
+    """삭제 저장 실패 시 원래 목록 위치/검색 순서/통계로 복원"""
+
+    columnar = False
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="patient_test_")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.manager = PatientManager(self.work_dir, columnar=self.columnar)
+        for name, doctor in (("홍길동", "김의사"), ("성춘향", "박의사"), ("이몽룡", "최의사")):
+            ok, _ = self.manager.create(dict(PATIENT, name=name, doctor=doctor))
+            self.assertTrue(ok)
+        self.ids = [p.patient_id for p in self.manager.read_all()]
+
+    def tearDown(self):
+        self.manager.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_failed_delete_restores_position(self):
+        before = self.manager.get_statistics()
+        self.manager._write_change = lambda op, patient: False
+        with contextlib.redirect_stdout(io.StringIO()):
+            ok, _ = self.manager.delete(self.ids[1])
+        self.assertFalse(ok)
+
+        self.assertEqual([p.patient_id for p in self.manager.read_all()], self.ids)
+        self.assertEqual(self.manager.read_by_id(self.ids[1]).name, "성춘향")
+        self.assertEqual([p.patient_id for p in self.manager.search("의사", "doctor")], self.ids)
+        self.assertEqual(self.manager.get_statistics(), before)
+        self.assertEqual(before, self.manager.compute_statistics())
+
+
+class ColumnarDeleteRollbackTest(DeleteRollbackTest):
+    """열 저장(PatientTable) 모드에서 같은 검사"""
+
+    columnar = True
+
+
+if __name__ == "__main__":
+    unittest.main()
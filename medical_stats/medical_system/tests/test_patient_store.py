@@ -0,0 +1,138 @@
+"""
+test_patient_store.py
+SQLite 저장 방식(PatientSQLiteStore, backend="sqlite") 테스트
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from patient_app.patient_manager import PatientManager
+from patient_app.patient_store import INDEXED_COLUMNS, PatientSQLiteStore, migrate_csv
+from patient_app.storage_tool import print_db_statistics, synthetic_rows, write_csv
+
+
+class SQLiteTestCase(unittest.TestCase):
+    """임시 폴더의 가상 환자 CSV를 SQLite 저장 방식으로 열기"""
+
+    rows = 300
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="patient_store_test_")
+        os.makedirs(os.path.join(self.work_dir, "data"))
+        write_csv(os.path.join(self.work_dir, "data", "patients.csv"), synthetic_rows(self.rows, seed=3))
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def open(self, **options):
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = PatientManager(self.work_dir, **options)
+        self.managers.append(manager)
+        return manager
+
+
+class RoundTripTest(SQLiteTestCase):
+    """CSV에서 옮긴 DB와 DB에 저장한 변경이 다시 열었을 때 그대로인지"""
+
+    def patient_rows(self, manager):
+        return [p.to_dict() for p in manager.read_all()]
+
+    def test_first_open_migrates_csv(self):
+        expected = self.patient_rows(self.open())
+        manager = self.open(backend="sqlite")
+        self.assertEqual(self.patient_rows(manager), expected)
+        self.assertEqual(manager.store.count(), len(expected))
+        patient = manager.read_by_id("P001")
+        self.assertIsInstance(patient.age, int)
+        self.assertIsInstance(patient.billing_amount, float)
+        self.assertIsInstance(patient.room_number, int)
+
+    def test_changes_survive_reopen(self):
+        manager = self.open(backend="sqlite")
+        ok, new_id = manager.create(dict(manager.read_by_id("P005").to_dict(), name="새환자"))
+        self.assertTrue(ok, new_id)
+        self.assertTrue(manager.update("P003", {"name": "수정환자", "billing_amount": 12345.5})[0])
+        self.assertTrue(manager.delete("P010")[0])
+        ok, result = manager.create_many([dict(manager.read_by_id("P006").to_dict(), name=f"일괄{i}")
+                                          for i in range(3)])
+        self.assertTrue(ok, result)
+        expected = self.patient_rows(manager)
+        manager.close()
+        self.managers.remove(manager)
+
+        reopened = self.open(backend="sqlite")
+        # 수정해도 목록 순서(rowid)는 그대로
+        self.assertEqual(self.patient_rows(reopened), expected)
+        self.assertEqual(reopened.read_by_id("P003").billing_amount, 12345.5)
+        self.assertIsNone(reopened.read_by_id("P010"))
+        self.assertEqual(reopened.generate_id(), manager.generate_id())
+
+    def test_migrate_csv_replaces_db(self):
+        db_path = os.path.join(self.work_dir, "data", "patients.db")
+        self.assertEqual(migrate_csv(os.path.join(self.work_dir, "data", "patients.csv"), db_path, PatientManager.CSV_HEADERS), self.rows)
+        write_csv(os.path.join(self.work_dir, "data", "patients.csv"), synthetic_rows(20, seed=9))
+        self.assertEqual(migrate_csv(os.path.join(self.work_dir, "data", "patients.csv"), db_path, PatientManager.CSV_HEADERS), 20)
+
+        store = PatientSQLiteStore(db_path, PatientManager.CSV_HEADERS)
+        try:
+            self.assertEqual([row["patient_id"] for row in store.load_all()],
+                             [row["patient_id"] for row in synthetic_rows(20, seed=9)])
+            self.assertEqual(store.conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            indexes = {row[0] for row in store.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'patients'")}
+            for name in INDEXED_COLUMNS:
+                self.assertIn(f"idx_patients_{name}", indexes)
+        finally:
+            store.close()
+        self.assertEqual(self.patient_rows(self.open(backend="sqlite")), self.patient_rows(self.open()))
+
+
+class StatisticsTest(SQLiteTestCase):
+    """통계는 메모리 목록에서 집계하고, DB의 SQL 집계와 결과가 같음"""
+
+    def test_compute_statistics_does_not_query_db(self):
+        manager = self.open(backend="sqlite")
+
+        def fail():
+            raise AssertionError("compute_statistics()가 SQL 집계를 사용함")
+        manager.store.statistics = fail
+        self.assertEqual(manager.compute_statistics(), self.open().compute_statistics())
+
+    def test_sql_statistics_match_memory(self):
+        for columnar, deleted in ((False, "P002"), (True, "P003")):
+            manager = self.open(backend="sqlite", columnar=columnar)
+            ok, msg = manager.update("P001", {"medical_condition": "Flu", "discharge_date": ""})
+            self.assertTrue(ok, msg)
+            self.assertTrue(manager.delete(deleted)[0])
+            stats = manager.store.statistics()
+            self.assertEqual({key: stats[key] for key in PatientManager.STATISTICS_KEYS},
+                             manager.compute_statistics())
+            self.assertEqual(manager.get_statistics(), manager.compute_statistics())
+            manager.close()
+            self.managers.remove(manager)
+
+    def test_print_db_statistics(self):
+        self.open(backend="sqlite")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertTrue(print_db_statistics(os.path.join(self.work_dir, "data", "patients.db")))
+        self.assertIn(f"환자 {self.rows:,}명", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+"""
+test_patient_tree.py
+가상 스크롤 테이블(VirtualPatientTree) 테스트 (보이는 행만 그리고 바뀐 행만 반영하는지)
+
+Treeview 대신 호출을 기록하는 가짜 위젯을 사용하므로 화면(Tk) 없이 실행 가능
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import os
+import sys
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from patient_app.patient import Patient
+from patient_app.patient_tree import WHEEL_ROWS, VirtualPatientTree
+from patient_app.storage_tool import synthetic_rows
+
+
+class FakeTree:
+    """ttk.Treeview에서 VirtualPatientTree가 쓰는 부분만 흉내 내고 호출 수를 기록"""
+
+    def __init__(self, height=10):
+        self.height = height
+        self.items = []
+        self.values = {}
+        self.bindings = {}
+        self.calls = Counter()
+        self._selection = ()
+        self._focus = ""
+
+    def cget(self, option):
+        return self.height
+
+    def bind(self, sequence, func):
+        self.bindings[sequence] = func
+
+    def insert(self, parent, index, iid, values):
+        assert iid not in self.values, f"이미 있는 항목: {iid}"
+        self.calls["insert"] += 1
+        self.items.insert(index, iid)
+        self.values[iid] = values
+
+    def delete(self, *iids):
+        self.calls["delete"] += len(iids)
+        for iid in iids:
+            self.items.remove(iid)
+            del self.values[iid]
+        self._selection = tuple(i for i in self._selection if i not in iids)
+
+    def item(self, iid, values):
+        self.calls["item"] += 1
+        self.values[iid] = values
+
+    def move(self, iid, parent, index):
+        self.calls["move"] += 1
+        self.items.remove(iid)
+        self.items.insert(index, iid)
+
+    def selection(self):
+        return self._selection
+
+    def selection_set(self, iid):
+        self._selection = (iid,)
+
+    def focus(self, iid=None):
+        if iid is None:
+            return self._focus
+        self._focus = iid
+
+    def bbox(self, iid):
+        # 제목 25px, 행 20px
+        return (0, 25 + self.items.index(iid) * 20, 300, 20)
+
+
+class FakeScrollbar:
+    """Scrollbar 대신 마지막 위치만 기록"""
+
+    def __init__(self):
+        self.command = None
+        self.position = None
+
+    def config(self, command):
+        self.command = command
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+def format_row(patient):
+    return (patient.patient_id, patient.name, patient.age)
+
+
+class VirtualTreeTestCase(unittest.TestCase):
+    """가상 환자 200명을 10행 화면에 표시"""
+
+    def setUp(self):
+        self.patients = [Patient.from_dict(row) for row in synthetic_rows(200, seed=5)]
+        self.tree = FakeTree()
+        self.scrollbar = FakeScrollbar()
+        self.view = VirtualPatientTree(self.tree, self.scrollbar, format_row)
+        self.view.show(self.patients)
+        self.tree.calls.clear()
+
+    def assertShows(self, start, rows=None):
+        rows = self.patients if rows is None else rows
+        window = rows[start:start + self.view.visible]
+        self.assertEqual(self.tree.items, [p.patient_id for p in window])
+        self.assertEqual([self.tree.values[pid] for pid in self.tree.items], [format_row(p) for p in window])
+
+
+class RenderTest(VirtualTreeTestCase):
+    """보이는 구간만 Treeview에 있고, 다시 그릴 때 바뀐 행만 반영"""
+
+    def test_only_visible_rows(self):
+        self.assertShows(0)
+        self.assertEqual(self.scrollbar.position, (0, 10 / 200))
+        self.assertEqual(self.scrollbar.command, self.view.yview)
+
+    def test_scroll_changes_only_edges(self):
+        self.view.scroll(3)
+        self.assertShows(3)
+        self.assertEqual(self.tree.calls, Counter(delete=3, insert=3))
+
+        # 끝/처음을 넘으면 범위 안으로
+        self.view.scroll(1000)
+        self.assertShows(190)
+        self.assertEqual(self.scrollbar.position, (190 / 200, 1.0))
+        self.view.scroll(-1000)
+        self.assertShows(0)
+
+    def test_yview_commands(self):
+        self.view.yview("moveto", "0.5")
+        self.assertShows(100)
+        self.view.yview("scroll", "1", "pages")
+        self.assertShows(110)
+        self.view.yview("scroll", "-2", "units")
+        self.assertShows(108)
+
+    def test_refresh_after_update(self):
+        self.patients[4].name = "수정환자"
+        self.patients[50].name = "안보이는환자"
+        self.view.show(self.patients)
+        self.assertShows(0)
+        self.assertEqual(self.tree.calls, Counter(item=1))
+
+        # 바뀐 것이 없으면 Treeview 호출 없음
+        self.tree.calls.clear()
+        self.view.show(self.patients)
+        self.assertEqual(self.tree.calls, Counter())
+
+    def test_refresh_after_delete_and_create(self):
+        self.view.scroll(20)
+        self.tree.calls.clear()
+        del self.patients[22]
+        self.view.show(self.patients)
+        self.assertShows(20)
+        self.assertEqual(self.tree.calls, Counter(delete=1, insert=1))
+
+        self.patients.insert(21, Patient.from_dict(dict(synthetic_rows(1)[0], patient_id="P999")))
+        self.view.show(self.patients)
+        self.assertShows(20)
+
+        # 검색 결과처럼 다른 목록을 맨 위부터 표시
+        found = self.patients[::7]
+        self.view.show(found, top=True)
+        self.assertShows(0, found)
+        self.view.show([])
+        self.assertEqual(self.tree.items, [])
+        self.assertEqual(self.scrollbar.position, (0, 1))
+
+    def test_refresh_cost_independent_of_size(self):
+        many = [Patient.from_dict(row) for row in synthetic_rows(5000, seed=6)]
+        self.view.show(many, top=True)
+        self.tree.calls.clear()
+        many[3].age += 1
+        del many[4000]
+        self.view.show(many)
+        self.assertEqual(self.tree.calls, Counter(item=1))
+        self.assertShows(0, many)
+
+
+class EventTest(VirtualTreeTestCase):
+    """선택 유지, 크기 변경, 휠/화살표 키"""
+
+    def select(self, patient_id):
+        self.tree.selection_set(patient_id)
+        self.tree.focus(patient_id)
+        self.tree.bindings["<<TreeviewSelect>>"](None)
+
+    def test_selection_survives_scroll(self):
+        self.select("P003")
+        self.view.scroll(50)
+        self.tree.bindings["<<TreeviewSelect>>"](None)
+        self.assertEqual(self.view.selected(), "P003")
+        self.view.scroll(-50)
+        self.assertEqual(self.tree.selection(), ("P003",))
+
+        # 선택한 환자가 삭제되면 선택 해제
+        del self.patients[2]
+        self.view.show(self.patients)
+        self.assertIsNone(self.view.selected())
+
+    def test_configure_changes_visible_rows(self):
+        self.tree.bindings["<Configure>"](SimpleNamespace(height=25 + 20 * 15))
+        self.assertEqual((self.view.row_height, self.view.visible), (20, 15))
+        self.assertShows(0)
+        self.tree.bindings["<Configure>"](SimpleNamespace(height=25 + 20 * 4 + 5))
+        self.assertShows(0)
+        self.assertEqual(len(self.tree.items), 4)
+
+    def test_wheel_and_arrows(self):
+        self.assertEqual(self.tree.bindings["<MouseWheel>"](SimpleNamespace(delta=-120)), "break")
+        self.assertShows(WHEEL_ROWS)
+        self.tree.bindings["<Button-4>"](None)
+        self.assertShows(0)
+        self.tree.bindings["<Next>"](None)
+        self.assertShows(10)
+        self.tree.bindings["<Prior>"](None)
+
+        # 화면 안에서는 Treeview 기본 동작, 마지막 행에서 아래 키는 한 행 스크롤 후 다음 행 선택
+        self.select("P005")
+        self.assertIsNone(self.tree.bindings["<Down>"](None))
+        self.select("P010")
+        self.assertEqual(self.tree.bindings["<Down>"](None), "break")
+        self.assertShows(1)
+        self.assertEqual((self.tree.focus(), self.tree.selection()), ("P011", ("P011",)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""
+test_patient_writer.py
+쓰기 지연(write-behind) 저장 테스트 (모아서 저장, 실패 시 되돌리기, flush/close)
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from patient_app.patient_manager import PatientManager
+
+
+PATIENT = {
+    "name": "홍길동", "age": 45, "gender": "Male", "blood_type": "A+",
+    "medical_condition": "Asthma", "doctor": "김의사", "hospital": "서울병원",
+    "insurance_provider": "", "billing_amount": 1000, "room_number": 101,
+    "admission_type": "Elective", "medication": "", "test_results": "Normal"
+}
+
+
+class WriteBehindTest(unittest.TestCase):
+    """쓰기 스레드 저장과 실패 시 메모리 상태 복원"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="patient_writer_test_")
+        self.manager = self.open(write_behind=True)
+        for name, doctor in (("홍길동", "김의사"), ("성춘향", "박의사")):
+            ok, _ = self.manager.create(dict(PATIENT, name=name, doctor=doctor))
+            self.assertTrue(ok)
+        self.assertEqual(self.manager.flush(), (True, ""))
+        self.ids = [p.patient_id for p in self.manager.read_all()]
+
+    def tearDown(self):
+        if self.manager.writer is not None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.manager.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def open(self, **options):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return PatientManager(self.work_dir, **options)
+
+    def state(self):
+        """목록, ID 인덱스, 검색 결과, 통계"""
+        manager = self.manager
+        return (
+            [p.to_dict() for p in manager.read_all()],
+            sorted(manager._by_id),
+            [p.patient_id for p in manager.search("의사", "doctor")],
+            [p.patient_id for p in manager.search("a", "all")],
+            manager.get_statistics()
+        )
+
+    def fail_writes(self):
+        """이후 쓰기 스레드의 저장이 실패하도록"""
+        self.manager._write_all = lambda rows=None: False
+
+    def assert_rolled_back(self, before):
+        self.assertEqual(self.state(), before)
+        self.assertEqual(self.manager.get_statistics(), self.manager.compute_statistics())
+
+    def test_coalesced_writes_are_saved(self):
+        calls = []
+        write_all = self.manager._write_all
+        self.manager._write_all = lambda rows=None: calls.append(len(rows)) or write_all(rows)
+
+        ok, new_id = self.manager.create(dict(PATIENT, name="이몽룡"))
+        self.assertTrue(ok)
+        self.assertTrue(self.manager.update(self.ids[0], {"doctor": "최의사"})[0])
+        self.assertTrue(self.manager.delete(self.ids[1])[0])
+        self.assertEqual(self.manager.flush(), (True, ""))
+        self.assertEqual(calls, [2])
+
+        other = self.open()
+        self.assertEqual([p.patient_id for p in other.read_all()], [self.ids[0], new_id])
+        self.assertEqual(other.read_by_id(self.ids[0]).doctor, "최의사")
+        other.close()
+
+    def test_failed_create_rolls_back(self):
+        before = self.state()
+        self.fail_writes()
+        ok, _ = self.manager.create(dict(PATIENT, name="이몽룡"))
+        self.assertTrue(ok)
+        ok, msg = self.manager.flush()
+        self.assertFalse(ok)
+        self.assertEqual(msg, "파일 저장에 실패했습니다.")
+        self.assert_rolled_back(before)
+
+    def test_failed_update_rolls_back(self):
+        before = self.state()
+        self.fail_writes()
+        self.assertTrue(self.manager.update(self.ids[0], {"doctor": "최의사", "billing_amount": 9000})[0])
+        self.assertFalse(self.manager.flush()[0])
+        self.assert_rolled_back(before)
+
+    def test_failed_delete_rolls_back(self):
+        before = self.state()
+        self.fail_writes()
+        self.assertTrue(self.manager.delete(self.ids[0])[0])
+        self.assertFalse(self.manager.flush()[0])
+        self.assert_rolled_back(before)
+
+    def test_poll_writes_rolls_back_later_changes(self):
+        before = self.state()
+        self.fail_writes()
+        self.assertTrue(self.manager.create(dict(PATIENT, name="이몽룡"))[0])
+        self.assertTrue(self.manager.delete(self.ids[0])[0])
+        self.assertFalse(self.manager.writer.flush())
+
+        # 실패를 처리하기 전 변경은 예약하지 않고 앞선 변경까지 함께 되돌림
+        ok, msg = self.manager.update(self.ids[1], {"doctor": "최의사"})
+        self.assertFalse(ok)
+        self.assertEqual(msg, "파일 저장에 실패했습니다.")
+        self.assert_rolled_back(before)
+        self.assertIsNone(self.manager.poll_writes())
+
+        # 처리한 뒤에는 다시 저장됨
+        del self.manager._write_all
+        self.assertTrue(self.manager.update(self.ids[1], {"doctor": "최의사"})[0])
+        self.assertEqual(self.manager.flush(), (True, ""))
+        self.assertIsNone(self.manager.poll_writes())
+
+    def test_poll_writes_reports_failure(self):
+        before = self.state()
+        self.fail_writes()
+        self.assertTrue(self.manager.update(self.ids[0], {"doctor": "최의사"})[0])
+        self.manager.writer.flush()
+        self.assertEqual(self.manager.poll_writes(), "파일 저장에 실패했습니다.")
+        self.assert_rolled_back(before)
+        self.assertIsNone(self.manager.poll_writes())
+
+    def test_own_writes_are_not_external_changes(self):
+        # 쓰기 스레드의 부가 정보 파일 기록과 세대 번호 반영 사이에 확인해도 변경으로 보지 않음
+        self.manager.writer.delay = 0
+        for i in range(200):
+            self.assertTrue(self.manager.update(self.ids[0], {"room_number": 100 + i})[0])
+            self.assertFalse(self.manager.has_changed())
+        self.assertEqual(self.manager.flush(), (True, ""))
+        self.assertFalse(self.manager.has_changed())
+
+    def test_close_flushes_pending_writes(self):
+        self.manager.writer.delay = 60
+        new_ids = [self.manager.create(dict(PATIENT, name=f"환자{i}"))[1] for i in range(5)]
+        self.assertTrue(self.manager.update(self.ids[0], {"doctor": "최의사"})[0])
+        self.manager.close()
+
+        other = self.open()
+        self.assertEqual([p.patient_id for p in other.read_all()], self.ids + new_ids)
+        self.assertEqual(other.read_by_id(self.ids[0]).doctor, "최의사")
+        other.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
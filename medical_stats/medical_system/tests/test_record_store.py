@@ -0,0 +1,121 @@
+"""
+test_record_store.py
+건강 기록 SQLite 저장소 조회 결과(CSV 방식과 동일)와 변경 감지(stamp) 테스트
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from health_app.data_manager import HealthDataManager
+from health_app.record_store import HealthRecordStore, migrate_csv
+from integration.data_generator import generate
+
+
+FIELDS = ["date", "patient_id", "name", "bmi"]
+
+
+RECORD = {
+    "age": 45, "gender": "남성", "height": 172, "weight": 71.5, "ap_hi": 128, "ap_lo": 82,
+    "cholesterol": 1, "gluc": 1, "smoke": 0, "alco": 0, "active": 1, "bmi": 24.2, "risk_score": 30
+}
+
+
+class LookupTest(unittest.TestCase):
+    """SQLite 인덱스 조회가 CSV 전체 읽기 후 거르는 결과와 같은지"""
+
+    def setUp(self):
+        self.base_path = tempfile.mkdtemp(prefix="record_store_test_")
+        generate(os.path.join(self.base_path, "data"), patients=30, records=600, workers=1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.csv = HealthDataManager(self.base_path)
+            self.db = HealthDataManager(self.base_path, backend="sqlite")
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.base_path, ignore_errors=True)
+
+    def test_queries_match_csv(self):
+        records = self.csv.load_records()
+        self.assertEqual(len(records), 600)
+        self.assertEqual(self.db.load_records(), records)
+
+        patient_ids = sorted({r["patient_id"] for r in records})
+        self.assertIn("", patient_ids)
+        for patient_id in patient_ids + ["P999"]:
+            for start, end in ((None, None), ("2025-03-01", None), (None, "2025-06-15"),
+                               ("2025-04-01", "2025-04-30"), ("2025-12-01", "2025-01-01")):
+                self.assertEqual(self.db.load_records_by_patient(patient_id, start, end),
+                                 self.csv.load_records_by_patient(patient_id, start, end),
+                                 (patient_id, start, end))
+
+        for name in sorted({r["name"] for r in records})[::5] + ["없는이름"]:
+            self.assertEqual(self.db.load_records_by_name(name), self.csv.load_records_by_name(name))
+        for start, end in ((None, None), ("2025-02-10", "2025-02-10"), ("2025-07-01", None)):
+            self.assertEqual(self.db.load_records_between(start, end),
+                             self.csv.load_records_between(start, end))
+
+    def test_end_date_includes_whole_day(self):
+        records = self.csv.load_records()
+        day = records[0]["date"][:10]
+        expected = [r for r in records if r["date"].startswith(day)]
+        self.assertTrue(expected)
+        self.assertEqual(self.db.load_records_between(day, day), sorted(expected, key=lambda r: r["date"]))
+
+    def test_append_and_migrate_once(self):
+        saved = self.db.append_record("P001", "홍길동", RECORD)
+        self.assertIn(saved, self.db.load_records_by_patient("P001"))
+        self.assertEqual(self.db.load_records_by_name("홍길동")[-1], saved)
+        self.assertEqual(len(self.db.load_records()), 601)
+
+        # DB에 기록이 있으면 다시 옮기지 않음
+        self.db.close()
+        self.assertEqual(migrate_csv(self.csv.user_file, self.db.db_path, HealthDataManager.CSV_HEADERS), 0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.db = HealthDataManager(self.base_path, backend="sqlite")
+        self.assertEqual(len(self.db.load_records()), 601)
+
+
+class StampTest(unittest.TestCase):
+    """다른 연결에서 추가한 기록도 stamp()가 바뀌는지"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="record_store_test_")
+        self.db_path = os.path.join(self.work_dir, "health_records.db")
+        self.store = HealthRecordStore(self.db_path, FIELDS)
+        self.other = HealthRecordStore(self.db_path, FIELDS)
+
+    def tearDown(self):
+        self.store.close()
+        self.other.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_stamp_changes_on_write(self):
+        self.assertTrue(self.store.is_empty())
+        empty = self.store.stamp()
+
+        self.other.add({"date": "2026-01-09 10:00", "patient_id": "P001", "name": "홍길동", "bmi": 22})
+        first = self.store.stamp()
+        self.assertNotEqual(first, empty)
+        self.assertFalse(self.store.is_empty())
+
+        self.other.add_many({"date": "2026-01-09 11:00", "name": f"사용자{i}"} for i in range(3))
+        second = self.store.stamp()
+        self.assertNotEqual(second, first)
+        self.assertEqual(second, self.other.stamp())
+        self.assertEqual(self.store.stamp(), second)
+
+
+if __name__ == "__main__":
+    unittest.main()
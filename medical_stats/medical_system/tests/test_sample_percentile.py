@@ -0,0 +1,220 @@
+"""
+test_sample_percentile.py
+샘플 데이터 기준 백분위(sample_percentile) 테스트 (분위수 표 결과가 정렬한 값에서 직접 구한 순위와 같은지)
+
+실행: (medical_system 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+"""
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from array import array
+from bisect import bisect_left, bisect_right
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from health_app import sample_dataset
+from health_app import sample_percentile
+from health_app.data_manager import HealthDataManager
+from health_app.sample_dataset import SampleDataset
+from health_app.sample_percentile import (ALL_AGES, METRICS, MIN_GROUP_SIZE, age_band, find_group,
+                                          percentile_rank, quantiles, sketch_path_for)
+
+
+SAMPLE_HEADER = "id;age;gender;height;weight;ap_hi;ap_lo;cholesterol;gluc;smoke;alco;active;cardio"
+
+# 분위수 표(201점)로 구한 백분위와 직접 구한 순위의 허용 오차 (%p)
+TOLERANCE = 1.0
+
+
+def write_sample_csv(path, rows, seed=0):
+    """Kaggle 형식 가상 샘플 CSV 작성 (키 0인 행 포함)"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(SAMPLE_HEADER + "\n")
+        for i in range(rows):
+            f.write(";".join(str(v) for v in (
+                i, rng.randint(10000, 24000), rng.choice((1, 2)),
+                0 if rng.random() < 0.05 else rng.randint(140, 200),
+                round(rng.uniform(40, 130), 1), rng.randint(90, 180), rng.randint(60, 110),
+                rng.randint(1, 3), rng.randint(1, 3), rng.randint(0, 1), rng.randint(0, 1),
+                rng.randint(0, 1), rng.randint(0, 1)
+            )) + "\n")
+
+
+def exact_rank(ordered, value):
+    """정렬한 값 전체에서 직접 구한 백분위 (같은 값은 가운데 순위, 값 사이는 선형 보간)"""
+    last = len(ordered) - 1
+    if value < ordered[0]:
+        return 0.0
+    if value > ordered[-1]:
+        return 100.0
+    low = bisect_left(ordered, value)
+    high = bisect_right(ordered, value)
+    if low != high:
+        position = (low + high - 1) / 2
+    else:
+        below, above = ordered[low - 1], ordered[low]
+        position = low - 1 + (value - below) / (above - below)
+    return position / last * 100
+
+
+def group_values(records, gender, band):
+    """그룹의 지표별 정렬한 값 (분위수 표와 같이 4바이트 실수로 저장한 값)"""
+    rows = [r for r in records if r["gender"] == gender and (band == ALL_AGES or age_band(r["age"]) == band)]
+    values = {
+        "height": [r["height"] for r in rows],
+        "weight": [r["weight"] for r in rows],
+        "ap_hi": [r["ap_hi"] for r in rows],
+        "ap_lo": [r["ap_lo"] for r in rows],
+        "bmi": [r["weight"] / ((r["height"] / 100) ** 2) for r in rows if r["height"] > 0]
+    }
+    return {metric: sorted(array("f", values[metric])) for metric in METRICS}
+
+
+class PercentileRankTest(unittest.TestCase):
+    """분위수 표와 이진 탐색"""
+
+    def test_quantiles(self):
+        self.assertEqual(quantiles([]), [])
+        self.assertEqual(quantiles([5]), [5] * 201)
+        self.assertEqual(quantiles(range(101), points=11), [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100])
+        self.assertEqual(quantiles([0, 10], points=5), [0, 2.5, 5, 7.5, 10])
+
+    def test_percentile_rank(self):
+        table = [float(i) for i in range(101)]
+        self.assertIsNone(percentile_rank([], 1))
+        self.assertEqual(percentile_rank(table, -1), 0.0)
+        self.assertEqual(percentile_rank(table, 101), 100.0)
+        self.assertEqual(percentile_rank(table, 0), 0.0)
+        self.assertEqual(percentile_rank(table, 37.5), 37.5)
+        # 같은 값이 여러 점에 걸쳐 있으면 가운데
+        self.assertEqual(percentile_rank([1, 2, 2, 2, 3], 2), 50.0)
+        self.assertEqual(percentile_rank([1, 1, 1, 1, 1], 1), 50.0)
+
+
+class SketchTestCase(unittest.TestCase):
+    """임시 폴더에 샘플 CSV 준비"""
+
+    rows = 4000
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="sample_percentile_test_")
+        os.makedirs(os.path.join(self.work_dir, "data"))
+        self.sample_file = os.path.join(self.work_dir, "data", "cardiovascular_sample.csv")
+        write_sample_csv(self.sample_file, self.rows)
+        sample_dataset.clear_cache()
+
+    def tearDown(self):
+        sample_dataset.clear_cache()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def manager(self, **options):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return HealthDataManager(self.work_dir, workers=1, **options)
+
+
+class SketchAccuracyTest(SketchTestCase):
+    """그룹별 백분위가 정렬한 값에서 직접 구한 순위와 같은지"""
+
+    def test_ranks_match_sorted_values(self):
+        records = SampleDataset.from_csv(self.sample_file, workers=1).to_records()
+        sketches = self.manager().get_percentile_sketches()
+        rng = random.Random(1)
+        for key, group in sketches["groups"].items():
+            gender, band = key.split("|")
+            ordered = group_values(records, gender, band)
+            self.assertEqual(group["count"], len(ordered["height"]), key)
+            for metric in METRICS:
+                values = ordered[metric]
+                table = group["quantiles"][metric]
+                self.assertEqual((table[0], table[-1]), (round(values[0], 3), round(values[-1], 3)))
+                probes = rng.sample(values, 20) + [rng.uniform(values[0], values[-1]) for _ in range(20)]
+                for value in probes:
+                    self.assertAlmostEqual(percentile_rank(table, value), exact_rank(values, value),
+                                           delta=TOLERANCE, msg=(key, metric, value))
+
+    def test_user_ranks(self):
+        manager = self.manager()
+        records = SampleDataset.from_csv(self.sample_file, workers=1).to_records()
+        user = {"age": 47, "height": 172, "weight": 81.5, "ap_hi": 128, "ap_lo": 84}
+        user["bmi"] = user["weight"] / ((user["height"] / 100) ** 2)
+
+        ranks = manager.get_percentile_ranks(user, "남성")
+        self.assertEqual(ranks["group"], "남성 40대")
+        ordered = group_values(records, "남성", "40대")
+        self.assertEqual(ranks["count"], len(ordered["height"]))
+        for metric in METRICS:
+            self.assertAlmostEqual(ranks[metric], exact_rank(ordered[metric], user[metric]), delta=TOLERANCE)
+
+        comparison = manager.compare_with_gender_average(user, "남성")
+        self.assertEqual(comparison["percentile_group"], "남성 40대")
+        for metric in ("bmi", "height", "weight", "ap_hi"):
+            self.assertEqual(comparison[metric]["percentile"], ranks[metric])
+
+    def test_group_fallback(self):
+        sketches = self.manager().get_percentile_sketches()
+        self.assertEqual(find_group(sketches, "여성", 55)[0], "여성 50대")
+        self.assertEqual(find_group(sketches, "여성", 90)[0], "여성 전체")
+        self.assertEqual(find_group(sketches, "여성")[0], "여성 전체")
+        # 같은 연령대 샘플이 적으면 성별 전체와 비교
+        sketches["groups"]["여성|50대"]["count"] = MIN_GROUP_SIZE - 1
+        self.assertEqual(find_group(sketches, "여성", 55)[0], "여성 전체")
+        self.assertEqual(find_group(sketches, "기타", 55), (None, None))
+
+
+class SketchFileTest(SketchTestCase):
+    """분위수 표 파일 저장/재사용과 원본이 바뀌었을 때 다시 만들기"""
+
+    def test_saved_and_reused(self):
+        sketches = self.manager().get_percentile_sketches()
+        path = sketch_path_for(self.sample_file)
+        self.assertTrue(os.path.exists(path))
+
+        build = sample_percentile.build_sketches
+        sample_percentile.build_sketches = None
+        try:
+            # 새 관리자(다음 실행)는 저장된 파일을 그대로 읽음
+            self.assertEqual(self.manager().get_percentile_sketches(), sketches)
+        finally:
+            sample_percentile.build_sketches = build
+
+        # 원본이 바뀌면 다시 만들고 저장
+        write_sample_csv(self.sample_file, 500, seed=5)
+        manager = self.manager()
+        rebuilt = manager.get_percentile_sketches()
+        self.assertEqual(sum(g["count"] for k, g in rebuilt["groups"].items() if k.endswith(ALL_AGES)), 500)
+        self.assertIs(manager.get_percentile_sketches(), rebuilt)
+        self.assertEqual(sample_percentile.load_sketches(path, sample_dataset.file_stamp(self.sample_file)),
+                         rebuilt)
+
+    def test_streaming_builds_same_sketches(self):
+        expected = self.manager().get_percentile_sketches()
+        os.remove(sketch_path_for(self.sample_file))
+        sample_dataset.clear_cache()
+        self.assertEqual(self.manager(streaming=True).get_percentile_sketches(), expected)
+        self.assertEqual(sample_dataset._cache, {})
+
+    def test_broken_file_is_rebuilt(self):
+        expected = self.manager().get_percentile_sketches()
+        with open(sketch_path_for(self.sample_file), "w", encoding="utf-8") as f:
+            f.write("{")
+        self.assertEqual(self.manager().get_percentile_sketches(), expected)
+
+    def test_missing_sample_file(self):
+        os.remove(self.sample_file)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertIsNone(self.manager().get_percentile_ranks({"age": 40, "height": 170}, "남성"))
+        self.assertIn("샘플 데이터 파일을 찾을 수 없습니다.", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
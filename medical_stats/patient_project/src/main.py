@@ -17,6 +17,8 @@ from tkinter import *
 from tkinter import ttk, messagebox
 from patient import Patient
 from patient_manager import PatientManager
+from patient_tree import VirtualPatientTree
+import perf_monitor
 
 
 class PatientManagementApp:
@@ -26,6 +28,9 @@ class PatientManagementApp:
     CRUD 기능을 제공하는 tkinter 기반 인터페이스
     """
     
+    # 예약 저장 실패 확인 간격 (ms)
+    WRITE_CHECK_MS = 500
+    
     def __init__(self):
         """생성자: GUI 초기화"""
         self.window = Tk()
@@ -52,8 +57,8 @@ class PatientManagementApp:
         
         self.window.configure(bg=self.colors["bg"])
         
-        # 데이터 매니저 초기화
-        self.manager = PatientManager()
+        # 데이터 매니저 초기화 (저장은 쓰기 스레드가 모아서 하므로 화면이 멈추지 않음)
+        self.manager = PatientManager(write_behind=True)
         
         # 위젯 생성
         self.create_widgets()
@@ -63,6 +68,31 @@ class PatientManagementApp:
         
         # 키보드 단축키 바인딩
         self.bind_shortcuts()
+        
+        # 창 닫기 이벤트
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # 예약 저장 실패 확인
+        self._write_check = self.window.after(self.WRITE_CHECK_MS, self.check_writes)
+    
+    def on_close(self):
+        """프로그램 종료 (예약된 저장을 모두 마친 뒤 종료)"""
+        ok, msg = self.manager.flush()
+        if not ok and not messagebox.askyesno(
+                "저장 실패", f"{msg}\n\n저장하지 못한 변경은 취소되었습니다. 그래도 종료할까요?"):
+            self.refresh_table()
+            return
+        self.window.after_cancel(self._write_check)
+        self.manager.close()
+        self.window.destroy()
+    
+    def check_writes(self):
+        """예약 저장 실패 확인 (실패하면 저장하지 못한 변경을 되돌리고 알림)"""
+        error = self.manager.poll_writes()
+        if error:
+            messagebox.showerror("저장 실패", f"{error}\n\n저장하지 못한 변경은 취소되었습니다.")
+            self.refresh_table()
+        self._write_check = self.window.after(self.WRITE_CHECK_MS, self.check_writes)
     
     def create_widgets(self):
         """모든 위젯 생성"""
@@ -179,12 +209,10 @@ class PatientManagementApp:
             table_frame,
             columns=columns,
             show="headings",
-            yscrollcommand=y_scroll.set,
             xscrollcommand=x_scroll.set,
             height=20
         )
         
-        y_scroll.config(command=self.tree.yview)
         x_scroll.config(command=self.tree.xview)
         
         # 컬럼 설정
@@ -216,6 +244,9 @@ class PatientManagementApp:
         
         # 더블클릭 이벤트
         self.tree.bind("<Double-1>", lambda e: self.show_detail_dialog())
+        
+        # 보이는 행만 그리는 가상 스크롤 (세로 스크롤바도 여기서 조작)
+        self.table = VirtualPatientTree(self.tree, y_scroll, self.format_row)
     
     def create_buttons(self):
         """하단 버튼 영역 생성"""
@@ -229,6 +260,7 @@ class PatientManagementApp:
             ("📋 상세보기", self.show_detail_dialog, self.colors["primary"]),
             ("🏥 퇴원처리", self.discharge_patient, "#9b59b6"),
             ("📊 통계", self.show_statistics, self.colors["dark"]),
+            ("📈 성능", self.show_perf_stats, "#16a085"),
             ("🔄 새로고침", self.refresh_table, self.colors["light"])
         ]
         
@@ -267,7 +299,7 @@ class PatientManagementApp:
     def update_status_bar(self):
         """상태바 업데이트"""
         total = len(self.manager.patients)
-        hospitalized = sum(1 for p in self.manager.patients if p.is_hospitalized())
+        hospitalized = self.manager.get_hospitalized_count()
         today = self.manager.get_today_admissions()
         
         from datetime import datetime
@@ -288,43 +320,45 @@ class PatientManagementApp:
     # ==================== 테이블 관련 메서드 ====================
     
     def refresh_table(self, patients=None):
-        """테이블 데이터 새로고침"""
-        # 기존 데이터 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """
+        테이블 데이터 새로고침
+        
+        전체 행을 다시 넣지 않고 화면에 보이는 행 중 바뀐 행만 반영하므로
+        환자 수가 많아도 새로고침 시간이 일정함
         
-        # 데이터 로드
+        Args:
+            patients (list, optional): 표시할 환자 목록 (검색 결과, 없으면 전체)
+        """
         if patients is None:
-            self.manager.load_from_file()
-            patients = self.manager.read_all()
-        
-        # 데이터 삽입
-        for patient in patients:
-            values = (
-                patient.patient_id,
-                patient.name,
-                patient.age,
-                patient.get_gender_korean(),
-                patient.blood_type,
-                patient.medical_condition,
-                patient.doctor,
-                patient.hospital,
-                patient.room_number if patient.room_number else "-",
-                patient.get_admission_type_korean(),
-                patient.get_test_results_korean(),
-                patient.get_billing_formatted()
-            )
-            self.tree.insert("", END, values=values)
+            # 다른 프로그램이 저장한 경우에만 다시 로드
+            self.manager.reload_if_changed()
+            self.table.show(self.manager.read_all())
+        else:
+            # 검색 결과는 맨 위부터 표시
+            self.table.show(patients, top=True)
         
         self.update_status_bar()
     
+    def format_row(self, patient):
+        """테이블 한 행에 표시할 값 (환자 ID가 첫 번째 열)"""
+        return (
+            patient.patient_id,
+            patient.name,
+            patient.age,
+            patient.get_gender_korean(),
+            patient.blood_type,
+            patient.medical_condition,
+            patient.doctor,
+            patient.hospital,
+            patient.room_number if patient.room_number else "-",
+            patient.get_admission_type_korean(),
+            patient.get_test_results_korean(),
+            patient.get_billing_formatted()
+        )
+    
     def get_selected_patient_id(self):
-        """선택된 환자 ID 반환"""
-        selected = self.tree.selection()
-        if not selected:
-            return None
-        item = self.tree.item(selected[0])
-        return item["values"][0]
+        """선택된 환자 ID 반환 (화면 밖으로 스크롤된 행의 선택도 유지)"""
+        return self.table.selected()
     
     def search_patients(self):
         """환자 검색"""
@@ -942,6 +976,10 @@ class PatientManagementApp:
             command=dialog.destroy
         ).pack(pady=15, ipadx=20)
     
+    def show_perf_stats(self):
+        """성능 통계 팝업 (MEDICAL_PERF=1로 실행했을 때 메서드별 측정값)"""
+        perf_monitor.show_window(self.window)
+    
     def run(self):
         """애플리케이션 실행"""
         self.window.mainloop()
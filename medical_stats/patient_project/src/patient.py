@@ -7,9 +7,15 @@ Date: 2026-01-09
 데이터 출처: Kaggle - Healthcare Dataset
 """
 
+import sys
 from datetime import datetime
 
 
+def _intern(value):
+    """문자열이면 intern된 객체 반환 (같은 값은 한 객체를 공유)"""
+    return sys.intern(value) if type(value) is str else value
+
+
 class Patient:
     """
     환자 정보를 담는 클래스
@@ -33,8 +39,21 @@ class Patient:
         discharge_date (str): 퇴원일
         medication (str): 처방약
         test_results (str): 검사 결과
+    
+    환자 수가 많을 때 메모리를 줄이기 위해 __slots__로 인스턴스 __dict__를 없애고,
+    반복이 많은 범주형 값(INTERNED_FIELDS)은 생성/수정 시 intern하여 같은 문자열을 공유
     """
     
+    __slots__ = ("patient_id", "name", "age", "gender", "blood_type", "medical_condition",
+                 "date_of_admission", "doctor", "hospital", "insurance_provider",
+                 "billing_amount", "room_number", "admission_type", "discharge_date",
+                 "medication", "test_results")
+    
+    # 생성/수정 시 intern하는 필드 (환자마다 같은 값이 반복되는 범주형 필드)
+    INTERNED_FIELDS = ("gender", "blood_type", "medical_condition", "date_of_admission",
+                       "doctor", "hospital", "insurance_provider", "admission_type",
+                       "discharge_date", "medication", "test_results")
+    
     # 유효한 값 목록 (클래스 변수)
     VALID_GENDERS = ["Male", "Female"]
     VALID_BLOOD_TYPES = ["A+", "A-", "B+", "B-", "O+", "O-", "AB+", "AB-"]
@@ -51,19 +70,19 @@ class Patient:
         self.patient_id = patient_id
         self.name = name
         self.age = age
-        self.gender = gender
-        self.blood_type = blood_type
-        self.medical_condition = medical_condition
-        self.date_of_admission = date_of_admission if date_of_admission else datetime.now().strftime("%Y-%m-%d")
-        self.doctor = doctor
-        self.hospital = hospital
-        self.insurance_provider = insurance_provider
+        self.gender = _intern(gender)
+        self.blood_type = _intern(blood_type)
+        self.medical_condition = _intern(medical_condition)
+        self.date_of_admission = _intern(date_of_admission if date_of_admission else datetime.now().strftime("%Y-%m-%d"))
+        self.doctor = _intern(doctor)
+        self.hospital = _intern(hospital)
+        self.insurance_provider = _intern(insurance_provider)
         self.billing_amount = billing_amount
         self.room_number = room_number
-        self.admission_type = admission_type
-        self.discharge_date = discharge_date
-        self.medication = medication
-        self.test_results = test_results
+        self.admission_type = _intern(admission_type)
+        self.discharge_date = _intern(discharge_date)
+        self.medication = _intern(medication)
+        self.test_results = _intern(test_results)
     
     def to_dict(self):
         """
@@ -91,6 +110,20 @@ class Patient:
             "test_results": self.test_results
         }
     
+    @classmethod
+    def intern_value(cls, name, value):
+        """
+        필드에 저장할 값 (INTERNED_FIELDS의 문자열이면 intern, 수정할 때 사용)
+        
+        Args:
+            name (str): 필드명
+            value: 새 값
+        
+        Returns:
+            intern된 문자열 또는 value 그대로
+        """
+        return _intern(value) if name in cls.INTERNED_FIELDS else value
+    
     @classmethod
     def from_dict(cls, data):
         """
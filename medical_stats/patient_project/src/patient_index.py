@@ -0,0 +1,186 @@
+"""
+patient_index.py
+환자 검색용 보조 인덱스 클래스
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+데이터 출처: Kaggle - Healthcare Dataset
+"""
+
+
+class PatientSearchIndex:
+    """
+    필드별 정확 일치 인덱스 + n-gram 부분 문자열 인덱스
+
+    필드마다 서로 다른 값(value) 단위로 색인하므로, 진단명/병원처럼 값 종류가 적은
+    필드는 환자 수와 무관하게 작은 인덱스로 검색할 수 있음
+
+        by_value[필드][원래 값]   → {환자 ID}        (정확 일치)
+        lowered[필드][소문자 값]  → {원래 값}
+        grams[필드][1~2글자 조각] → {소문자 값}       (부분 문자열 후보)
+
+    Attributes:
+        fields (tuple): 색인 대상 필드명
+        seq (dict): 환자 ID → 등록 순번 (검색 결과를 목록 순서로 정렬할 때 사용)
+    """
+
+    # 부분 문자열/정확 일치 색인 대상 필드 (search()의 "all" 검색 범위와 동일)
+    TEXT_FIELDS = ("patient_id", "name", "medical_condition", "doctor", "hospital")
+    # 정확 일치만 필요한 범주형 필드
+    EXACT_FIELDS = ("blood_type",)
+
+    def __init__(self):
+        """생성자: 빈 인덱스 생성"""
+        self.fields = self.TEXT_FIELDS + self.EXACT_FIELDS
+        self.clear()
+
+    def clear(self):
+        """인덱스 비우기"""
+        self.by_value = {field: {} for field in self.fields}
+        self.lowered = {field: {} for field in self.TEXT_FIELDS}
+        self.grams = {field: {} for field in self.TEXT_FIELDS}
+        self.seq = {}
+        self._next_seq = 0
+
+    @staticmethod
+    def _grams(text):
+        """1글자/2글자 조각 집합"""
+        grams = set(text)
+        grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        return grams
+
+    # ==================== 인덱스 갱신 ====================
+
+    def build(self, patients):
+        """환자 목록 전체로 인덱스 재구성"""
+        self.clear()
+        for patient in patients:
+            self.add(patient)
+
+    def add(self, patient, seq=None):
+        """
+        환자 한 명 색인
+
+        Args:
+            patient (Patient): 색인할 환자
+            seq (int): 등록 순서 (삭제를 되돌릴 때 remove()가 반환한 값, 없으면 맨 뒤)
+        """
+        pid = patient.patient_id
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        self.seq[pid] = seq
+        for field in self.fields:
+            self._add_value(field, getattr(patient, field, ""), pid)
+
+    def remove(self, patient):
+        """환자 한 명 색인 제거 (등록 순서 반환, 색인에 없었으면 None)"""
+        pid = patient.patient_id
+        for field in self.fields:
+            self._remove_value(field, getattr(patient, field, ""), pid)
+        return self.seq.pop(pid, None)
+
+    def update(self, patient, old_values):
+        """
+        수정된 환자 색인 갱신 (바뀐 필드만)
+
+        Args:
+            patient (Patient): 수정 후 환자
+            old_values (dict): 수정 전 값 (Patient.to_dict() 형식)
+        """
+        pid = patient.patient_id
+        for field in self.fields:
+            old = old_values.get(field, "")
+            new = getattr(patient, field, "")
+            if old != new:
+                self._remove_value(field, old, pid)
+                self._add_value(field, new, pid)
+
+    def _add_value(self, field, value, pid):
+        """필드 값 하나 색인"""
+        value = "" if value is None else str(value)
+        ids = self.by_value[field].get(value)
+        if ids is None:
+            ids = self.by_value[field][value] = set()
+            if field in self.lowered:
+                low = value.lower()
+                originals = self.lowered[field].get(low)
+                if originals is None:
+                    originals = self.lowered[field][low] = set()
+                    grams = self.grams[field]
+                    for gram in self._grams(low):
+                        grams.setdefault(gram, set()).add(low)
+                originals.add(value)
+        ids.add(pid)
+
+    def _remove_value(self, field, value, pid):
+        """필드 값 하나 색인 제거 (더 이상 쓰이지 않는 값/조각은 정리)"""
+        value = "" if value is None else str(value)
+        ids = self.by_value[field].get(value)
+        if ids is None:
+            return
+        ids.discard(pid)
+        if ids:
+            return
+
+        del self.by_value[field][value]
+        if field in self.lowered:
+            low = value.lower()
+            originals = self.lowered[field].get(low)
+            if originals is not None:
+                originals.discard(value)
+                if not originals:
+                    del self.lowered[field][low]
+                    grams = self.grams[field]
+                    for gram in self._grams(low):
+                        values = grams.get(gram)
+                        if values is not None:
+                            values.discard(low)
+                            if not values:
+                                del grams[gram]
+
+    # ==================== 조회 ====================
+
+    def exact(self, field, value):
+        """
+        필드 값이 정확히 일치하는 환자 ID 집합
+
+        Returns:
+            set: 환자 ID 집합
+        """
+        return set(self.by_value.get(field, {}).get(value, ()))
+
+    def substring(self, field, keyword):
+        """
+        필드 값에 keyword(소문자)가 포함된 환자 ID 집합
+
+        Args:
+            field (str): TEXT_FIELDS 중 하나
+            keyword (str): 소문자로 정규화된 검색어 (1글자 이상)
+
+        Returns:
+            set: 환자 ID 집합
+        """
+        grams = self.grams[field]
+        if len(keyword) == 1:
+            candidates = grams.get(keyword, ())
+        else:
+            # 2글자 조각들의 교집합 → 실제 포함 여부 확인
+            pieces = sorted(
+                (grams.get(keyword[i:i + 2], set()) for i in range(len(keyword) - 1)),
+                key=len
+            )
+            candidates = set(pieces[0]).intersection(*pieces[1:])
+
+        result = set()
+        by_value = self.by_value[field]
+        for low in candidates:
+            if keyword in low:
+                for value in self.lowered[field][low]:
+                    result.update(by_value[value])
+        return result
+
+    def ordered(self, ids):
+        """환자 ID들을 등록 순서로 정렬"""
+        seq = self.seq
+        return sorted(ids, key=seq.__getitem__)
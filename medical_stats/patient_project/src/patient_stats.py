@@ -0,0 +1,179 @@
+"""
+patient_stats.py
+환자 통계 카운터 (등록/수정/삭제 시 증감만 반영)
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+데이터 출처: Kaggle - Healthcare Dataset
+"""
+
+import math
+
+from patient_table import age_group
+
+
+# 분포 키 → 환자 정보 딕셔너리에서 값 꺼내는 함수 (get_statistics() 결과 키 순서)
+DISTRIBUTIONS = {
+    "age_groups": lambda get: age_group(get("age")),
+    "conditions": lambda get: get("medical_condition"),
+    "admission_types": lambda get: get("admission_type"),
+    "blood_types": lambda get: get("blood_type"),
+    "test_results": lambda get: get("test_results")
+}
+
+# 카운터와 전체 재계산 결과를 비교할 때 허용 오차 (청구금액 합계는 실수 덧셈/뺄셈 누적)
+TOLERANCES = {
+    "avg_billing": 1.0,
+    "total_billing": 1.0
+}
+
+
+class PatientStatistics:
+    """
+    환자 통계를 카운터로 유지하는 클래스
+
+    성별/연령대/진단명/입원 유형/혈액형/검사 결과별 인원, 입원 중 인원,
+    입원일별 인원, 나이/청구금액 합계를 보관하고
+    환자 등록/수정/삭제 때 해당 환자 몫만 더하거나 빼므로
+    snapshot()은 환자 수와 관계없이 범주 수만큼만 일함
+    """
+
+    def __init__(self):
+        """생성자: 빈 카운터"""
+        self.clear()
+
+    def clear(self):
+        """모든 카운터 초기화"""
+        self.total = 0
+        self.male_count = 0
+        self.hospitalized = 0
+        self.age_sum = 0
+        self.billing_sum = 0.0
+        self.distributions = {key: {} for key in DISTRIBUTIONS}
+        self.admissions = {}
+
+    def build(self, patients):
+        """환자 목록으로 카운터 재구성"""
+        self.clear()
+        for patient in patients:
+            self.add(patient)
+
+    @staticmethod
+    def _bump(counts, key, delta):
+        """개수 증감 (0이 되면 키 삭제)"""
+        count = counts.get(key, 0) + delta
+        if count:
+            counts[key] = count
+        else:
+            del counts[key]
+
+    def _apply(self, get, delta):
+        """
+        환자 한 명 몫을 카운터에 반영
+
+        Args:
+            get (function): 필드명 → 값
+            delta (int): 1 (추가) 또는 -1 (제거)
+
+        Raises:
+            TypeError, ValueError: 값 형식 오류 (카운터를 바꾸기 전에 발생하므로 카운터는 그대로)
+        """
+        # 값을 먼저 모두 읽고 변환 (청구금액은 수정 데이터에서 문자열로 들어올 수 있음)
+        age = get("age")
+        billing = float(get("billing_amount") or 0)
+        groups = [(self.distributions[key], value_of(get)) for key, value_of in DISTRIBUTIONS.items()]
+        discharge_date = get("discharge_date")
+
+        self.total += delta
+        if get("gender") == "Male":
+            self.male_count += delta
+        if discharge_date == "" or discharge_date is None:
+            self.hospitalized += delta
+        self.age_sum += age * delta
+        self.billing_sum += billing * delta
+
+        for counts, value in groups:
+            self._bump(counts, value, delta)
+        self._bump(self.admissions, get("date_of_admission"), delta)
+
+    def add(self, patient):
+        """환자 추가"""
+        self._apply(lambda name: getattr(patient, name), 1)
+
+    def remove(self, patient):
+        """환자 제거"""
+        self._apply(lambda name: getattr(patient, name), -1)
+
+    def update(self, patient, old_values):
+        """
+        환자 정보 수정 반영
+
+        Args:
+            patient (Patient): 수정 후 환자
+            old_values (dict): 수정 전 값 (patient.to_dict() 백업)
+
+        Raises:
+            TypeError, ValueError: 수정 후 값 형식 오류 (카운터는 수정 전 상태로 되돌림)
+        """
+        self._apply(old_values.get, -1)
+        try:
+            self.add(patient)
+        except (TypeError, ValueError):
+            self._apply(old_values.get, 1)
+            raise
+
+    def admissions_on(self, date):
+        """입원일이 date인 환자 수"""
+        return self.admissions.get(date, 0)
+
+    def snapshot(self):
+        """
+        PatientManager.get_statistics()와 같은 형식의 통계
+
+        Returns:
+            dict: 통계 데이터 (환자가 없으면 None)
+        """
+        total = self.total
+        if not total:
+            return None
+
+        female_count = total - self.male_count
+        stats = {
+            "total_patients": total,
+            "male_count": self.male_count,
+            "female_count": female_count,
+            "male_ratio": round(self.male_count / total * 100, 1),
+            "female_ratio": round(female_count / total * 100, 1)
+        }
+        stats.update({key: dict(counts) for key, counts in self.distributions.items()})
+        stats.update({
+            "hospitalized_count": self.hospitalized,
+            "discharged_count": total - self.hospitalized,
+            "avg_age": round(self.age_sum / total, 1),
+            "avg_billing": round(self.billing_sum / total, 0),
+            "total_billing": round(self.billing_sum, 0)
+        })
+        return stats
+
+
+def diff_statistics(stats, expected):
+    """
+    두 통계 딕셔너리에서 값이 다른 키 목록
+
+    분포 딕셔너리는 키 순서와 관계없이 비교하고,
+    청구금액은 TOLERANCES 범위 안의 차이를 같은 값으로 봄
+    """
+    if stats is None or expected is None:
+        return [] if stats is expected else ["total_patients"]
+
+    mismatched = []
+    for key, value in expected.items():
+        actual = stats.get(key)
+        tolerance = TOLERANCES.get(key)
+        if tolerance is not None and actual is not None:
+            same = math.isclose(actual, value, rel_tol=1e-9, abs_tol=tolerance)
+        else:
+            same = actual == value
+        if not same:
+            mismatched.append(key)
+    return mismatched
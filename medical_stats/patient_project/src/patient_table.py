@@ -0,0 +1,407 @@
+"""
+patient_table.py
+환자 데이터 열(column) 저장 테이블
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+데이터 출처: Kaggle - Healthcare Dataset
+"""
+
+from array import array
+from collections import Counter
+from itertools import compress
+from operator import countOf
+from types import FunctionType
+
+from patient import Patient
+
+
+# 숫자 열 → array 타입 코드 (나머지 중 TEXT_COLUMNS 외에는 범주형)
+NUMERIC_COLUMNS = {
+    "age": "q",
+    "billing_amount": "d",
+    "room_number": "q"
+}
+
+# 값이 거의 겹치지 않아 그대로 리스트에 저장하는 열
+TEXT_COLUMNS = ("patient_id", "name")
+
+# Patient.get_age_group()과 같은 구간 (상한 미만, 라벨)
+AGE_GROUPS = (
+    (20, "10대 이하"),
+    (30, "20대"),
+    (40, "30대"),
+    (50, "40대"),
+    (60, "50대"),
+    (70, "60대")
+)
+
+# 범주 수가 이 값 이하인 열은 코드를 바이트 문자열에서 코드별로 직접 셈 (bincount)
+BINCOUNT_MAX_CODES = 32
+
+# 분포(개수)를 집계하는 범주형 열 → get_statistics() 결과 키
+DISTRIBUTION_COLUMNS = {
+    "medical_condition": "conditions",
+    "admission_type": "admission_types",
+    "blood_type": "blood_types",
+    "test_results": "test_results"
+}
+
+
+def age_group(age):
+    """나이 → 연령대 라벨"""
+    for upper, label in AGE_GROUPS:
+        if age < upper:
+            return label
+    return "70대 이상"
+
+
+class _ColumnAttribute:
+    """PatientRow 속성 하나를 테이블 열 값으로 연결하는 디스크립터"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, row, owner=None):
+        if row is None:
+            return self
+        return row._table.get(row._slot, self.name)
+
+    def __set__(self, row, value):
+        row._table.set(row._slot, self.name, value)
+
+
+class PatientRow:
+    """
+    PatientTable 한 행의 보기(view)
+
+    값은 테이블 열에 있고 객체는 (테이블, 행 번호)만 가짐.
+    Patient와 같은 속성/메서드(to_dict, validate, get_*_korean 등)를 제공하며,
+    속성을 수정하면 테이블 열이 바로 바뀜
+    """
+
+    __slots__ = ("_table", "_slot")
+
+    def __init__(self, table, slot):
+        """생성자: 테이블과 행 번호 연결"""
+        self._table = table
+        self._slot = slot
+
+
+# Patient의 필드는 열 값으로, 메서드와 유효값 목록은 그대로 사용
+for _name in Patient.__slots__:
+    setattr(PatientRow, _name, _ColumnAttribute(_name))
+for _name, _value in vars(Patient).items():
+    if _name.startswith("VALID_") or (isinstance(_value, FunctionType) and _name != "__init__"):
+        setattr(PatientRow, _name, _value)
+
+
+class PatientTable:
+    """
+    환자 정보를 열(column) 단위로 보관하는 테이블
+
+    숫자 열(나이, 청구금액, 병실)은 array, 범주형 열은 값 목록 + 정수 코드 array
+    (범주가 256개 이하면 1바이트, 넘으면 4바이트)로 저장하여
+    통계를 코드별 개수 세기와 array 합계로 계산.
+    list처럼 append/extend/insert/index/remove/pop/인덱싱/순회를 지원하고 항목은 PatientRow로 반환하므로
+    PatientManager.patients 자리에 그대로 사용 가능
+
+    열은 행 번호(slot) 순서로 쌓이고 목록 순서는 _order가 따로 가짐.
+    삭제된 행은 _order에서 빠지고 _alive 표시만 0이 되며 열 값은 남아 있어
+    삭제 직후에도 행 보기로 값을 읽을 수 있음 (다음 로드 때 정리됨)
+    """
+
+    def __init__(self, patients=()):
+        """
+        생성자: 빈 열 생성 후 환자 추가
+
+        Args:
+            patients (iterable): 처음 넣을 Patient(또는 같은 속성을 가진) 객체들
+        """
+        self.fieldnames = Patient.__slots__
+        self._columns = {}
+        self._categories = {}
+        self._codes = {}
+        for name in self.fieldnames:
+            if name in NUMERIC_COLUMNS:
+                self._columns[name] = array(NUMERIC_COLUMNS[name])
+            elif name in TEXT_COLUMNS:
+                self._columns[name] = []
+            else:
+                self._columns[name] = array("B")
+                self._categories[name] = []
+                self._codes[name] = {}
+
+        self._order = array("q")
+        self._alive = bytearray()
+        self.extend(patients)
+
+    # ==================== 열 값 읽기/쓰기 ====================
+
+    def _encode(self, name, value):
+        """범주형 값 → 정수 코드 (처음 보는 값이면 새 코드 발급)"""
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._categories[name])
+            self._categories[name].append(value)
+            if code == 256:
+                # 1바이트 코드로 부족하면 4바이트 코드 열로 변환
+                self._columns[name] = array("I", self._columns[name])
+        return code
+
+    def get(self, slot, name):
+        """행 번호의 열 값"""
+        value = self._columns[name][slot]
+        if name in self._categories:
+            return self._categories[name][value]
+        return value
+
+    def set(self, slot, name, value):
+        """
+        행 번호의 열 값 변경
+
+        Raises:
+            TypeError: 숫자 열에 숫자가 아닌 값을 넣을 때
+        """
+        if name in self._categories:
+            value = self._encode(name, value)
+        self._columns[name][slot] = value
+
+    def _new_slot(self, patient):
+        """객체 값을 열 끝에 추가하고 행 번호 반환"""
+        slot = len(self._alive)
+        added = []
+        try:
+            for name in self.fieldnames:
+                value = getattr(patient, name)
+                if name in self._categories:
+                    value = self._encode(name, value)
+                self._columns[name].append(value)
+                added.append(name)
+        except (TypeError, OverflowError):
+            for name in added:
+                self._columns[name].pop()
+            raise
+        self._alive.append(1)
+        return slot
+
+    def _slot_of(self, patient):
+        """이 테이블의 행 보기이면 행 번호, 아니면 None"""
+        if isinstance(patient, PatientRow) and patient._table is self:
+            return patient._slot
+        return None
+
+    def _place(self, patient):
+        """
+        목록에 넣을 행 번호 (삭제된 자기 행 보기는 되살리고, 그 밖의 객체는 새 행 추가)
+
+        Raises:
+            ValueError: 이미 목록에 있는 행 보기일 때
+        """
+        slot = self._slot_of(patient)
+        if slot is None:
+            return self._new_slot(patient)
+        if self._alive[slot]:
+            raise ValueError(f"이미 테이블에 있는 환자입니다: {patient.patient_id}")
+        self._alive[slot] = 1
+        return slot
+
+    # ==================== list 호환 ====================
+
+    def __len__(self):
+        return len(self._order)
+
+    def __iter__(self):
+        return (PatientRow(self, slot) for slot in self._order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [PatientRow(self, slot) for slot in self._order[index]]
+        return PatientRow(self, self._order[index])
+
+    def __setitem__(self, index, value):
+        """
+        table[i] = patient: i번째 행 값을 patient 값으로 교체 (행 번호 유지)
+        table[:] = patients: 목록 전체를 patients로 교체 (자기 행 보기는 그대로 재사용)
+        """
+        if isinstance(index, slice):
+            if index != slice(None):
+                raise TypeError("PatientTable은 전체 교체(table[:] = ...)만 지원합니다.")
+            patients = list(value)
+            keep = {self._slot_of(p) for p in patients} - {None}
+            for slot in self._order:
+                if slot not in keep:
+                    self._alive[slot] = 0
+            order = array("q")
+            for patient in patients:
+                slot = self._slot_of(patient)
+                if slot is None:
+                    slot = self._new_slot(patient)
+                self._alive[slot] = 1
+                order.append(slot)
+            self._order = order
+            return
+
+        slot = self._order[index]
+        if self._slot_of(value) == slot:
+            return
+        for name in self.fieldnames:
+            self.set(slot, name, getattr(value, name))
+
+    def __delitem__(self, index):
+        slots = self._order[index] if isinstance(index, slice) else [self._order[index]]
+        for slot in slots:
+            self._alive[slot] = 0
+        del self._order[index]
+
+    def append(self, patient):
+        """환자 추가 (목록 끝)"""
+        slot = self._place(patient)
+        self._order.append(slot)
+
+    def extend(self, patients):
+        """여러 환자 추가"""
+        for patient in patients:
+            self.append(patient)
+
+    def insert(self, index, patient):
+        """환자를 목록의 index 위치에 추가"""
+        slot = self._place(patient)
+        self._order.insert(index, slot)
+
+    def index(self, patient):
+        """
+        환자의 목록 위치
+
+        Raises:
+            ValueError: 이 테이블의 (살아 있는) 행 보기가 아닐 때
+        """
+        slot = self._slot_of(patient)
+        if slot is None or not self._alive[slot]:
+            raise ValueError("테이블에 없는 환자입니다.")
+        return self._order.index(slot)
+
+    def pop(self, index=-1):
+        """index번째 환자를 목록에서 빼고 행 보기 반환"""
+        slot = self._order.pop(index)
+        self._alive[slot] = 0
+        return PatientRow(self, slot)
+
+    def remove(self, patient):
+        """
+        환자를 목록에서 제거
+
+        Raises:
+            ValueError: 이 테이블의 (살아 있는) 행 보기가 아닐 때
+        """
+        slot = self._slot_of(patient)
+        if slot is None or not self._alive[slot]:
+            raise ValueError("테이블에 없는 환자입니다.")
+        del self._order[self._order.index(slot)]
+        self._alive[slot] = 0
+
+    # ==================== 통계 ====================
+
+    def _live(self, name):
+        """
+        삭제된 행을 뺀 열 값(범주형은 코드)
+
+        1바이트 코드 열은 bytes로 반환 (bytes.count/find로 빠르게 셈)
+        """
+        column = self._columns[name]
+        has_deleted = 0 in self._alive
+        if column.typecode == "B":
+            return bytes(compress(column, self._alive)) if has_deleted else column.tobytes()
+        return compress(column, self._alive) if has_deleted else column
+
+    def _code_counts(self, name):
+        """범주형 열의 {코드: 개수} (행 번호 순서로 처음 나온 순서)"""
+        live = self._live(name)
+        if not isinstance(live, bytes) or len(self._categories[name]) > BINCOUNT_MAX_CODES:
+            return dict(Counter(live))
+
+        # 코드마다 바이트 문자열에서 개수/처음 위치 찾기 (C 수준 검색, 범주 수만큼 반복)
+        found = []
+        for code in range(len(self._categories[name])):
+            key = bytes((code,))
+            count = live.count(key)
+            if count:
+                found.append((live.find(key), code, count))
+        found.sort()
+        return {code: count for _, code, count in found}
+
+    def value_counts(self, name):
+        """
+        열 값별 개수 (행 번호 순서로 처음 나온 순서)
+
+        범주형 열은 정수 코드를 세고 마지막에 값으로 바꿈
+        """
+        categories = self._categories.get(name)
+        if categories is None:
+            return dict(Counter(self._live(name)))
+        return {categories[code]: count for code, count in self._code_counts(name).items()}
+
+    def count_value(self, name, value):
+        """범주형 열에서 값이 value인 행 수"""
+        code = self._codes[name].get(value)
+        if code is None:
+            return 0
+        live = self._live(name)
+        if isinstance(live, bytes):
+            return live.count(bytes((code,)))
+        return countOf(live, code)
+
+    def column_sum(self, name):
+        """숫자 열 합계"""
+        return sum(self._live(name))
+
+    def statistics(self):
+        """
+        PatientManager.get_statistics()와 같은 형식의 통계를 열 단위로 계산
+
+        분포는 열마다 코드별 개수 세기, 평균/합계는 array 합계로 계산.
+        값은 Patient 리스트로 계산한 결과와 같음 (분포 딕셔너리의 키 순서는
+        목록 순서가 아닌 행 번호 순서 기준으로 처음 나온 순서)
+
+        Returns:
+            dict: 통계 데이터 (환자가 없으면 None)
+        """
+        total = len(self._order)
+        if not total:
+            return None
+
+        male_count = self.count_value("gender", "Male")
+        female_count = total - male_count
+
+        # 나이별 개수를 연령대로 합산 (나이가 처음 나온 순서 = 연령대가 처음 나온 순서)
+        age_groups = {}
+        for age, count in self.value_counts("age").items():
+            group = age_group(age)
+            age_groups[group] = age_groups.get(group, 0) + count
+
+        distributions = {key: self.value_counts(name) for name, key in DISTRIBUTION_COLUMNS.items()}
+
+        hospitalized = (self.count_value("discharge_date", "")
+                        + self.count_value("discharge_date", None))
+
+        age_sum = self.column_sum("age")
+        total_billing = self.column_sum("billing_amount")
+
+        stats = {
+            "total_patients": total,
+            "male_count": male_count,
+            "female_count": female_count,
+            "male_ratio": round(male_count / total * 100, 1),
+            "female_ratio": round(female_count / total * 100, 1),
+            "age_groups": age_groups
+        }
+        stats.update(distributions)
+        stats.update({
+            "hospitalized_count": hospitalized,
+            "discharged_count": total - hospitalized,
+            "avg_age": round(age_sum / total, 1),
+            "avg_billing": round(total_billing / total, 0),
+            "total_billing": round(total_billing, 0)
+        })
+        return stats
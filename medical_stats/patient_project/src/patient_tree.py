@@ -0,0 +1,192 @@
+"""
+patient_tree.py
+환자 목록 가상 스크롤 테이블 (보이는 행만 Treeview에 만듦)
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+데이터 출처: Kaggle - Healthcare Dataset
+"""
+
+
+# 행 높이 기본값 (px, 행이 그려지면 실제 높이로 바뀜)
+ROW_HEIGHT = 28
+
+# 마우스 휠 한 칸에 스크롤할 행 수
+WHEEL_ROWS = 3
+
+
+class VirtualPatientTree:
+    """
+    Treeview에 화면에 보이는 만큼의 행만 넣고 스크롤하면 그 구간의 행으로 바꾸는 가상 테이블
+
+    전체 목록(rows)은 참조만 보관하고 (PatientManager.read_all()의 리스트나 PatientTable,
+    검색 결과 등 len()과 인덱싱을 지원하는 것) 화면에 그릴 때 보이는 구간만 읽어서 문자열로 바꿈.
+    Treeview 항목 ID는 환자 ID이고, 다시 그릴 때 이전에 그린 값과 비교하여
+    없어진 행은 삭제, 새 행은 삽입, 값이 바뀐 행만 수정하므로
+    새로고침/스크롤 비용이 전체 환자 수와 관계없이 보이는 행 수에만 비례함.
+
+    세로 스크롤바는 Treeview 대신 이 클래스가 직접 조작 (Treeview의 yscrollcommand는 연결하지 않음)
+
+    Attributes:
+        tree (ttk.Treeview): 행을 표시할 Treeview
+        scrollbar (Scrollbar): 세로 스크롤바
+        format_row (callable): 환자 객체 → Treeview values 튜플
+        row_height (int): 행 높이 (px, 처음 그려진 행으로 측정)
+        rows: 표시할 전체 목록
+        offset (int): 화면 첫 행의 목록 위치
+        visible (int): 화면에 보이는 행 수
+    """
+
+    def __init__(self, tree, scrollbar, format_row, row_height=ROW_HEIGHT):
+        """
+        생성자: 스크롤/선택/크기 변경 이벤트 연결
+
+        Args:
+            tree (ttk.Treeview): 열 설정이 끝난 Treeview
+            scrollbar (Scrollbar): 세로 스크롤바
+            format_row (callable): 환자 객체를 Treeview values 튜플로 변환하는 함수
+            row_height (int): 행 높이 (px)
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.format_row = format_row
+        self.row_height = row_height
+        self.rows = []
+        self.offset = 0
+        self.visible = int(tree.cget("height"))
+        self._shown = []        # 화면에 있는 환자 ID (위에서부터)
+        self._values = {}       # 환자 ID → 화면에 있는 values
+        self._selected = None   # 선택한 환자 ID (스크롤로 화면에서 벗어나도 유지)
+
+        scrollbar.config(command=self.yview)
+        tree.bind("<Configure>", self._on_configure)
+        tree.bind("<<TreeviewSelect>>", self._on_select)
+        tree.bind("<MouseWheel>", self._on_wheel)
+        tree.bind("<Button-4>", lambda e: self.scroll(-WHEEL_ROWS))
+        tree.bind("<Button-5>", lambda e: self.scroll(WHEEL_ROWS))
+        tree.bind("<Up>", lambda e: self._on_arrow(-1))
+        tree.bind("<Down>", lambda e: self._on_arrow(1))
+        tree.bind("<Prior>", lambda e: self.scroll(-self.visible))
+        tree.bind("<Next>", lambda e: self.scroll(self.visible))
+
+    # ==================== 공개 메서드 ====================
+
+    def show(self, rows, top=False):
+        """
+        목록 표시 (CRUD 후 새로고침, 검색 결과 표시)
+
+        Args:
+            rows: 표시할 전체 목록 (len()과 인덱싱 지원)
+            top (bool): True이면 맨 위로 이동, False이면 현재 스크롤 위치 유지
+        """
+        self.rows = rows
+        if top:
+            self.offset = 0
+        # 보이던 선택 행이 목록에서 빠졌으면(삭제 등) 선택 해제
+        forget = self._selected in self._values
+        self._render()
+        if forget and self._selected not in self._values:
+            self._selected = None
+
+    def selected(self):
+        """선택한 환자 ID (없으면 None)"""
+        return self._selected
+
+    def scroll(self, rows):
+        """rows행만큼 스크롤 (음수면 위로)"""
+        self.offset += rows
+        self._render()
+        return "break"
+
+    def yview(self, *args):
+        """스크롤바 명령 처리 ("moveto" 비율 / "scroll" 개수 단위)"""
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.rows))
+            self._render()
+        elif args[0] == "scroll":
+            count = int(args[1])
+            self.scroll(count * self.visible if args[2] == "pages" else count)
+
+    # ==================== 그리기 ====================
+
+    def _render(self):
+        """현재 위치의 보이는 행만 그림 (이전에 그린 행과 비교하여 바뀐 부분만 반영)"""
+        total = len(self.rows)
+        self.offset = max(0, min(self.offset, total - self.visible))
+        end = min(self.offset + self.visible, total)
+
+        window = []
+        values = {}
+        for i in range(self.offset, end):
+            patient = self.rows[i]
+            values[patient.patient_id] = self.format_row(patient)
+            window.append(patient.patient_id)
+
+        # 화면에서 빠진 행 삭제
+        removed = [pid for pid in self._shown if pid not in values]
+        if removed:
+            self.tree.delete(*removed)
+        current = [pid for pid in self._shown if pid in values]
+
+        # 새 행 삽입, 값이 바뀐 행 수정, 순서가 바뀐 행 이동
+        for index, pid in enumerate(window):
+            old = self._values.get(pid)
+            if old is None:
+                self.tree.insert("", index, iid=pid, values=values[pid])
+                current.insert(index, pid)
+                continue
+            if old != values[pid]:
+                self.tree.item(pid, values=values[pid])
+            if current[index] != pid:
+                self.tree.move(pid, "", index)
+                current.remove(pid)
+                current.insert(index, pid)
+
+        self._shown = window
+        self._values = values
+
+        if self._selected in values and self._selected not in self.tree.selection():
+            self.tree.selection_set(self._selected)
+
+        if total:
+            self.scrollbar.set(self.offset / total, end / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    # ==================== 이벤트 ====================
+
+    def _on_configure(self, event):
+        """창 크기가 바뀌면 보이는 행 수를 다시 계산 (그려진 첫 행으로 제목 높이/행 높이 측정)"""
+        header = self.row_height
+        if self._shown:
+            bbox = self.tree.bbox(self._shown[0])
+            if bbox:
+                header, self.row_height = bbox[1], bbox[3]
+        visible = max(1, (event.height - header) // self.row_height)
+        if visible != self.visible:
+            self.visible = visible
+            self._render()
+
+    def _on_select(self, event):
+        """선택 변경 기록 (화면에서 벗어나 삭제된 행의 선택은 유지)"""
+        selection = self.tree.selection()
+        if selection:
+            self._selected = selection[0]
+        elif self._selected in self._values:
+            self._selected = None
+
+    def _on_wheel(self, event):
+        """마우스 휠 (Windows/macOS)"""
+        return self.scroll(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+
+    def _on_arrow(self, step):
+        """위/아래 화살표: 화면 끝 행에서 누르면 한 행 스크롤하고 다음 행 선택"""
+        focus = self.tree.focus()
+        if not self._shown or focus != (self._shown[0] if step < 0 else self._shown[-1]):
+            return None   # Treeview 기본 동작 (화면 안에서 이동)
+        self.scroll(step)
+        target = self._shown[0] if step < 0 else self._shown[-1]
+        if target != focus:
+            self.tree.focus(target)
+            self.tree.selection_set(target)
+        return "break"
@@ -0,0 +1,93 @@
+"""
+test_patient_journal.py
+저널 저장 모드 테스트 (백그라운드 압축 중 저장, 압축 기준)
+
+실행: (patient_project 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+데이터 출처: Kaggle - Healthcare Dataset
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from patient_manager import PatientManager
+
+
+PATIENT = {
+    "name": "홍길동", "age": 45, "gender": "Male", "blood_type": "A+",
+    "medical_condition": "Asthma", "doctor": "김의사", "hospital": "서울병원",
+    "insurance_provider": "", "billing_amount": 1000, "room_number": 101,
+    "admission_type": "Elective", "medication": "", "test_results": "Normal"
+}
+
+
+class JournalTest(unittest.TestCase):
+    """압축이 섞여도 다시 로드한 결과가 메모리 상태와 같은지"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="journal_test_")
+        self.file_path = os.path.join(self.work_dir, "patients.csv")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def open_manager(self, compact_bytes):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return PatientManager(self.file_path, backend="journal", compact_bytes=compact_bytes)
+
+    def assert_reloads_same(self, manager):
+        manager.close()
+        reloaded = self.open_manager(manager.journal.compact_bytes)
+        self.assertEqual([p.to_dict() for p in reloaded.patients],
+                         [p.to_dict() for p in manager.patients])
+        reloaded.close()
+        leftovers = [name for name in os.listdir(self.work_dir) if name.endswith(".tmp")]
+        self.assertEqual(leftovers, [])
+
+    def test_writes_during_compaction(self):
+        manager = self.open_manager(compact_bytes=1)
+        ids = []
+        for i in range(200):
+            ok, patient_id = manager.create(dict(PATIENT, billing_amount=i))
+            self.assertTrue(ok)
+            ids.append(patient_id)
+            if i % 3 == 0:
+                self.assertTrue(manager.update(ids[i // 2], {"doctor": f"의사{i}"})[0])
+            if i % 7 == 0:
+                self.assertTrue(manager.delete(ids.pop(0))[0])
+        self.assert_reloads_same(manager)
+
+    def test_full_save_during_compaction(self):
+        manager = self.open_manager(compact_bytes=1)
+        for i in range(50):
+            manager.create(dict(PATIENT, billing_amount=i))
+            if i % 10 == 0:
+                self.assertTrue(manager.save_to_file())
+        self.assert_reloads_same(manager)
+
+    def test_threshold_scales_with_snapshot(self):
+        manager = self.open_manager(compact_bytes=1)
+        for i in range(100):
+            manager.create(dict(PATIENT, billing_amount=i))
+        self.assertTrue(manager.save_to_file())
+        snapshot_size = os.path.getsize(self.file_path)
+
+        # 로그가 스냅샷 크기의 절반이 되기 전에는 압축하지 않음
+        manager.update(manager.patients[0].patient_id, {"doctor": "이의사"})
+        manager.journal.wait()
+        self.assertGreater(manager.journal.log_size(), 0)
+        self.assertEqual(os.path.getsize(self.file_path), snapshot_size)
+        self.assert_reloads_same(manager)
+
+
+if __name__ == "__main__":
+    unittest.main()
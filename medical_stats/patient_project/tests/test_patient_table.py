@@ -0,0 +1,182 @@
+"""
+test_patient_table.py
+열 저장 테이블(PatientTable, columnar=True) 테스트 (행 보기가 Patient처럼 동작하는지)
+
+실행: (patient_project 폴더에서) python -m pytest tests
+
+Author: KDT12 Python Project
+Date: 2026-01-09
+데이터 출처: Kaggle - Healthcare Dataset
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from patient import Patient
+from patient_manager import PatientManager
+from patient_table import PatientRow, PatientTable
+from storage_tool import synthetic_rows, write_csv
+
+
+def make_patients(count, seed=0):
+    """가상 환자 Patient 리스트"""
+    return [Patient.from_dict(row) for row in synthetic_rows(count, seed=seed)]
+
+
+class PatientRowTest(unittest.TestCase):
+    """행 보기의 값과 메서드가 원래 Patient와 같은지"""
+
+    def setUp(self):
+        self.patients = make_patients(50)
+        self.table = PatientTable(self.patients)
+
+    def test_rows_match_patients(self):
+        self.assertEqual(len(self.table), len(self.patients))
+        for row, patient in zip(self.table, self.patients):
+            self.assertIsInstance(row, PatientRow)
+            self.assertEqual(row.to_dict(), patient.to_dict())
+            self.assertEqual(row.validate(), patient.validate())
+            self.assertEqual(row.get_gender_korean(), patient.get_gender_korean())
+            self.assertEqual(row.get_condition_korean(), patient.get_condition_korean())
+            self.assertEqual(row.get_age_group(), patient.get_age_group())
+            self.assertEqual(row.is_hospitalized(), patient.is_hospitalized())
+            self.assertEqual(row.get_display_info(), patient.get_display_info())
+        self.assertEqual(PatientRow.VALID_GENDERS, Patient.VALID_GENDERS)
+
+    def test_attribute_updates_columns(self):
+        row = self.table[3]
+        row.name = "수정환자"
+        row.age = 77
+        row.medical_condition = "새진단"
+        self.assertEqual(self.table[3].name, "수정환자")
+        self.assertEqual(self.table.get(row._slot, "age"), 77)
+        self.assertEqual(self.table.count_value("medical_condition", "새진단"), 1)
+        with self.assertRaises(TypeError):
+            row.age = "많음"
+        self.assertEqual(row.age, 77)
+
+    def test_many_categories(self):
+        # 범주가 256개를 넘으면 4바이트 코드로 바뀌어도 값은 그대로
+        table = PatientTable()
+        for i, patient in enumerate(make_patients(300, seed=1)):
+            patient.doctor = f"의사{i}"
+            table.append(patient)
+        self.assertEqual([row.doctor for row in table], [f"의사{i}" for i in range(300)])
+        self.assertEqual(table.count_value("doctor", "의사299"), 1)
+        self.assertEqual(len(table.value_counts("doctor")), 300)
+
+
+class ListCompatTest(unittest.TestCase):
+    """list와 같은 순서/동작 (append, insert, index, remove, pop, 인덱싱, 전체 교체)"""
+
+    def setUp(self):
+        self.patients = make_patients(20, seed=2)
+        self.table = PatientTable(self.patients[:10])
+        self.expected = list(self.patients[:10])
+
+    def assertSameOrder(self):
+        self.assertEqual([row.patient_id for row in self.table], [p.patient_id for p in self.expected])
+
+    def test_list_operations(self):
+        self.table.insert(2, self.patients[10])
+        self.expected.insert(2, self.patients[10])
+        self.table.append(self.patients[11])
+        self.expected.append(self.patients[11])
+        self.assertSameOrder()
+
+        row = self.table[5]
+        self.assertEqual(self.table.index(row), 5)
+        self.table.remove(row)
+        self.expected.pop(5)
+        self.assertSameOrder()
+        # 삭제 직후에도 값을 읽을 수 있고, 다시 넣으면 같은 행을 되살림
+        self.assertEqual(row.patient_id, self.patients[4].patient_id)
+        with self.assertRaises(ValueError):
+            self.table.index(row)
+        self.table.append(row)
+        self.expected.append(self.patients[4])
+        self.assertSameOrder()
+        with self.assertRaises(ValueError):
+            self.table.append(row)
+
+        popped = self.table.pop(0)
+        self.assertEqual(popped.patient_id, self.expected.pop(0).patient_id)
+        del self.table[1:3]
+        del self.expected[1:3]
+        self.assertSameOrder()
+        self.assertEqual([r.patient_id for r in self.table[1:4]], [p.patient_id for p in self.expected[1:4]])
+        with self.assertRaises(ValueError):
+            self.table.remove(self.patients[0])
+
+    def test_setitem(self):
+        self.table[0] = self.patients[15]
+        self.assertEqual(self.table[0].to_dict(), self.patients[15].to_dict())
+
+        kept = self.table[3]
+        self.table[:] = [kept, self.patients[16]]
+        self.assertEqual([row.patient_id for row in self.table],
+                         [self.patients[3].patient_id, self.patients[16].patient_id])
+        self.assertEqual(self.table[0]._slot, kept._slot)
+        self.assertEqual(self.table.statistics(), PatientTable([self.patients[3], self.patients[16]]).statistics())
+        with self.assertRaises(TypeError):
+            self.table[0:1] = []
+
+    def test_failed_append_adds_nothing(self):
+        patient = make_patients(1, seed=3)[0]
+        patient.billing_amount = "abc"
+        with self.assertRaises(TypeError):
+            self.table.append(patient)
+        self.assertSameOrder()
+        self.assertEqual(len(self.table._columns["patient_id"]), 10)
+        self.assertEqual(len(self.table._columns["billing_amount"]), 10)
+
+
+class ManagerTest(unittest.TestCase):
+    """columnar=True 관리자가 리스트 관리자와 같은 결과를 내는지"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="patient_table_test_")
+        self.managers = {}
+        for columnar in (False, True):
+            # 관리자마다 같은 내용의 CSV 파일 사용 (저장이 서로 섞이지 않게)
+            file_path = os.path.join(self.work_dir, f"patients_{columnar}.csv")
+            write_csv(file_path, synthetic_rows(500, seed=4))
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.managers[columnar] = PatientManager(file_path, columnar=columnar)
+
+    def tearDown(self):
+        for manager in self.managers.values():
+            manager.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def results(self, manager):
+        return ([p.to_dict() for p in manager.read_all()],
+                [p.patient_id for p in manager.search("name", "a")],
+                manager.get_statistics(), manager.compute_statistics())
+
+    def test_same_results_as_list(self):
+        plain, columnar = self.managers[False], self.managers[True]
+        self.assertIsInstance(columnar.patients, PatientTable)
+        self.assertEqual(self.results(columnar), self.results(plain))
+
+        # CRUD 후에도 통계(증분/전체 계산)가 리스트 관리자와 같음
+        for manager in (plain, columnar):
+            data = dict(manager.read_by_id("P007").to_dict(), name="새환자")
+            self.assertTrue(manager.create(data)[0])
+            self.assertTrue(manager.update("P010", {"medical_condition": "Flu", "age": 9,
+                                                    "discharge_date": ""})[0])
+            self.assertTrue(manager.delete("P020")[0])
+        self.assertEqual(self.results(columnar), self.results(plain))
+        self.assertEqual(columnar.read_by_id("P010").medical_condition, "Flu")
+        self.assertIsNone(columnar.read_by_id("P020"))
+
+
+if __name__ == "__main__":
+    unittest.main()